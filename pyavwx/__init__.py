@@ -1,2 +1,18 @@
 from pyavwx.avwx_client import AvwxApiClient
+from pyavwx.avwx_async_client import AsyncAvwxApiClient
+from pyavwx.avwx_cache import ResponseCache
+from pyavwx.avwx_profiler import AccessProfiler
+from pyavwx.avwx_protocol import ApiRequest, ApiResponse, build_request, parse_response
+from pyavwx.avwx_rate_limiter import RateLimiter
+from pyavwx.avwx_resilience import CircuitBreaker, RetryPolicy, deadline
+from pyavwx.avwx_station_cache import StationCache
+from pyavwx.avwx_station_index import StationIndex
+from pyavwx.avwx_station_search import StationSearch
+from pyavwx.avwx_transport import (
+    AiohttpTransport,
+    AsyncFakeTransport,
+    FakeTransport,
+    RequestsTransport,
+)
+from pyavwx.avwx_watcher import AsyncStationWatcher, StationWatcher
 from pyavwx.models import metar, taf, structs
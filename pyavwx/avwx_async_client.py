@@ -0,0 +1,1603 @@
+import asyncio
+from collections import deque
+from dataclasses import replace
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable
+
+from pyavwx.avwx_authentication import AvwxApiAuth, format_auth_header
+from pyavwx.avwx_cache import ResponseCache
+from pyavwx.avwx_client import PARSE_REPORT_TYPES, chunk_locations
+from pyavwx.avwx_exceptions import AvwxCircuitOpen, AvwxRateLimited
+from pyavwx.avwx_profiler import AccessProfiler
+from pyavwx.avwx_protocol import (
+    MULTI_REPORT_MODELS,
+    ROUTE_REPORT_MODELS,
+    ApiRequest,
+    build_request,
+    parse_payload,
+    read_payload,
+)
+from pyavwx.avwx_rate_limiter import RateLimiter
+from pyavwx.avwx_requests_manager import (
+    makeAsyncRequest,
+    create_async_session,
+    get_json_decoder,
+    streamAsyncRequest,
+)
+from pyavwx.avwx_resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    is_transient,
+    request_timeout,
+)
+from pyavwx.avwx_single_flight import AsyncSingleFlight
+from pyavwx.avwx_station_cache import StationCache
+from pyavwx.avwx_station_index import StationIndex, parse_coords
+from pyavwx.avwx_station_search import StationSearch
+from pyavwx.avwx_stream import aiter_json_array
+from pyavwx.avwx_transport import AsyncTransport
+from pyavwx.const import BASE_URL
+from pyavwx.models import (
+    Metar,
+    Taf,
+    Pirep,
+    Station,
+    NearStation,
+    StationRoute,
+    Summary,
+    AirSigmet,
+    Notam,
+    Nbm,
+    Gfs,
+    ReportsRoute,
+)
+from pyavwx.models.projection import project
+from pyavwx.models.utils import decode
+
+
+async def _aiter(iterable: Iterable):
+    for item in iterable:
+        yield item
+
+
+class AsyncAvwxApiClient:
+    def __init__(
+        self,
+        api_key,
+        pool_maxsize: int = 100,
+        pool_maxsize_per_host: int = 0,
+        keep_alive: bool = True,
+        keepalive_timeout: float = 15,
+        cache: ResponseCache = None,
+        station_cache: StationCache = None,
+        lazy: bool = False,
+        json_decoder: str | Callable = "auto",
+        station_index: StationIndex = None,
+        station_search: StationSearch = None,
+        coalesce: bool = True,
+        rate_limiter: RateLimiter = None,
+        timeout: float = 30,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        profiler: AccessProfiler = None,
+        transport: AsyncTransport = None,
+    ):
+        """Asyncio client for the avwx.rest API.
+
+        Same methods as ``AvwxApiClient`` returning the same models, but awaitable.
+        Every coroutine shares one ``aiohttp`` connection pool, opened on the first request.
+        Use it as an async context manager or call ``close`` once done.
+
+        :param api_key: avwx.rest API key
+        :type api_key: str
+        :param pool_maxsize: Maximum number of simultaneous connections, defaults to 100
+        :type pool_maxsize: int, optional
+        :param pool_maxsize_per_host: Maximum number of simultaneous connections per host, 0 means no limit, defaults to 0
+        :type pool_maxsize_per_host: int, optional
+        :param keep_alive: Keep connections open between requests, defaults to True
+        :type keep_alive: bool, optional
+        :param keepalive_timeout: Seconds an idle connection is kept open, defaults to 15
+        :type keepalive_timeout: float, optional
+        :param cache: Cache responses in memory, defaults to None
+        :type cache: ResponseCache, optional
+        :param station_cache: Persist station lookups on disk, read and written in a worker thread, defaults to None
+        :type station_cache: StationCache, optional
+        :param lazy: Return models building their nested dataclasses on first access, defaults to False
+        :type lazy: bool, optional
+        :param json_decoder: Parser of the response bytes: ``"json"``, ``"orjson"``, ``"msgspec"``, a callable,
+            or ``"auto"`` for the fastest installed one, defaults to "auto"
+        :type json_decoder: str | Callable, optional
+        :param station_index: Answer nearest-station queries locally when the index holds stations, defaults to None
+        :type station_index: StationIndex, optional
+        :param station_search: Answer station text searches locally when the index holds stations, defaults to None
+        :type station_search: StationSearch, optional
+        :param coalesce: Send a single request when identical ones are already in flight, every caller getting its result, defaults to True
+        :type coalesce: bool, optional
+        :param rate_limiter: Queue requests over the rate limits of the API key and retry those answered with a 429, defaults to None
+        :type rate_limiter: RateLimiter, optional
+        :param timeout: Seconds to wait for a response, shortened inside a ``deadline`` block, ``None`` to wait forever, defaults to 30
+        :type timeout: float, optional
+        :param retry: Retry GET requests failing with a timeout, a connection error or a 5xx status, defaults to None
+        :type retry: RetryPolicy, optional
+        :param circuit_breaker: Fail fast, or serve stale cached responses, while the API keeps failing, defaults to None
+        :type circuit_breaker: CircuitBreaker, optional
+        :param profiler: Learn the fields read on the returned METAR, TAF, summary, NBM and GFS reports and only request those, defaults to None
+        :type profiler: AccessProfiler, optional
+        :param transport: Send the requests with this transport instead of the pooled session, each with the API key
+            in its ``headers``. Closed with the client, defaults to None
+        :type transport: AsyncTransport, optional
+        """
+        self.auth = AvwxApiAuth(api_key)
+        # Transports send the headers of each request, the API key goes with them
+        self._headers = format_auth_header(api_key)
+        self.session = None
+        self.cache = cache
+        self.station_cache = station_cache
+        self.lazy = lazy
+        self.decoder = get_json_decoder(json_decoder)
+        self.station_index = station_index
+        self.station_search = station_search
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.profiler = profiler
+        self.transport = transport
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self._session_options = {
+            "pool_maxsize": pool_maxsize,
+            "pool_maxsize_per_host": pool_maxsize_per_host,
+            "keep_alive": keep_alive,
+            "keepalive_timeout": keepalive_timeout,
+        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """Close every pooled connection of the client, and its transport."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.transport is not None:
+            await self.transport.close()
+
+    def _decode(self, model: type, payload: dict):
+        return decode(model, payload, lazy=self.lazy)
+
+    def _profile(self, endpoint: str, model: type, filter: str = None) -> tuple:
+        # Only calls asking for whole reports are profiled, not those given a ``filter`` or ``fields``.
+        # Returns the ``filter`` to send and the ``ProfiledCall`` decoding the response, if any.
+        if self.profiler is None or filter:
+            return filter, None
+        call = self.profiler.start(endpoint, model)
+        return call.filter, call
+
+    async def _exchange(self, request: ApiRequest, timeout: float) -> tuple:
+        # A single attempt, through the transport when one is plugged in
+        if self.transport is not None:
+            response = await self.transport.send(replace(request, headers=self._headers), timeout)
+            return response, read_payload(response, self.decoder)
+        # The aiohttp session has to be created inside the running event loop.
+        if self.session is None:
+            self.session = create_async_session(auth=self.auth, **self._session_options)
+        return await makeAsyncRequest(
+            url=request.url,
+            session=self.session,
+            data=request.data,
+            rjson=True,
+            method=request.method,
+            decoder=self.decoder,
+            timeout=timeout,
+        )
+
+    async def _send(self, request: ApiRequest) -> tuple:
+        throttled = retries = 0
+        breaker = self.circuit_breaker
+        while True:
+            timeout = request_timeout(self.timeout)
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                r = await self._exchange(request, timeout)
+            except Exception as e:
+                if breaker is not None:
+                    # Errors of the request itself still mean the API answered.
+                    breaker.record(not is_transient(e))
+                if isinstance(e, AvwxRateLimited) and self.rate_limiter is not None:
+                    if throttled >= self.rate_limiter.max_retries:
+                        raise
+                    # Every caller waits for the API to accept requests again.
+                    self.rate_limiter.throttle(e.retry_after)
+                    throttled += 1
+                    continue
+                delay = self.retry.delay(request.method, retries, e) if self.retry else None
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                retries += 1
+                continue
+            except BaseException:
+                # Cancelled or interrupted: no outcome to record, a half-open trial is given back.
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                breaker.record(True)
+            return r
+
+    async def _request(self, request: ApiRequest, station_lookup: bool = False) -> tuple:
+        url, data, method = request.url, request.data, request.method
+        # Station lookups are first served from the persistent station cache.
+        # Its SQLite calls run in a worker thread, off the event loop.
+        persist = station_lookup and self.station_cache is not None
+        if persist:
+            payload = await asyncio.to_thread(self.station_cache.get, url)
+            if payload is not None:
+                return None, payload
+        if self.cache is not None:
+            key = self.cache.make_key(method, url, data)
+            payload = self.cache.get(key)
+            if payload is not None:
+                return None, payload
+
+        async def fetch():
+            r = await self._send(request)
+            if self.cache is not None:
+                self.cache.set(key, url.removeprefix(BASE_URL), r[1])
+            if self.station_cache is not None:
+                await asyncio.to_thread(self.station_cache.observe, r[1])
+                if persist:
+                    await asyncio.to_thread(self.station_cache.set, url, r[1])
+            return r
+
+        try:
+            if self.single_flight is None:
+                return await fetch()
+            # Concurrent callers of the same request wait for the one in flight, up to their own deadline.
+            return await self.single_flight.do((method, url, data), fetch, timeout=request_timeout())
+        except AvwxCircuitOpen:
+            if self.cache is None or not self.circuit_breaker.serve_stale:
+                raise
+            payload = self.cache.get_stale(key)
+            if payload is None:
+                raise
+            return None, payload
+
+    async def _stream(self, request: ApiRequest, key: str = None) -> AsyncIterator:
+        # Elements of a list response, parsed while the response streams in.
+        # Streams are served from the response cache, but neither cached, coalesced nor retried.
+        url = request.url
+        if self.cache is not None:
+            payload = self.cache.get(self.cache.make_key("GET", url, None))
+            if payload is not None:
+                for element in payload if key is None else payload.get(key) or ():
+                    yield element
+                return
+        timeout = request_timeout(self.timeout)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        if self.transport is not None:
+            # Transports hand out whole bodies
+            payload = (await self._exchange(request, timeout))[1]
+            for element in payload if key is None else payload.get(key) or ():
+                yield element
+            return
+        if self.session is None:
+            self.session = create_async_session(auth=self.auth, **self._session_options)
+        chunks = streamAsyncRequest(
+            url=url,
+            session=self.session,
+            decoder=self.decoder,
+            timeout=timeout,
+        )
+        async for element in aiter_json_array(chunks, key):
+            yield element
+
+    async def get_station(
+        self,
+        ident: str,
+        remove: str = None,
+        filter: str = None,
+        fields: Iterable = None,
+        url_modifier: str = "station/",
+    ) -> Station:
+        """Get station information for an airfield or other location by ICAO ident.
+
+        :param ident: ICAO & IATA station code
+        :type ident: str
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include these keys in the response, defaults to None
+        :type filter: str, optional
+        :param fields: Only keep these fields, e.g. ``[Station.name, Station.latitude]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
+        :return: Info for requested ``ident``
+        :rtype: Station | StationProjection
+        """
+        model, filter = project(Station, fields, filter)
+        request = build_request(
+            "station",
+            url_modifier=url_modifier,
+            model=model,
+            ident=ident,
+            remove=remove,
+            filter=filter,
+        )
+
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request, station_lookup=True)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_near_stations(
+        self,
+        coords: str,
+        n: int = None,
+        airport: bool = True,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "station/near/",
+    ) -> list[NearStation]:
+        """Get the nearest stations to a coordinate pair.
+
+        :param coords: Coordinate pair Example: 28.1,-81.
+        :type coords: str
+        :param n: Number of stations to return, defaults to 10
+        :type n: int, optional
+        :param airport: Only include airports, defaults to True
+        :type airport: bool, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include these keys in the response, defaults to None
+        :type filter: str, optional
+        :return: Nearest Stations
+        :rtype: list[NearStation]
+        """
+        # The local index doesn't apply ``remove`` and ``filter``, stations come back whole.
+        if self.station_index:
+            lat, lon = parse_coords(coords)
+            return self.station_index.nearest(
+                lat, lon, n=10 if n is None else n, airport=airport
+            )
+        request = build_request(
+            "near_stations",
+            url_modifier=url_modifier,
+            coords=coords,
+            n=n,
+            airport=airport,
+            remove=remove,
+            filter=filter,
+        )
+
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request, station_lookup=True)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def iter_near_stations(
+        self,
+        coords: str,
+        n: int = None,
+        airport: bool = True,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "station/near/",
+    ) -> AsyncIterator[NearStation]:
+        """Like ``get_near_stations``, yielding each station as soon as it is parsed from the streamed response.
+
+        :param coords: Coordinate pair Example: 28.1,-81.
+        :type coords: str
+        :param n: Number of stations to return, defaults to 10
+        :type n: int, optional
+        :param airport: Only include airports, defaults to True
+        :type airport: bool, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include these keys in the response, defaults to None
+        :type filter: str, optional
+        :return: An async generator of the nearest stations
+        :rtype: AsyncIterator[NearStation]
+        """
+        if self.station_index:
+            lat, lon = parse_coords(coords)
+            for station in self.station_index.nearest(
+                lat, lon, n=10 if n is None else n, airport=airport
+            ):
+                yield station
+            return
+        request = build_request(
+            "near_stations",
+            url_modifier=url_modifier,
+            coords=coords,
+            n=n,
+            airport=airport,
+            remove=remove,
+            filter=filter,
+        )
+        async for element in self._stream(request):
+            yield self._decode(request.model, element)
+
+    async def get_stations_text(
+        self,
+        text: str,
+        n: int = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "search/station",
+    ) -> list[Station]:
+        """Text search for stations by ICAO, IATA, name, city, and state
+
+        :param text: Search text
+        :type text: str
+        :param n: Max results to return, defaults to ``10``
+        :type n: int, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :return: Stations that match the requested ``text``
+        :rtype: list[Station]
+        """
+        # The local search doesn't apply ``remove`` and ``filter``, stations come back whole.
+        if self.station_search:
+            return self.station_search.search(text, n=10 if n is None else n)
+        request = build_request(
+            "stations_text",
+            url_modifier=url_modifier,
+            text=text,
+            n=n,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request, station_lookup=True)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def iter_stations_text(
+        self,
+        text: str,
+        n: int = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "search/station",
+    ) -> AsyncIterator[Station]:
+        """Like ``get_stations_text``, yielding each station as soon as it is parsed from the streamed response.
+
+        :param text: Search text
+        :type text: str
+        :param n: Max results to return, defaults to ``10``
+        :type n: int, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :return: An async generator of the stations that match the requested ``text``
+        :rtype: AsyncIterator[Station]
+        """
+        if self.station_search:
+            for station in self.station_search.search(text, n=10 if n is None else n):
+                yield station
+            return
+        request = build_request(
+            "stations_text",
+            url_modifier=url_modifier,
+            text=text,
+            n=n,
+            remove=remove,
+            filter=filter,
+        )
+        async for element in self._stream(request):
+            yield self._decode(request.model, element)
+
+    async def get_stations_route(
+        self,
+        route: str,
+        distance: int,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "path/station",
+    ) -> StationRoute:
+        """Get reporting stations along a flight path.
+
+        :param route: Flight route with ICAO, navaid, and coordinate, separated by a ``;``
+        :type route: str
+        :param distance: Distance in nautical miles from ``route` centerline
+        :type distance: int
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :return: Stations around the given ``route``
+        :rtype: StationRoute
+        """
+        # Routes with navaids or stations missing from the local index are left to the API.
+        if self.station_index:
+            try:
+                return self.station_index.route(route, distance)
+            except ValueError:
+                pass
+        request = build_request(
+            "stations_route",
+            url_modifier=url_modifier,
+            route=route,
+            distance=distance,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_summary(
+        self,
+        location: str,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        fields: Iterable = None,
+        url_modifier: str = "summary/",
+    ) -> Summary:
+        """Get the current and forecasted flight conditions for a specific station by ICAO & IATA station code or a coordinate pair.
+
+        :param location: ICAO & IATA station code or coordinate pair.
+        :type location: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Summary.flight_rules]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
+        :return: Summary for the requested ``ident``
+        :rtype: Summary | SummaryProjection
+        """
+        model, filter = project(Summary, fields, filter)
+        filter, call = self._profile("summary", model, filter)
+        request = build_request(
+            "summary",
+            url_modifier=url_modifier,
+            model=model,
+            location=location,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_metar(
+        self,
+        location: str,
+        options: str = None,
+        airport: bool = True,
+        reporting: bool = True,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        fields: Iterable = None,
+        url_modifier: str = "metar/",
+    ) -> Metar:
+        """Get a METAR report for an airfield or other location by ICAO, IATA ident or coordinates.
+
+        :param location: ICAO & IATA station code or coordinate pair.
+        :type location: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param airport: Only include airports, defaults to True
+        :type airport: bool, optional
+        :param reporting: Only include reporting stations when performing a coordinate search, defaults to True
+        :type reporting: bool, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Metar.flight_rules, Metar.wind_speed]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
+        :return: Metar for the requested ``ident``
+        :rtype: Metar | MetarProjection
+        """
+        model, filter = project(Metar, fields, filter)
+        filter, call = self._profile("metar", model, filter)
+        request = build_request(
+            "metar",
+            url_modifier=url_modifier,
+            model=model,
+            location=location,
+            options=options,
+            airport=airport,
+            reporting=reporting,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def parse_metar(
+        self,
+        metar: str,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        fields: Iterable = None,
+        url_modifier: str = "parse/metar",
+    ) -> Metar:
+        """Parse a METAR report
+
+        :param metar: METAR report to parse
+        :type metar: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param fields: Only keep these fields, e.g. ``[Metar.flight_rules, Metar.wind_speed]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
+        :return: Parsed Metar for the given ``metar``
+        :rtype: Metar | MetarProjection
+        """
+        model, filter = project(Metar, fields, filter)
+        request = build_request(
+            "parse_metar",
+            url_modifier=url_modifier,
+            data=metar,
+            model=model,
+            options=options,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_multiple_reports(
+        self,
+        report_type: str,
+        locations: str,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        fields: Iterable = None,
+        url_modifier: str = "multi/",
+    ) -> list[Metar | Taf | Summary]:
+        """Get for multiple stations a given report type
+
+        :param report_type: Weather report type (``summary``,``metar``,``taf``)
+        :type report_type: str
+        :param locations: Comma-separated string of up to 10 ICAO & IATA station codes
+        :type locations: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Metar.flight_rules, Metar.wind_speed]``, sent as ``filter``.
+            ``station`` is always kept to match reports to locations, defaults to None
+        :type fields: Iterable, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: One report per requested location, ``None`` when a location has no report
+        :rtype: list[Metar | Taf | Summary]
+        """
+        if report_type not in MULTI_REPORT_MODELS:
+            raise ValueError(f"Unknown report type : {report_type}")
+        model, filter = project(
+            MULTI_REPORT_MODELS[report_type], fields, filter, required=("station",)
+        )
+        request = build_request(
+            "multi",
+            url_modifier=url_modifier,
+            model=model,
+            report_type=report_type,
+            locations=locations,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        reports = parse_payload(request, r[1], self.lazy)
+        return [
+            None if isinstance(report, Exception) else report
+            for report in reports.values()
+        ]
+
+    async def get_bulk_reports(
+        self,
+        report_type: str,
+        locations: Iterable[str],
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        max_workers: int = 8,
+        fields: Iterable = None,
+    ) -> dict[str, Metar | Taf | Summary | Exception]:
+        """Get a given report type for any number of stations.
+
+        ``locations`` is split in chunks of 10 stations, each chunk being one ``multi/`` call.
+        Chunks are fetched concurrently. A station that could not be fetched maps to the exception
+        explaining why instead of a report, so one bad station never fails the whole batch.
+
+        :param report_type: Weather report type (``summary``,``metar``,``taf``)
+        :type report_type: str
+        :param locations: ICAO & IATA station codes
+        :type locations: Iterable[str]
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :param max_workers: Maximum number of chunks fetched at the same time, defaults to 8
+        :type max_workers: int, optional
+        :param fields: Only keep these fields, e.g. ``[Metar.flight_rules, Metar.wind_speed]``, sent as ``filter``.
+            ``station`` is always kept to match reports to locations, defaults to None
+        :type fields: Iterable, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: Report, or the exception that kept it from being fetched (``AvwxReportError``, ``AvwxBadStatus``,
+            ``AvwxTimeout``, a connection or decoding error...), keyed by requested location
+        :rtype: dict[str, Metar | Taf | Summary | Exception]
+        """
+        if report_type not in MULTI_REPORT_MODELS:
+            raise ValueError(f"Unknown report type : {report_type}")
+        model, filter = project(
+            MULTI_REPORT_MODELS[report_type], fields, filter, required=("station",)
+        )
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(chunk: list[str]) -> dict:
+            async with semaphore:
+                return await self._fetch_multi_chunk(
+                    report_type, chunk, options, remove, filter, onfail, model
+                )
+
+        results = {}
+        chunks = chunk_locations(locations)
+        for chunk_result in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+            results.update(chunk_result)
+        return results
+
+    async def _fetch_multi_chunk(
+        self,
+        report_type: str,
+        chunk: list[str],
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        model: type = None,
+        url_modifier: str = "multi/",
+    ) -> dict:
+        request = build_request(
+            "multi",
+            url_modifier=url_modifier,
+            model=model,
+            report_type=report_type,
+            locations=",".join(chunk),
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        try:
+            r = await self._request(request)
+            return parse_payload(request, r[1], self.lazy)
+        except Exception as e:
+            # Any failure, from the transport to the decoding, only fails the stations of this chunk.
+            return {location: e for location in chunk}
+
+    async def get_nearest_reports(
+        self,
+        report_type: str,
+        coords: str,
+        n: int = None,
+        options: str = None,
+        airport: bool = True,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        url_modifier: str = "near/",
+    ) -> Metar | Taf:
+        """Get the nearest weather reports to a coordinate pair
+
+        :param report_type: Weather report type (``metar``,``taf``)
+        :type report_type: str
+        :param coords: Coordinate pair Example: 28.1,-81.
+        :type coords: str
+        :param n: Max results to return, defaults to ``10``
+        :type n: int, optional
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param airport: Only include airports, defaults to True
+        :type airport: bool, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: Returns ``Metar`` or ``Taf`` depending on the chosen report type
+        :rtype: Metar | Taf
+        """
+        request = build_request(
+            "near_reports",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            coords=coords,
+            n=n,
+            options=options,
+            airport=airport,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_reports_text(
+        self,
+        report_type: str,
+        text: str,
+        n: int = None,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "search/",
+    ) -> list[Metar] | list[Taf]:
+        """Get weather reports by searching for stations by ICAO, IATA, name, city, and state.
+
+        :param report_type: Weather report type (``metar``,``taf``)
+        :type report_type: str
+        :param text: Search text
+        :type text: str
+        :param n: Max results to return, defaults to ``10``
+        :type n: int, optional
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: Returns a list of ``Metar`` or ``Taf`` depending on the chosen report type
+        :rtype: list[Metar] | list[Taf]
+        """
+        request = build_request(
+            "reports_text",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            text=text,
+            n=n,
+            options=options,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def iter_reports_text(
+        self,
+        report_type: str,
+        text: str,
+        n: int = None,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "search/",
+    ) -> AsyncIterator[Metar | Taf]:
+        """Like ``get_reports_text``, yielding each report as soon as it is parsed from the streamed response.
+
+        :param report_type: Weather report type (``metar``,``taf``)
+        :type report_type: str
+        :param text: Search text
+        :type text: str
+        :param n: Max results to return, defaults to ``10``
+        :type n: int, optional
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: An async generator of ``Metar`` or ``Taf`` depending on the chosen report type
+        :rtype: AsyncIterator[Metar | Taf]
+        """
+        if report_type not in ("metar", "taf"):
+            raise ValueError(f"Unknown report type : {report_type}")
+        model = ROUTE_REPORT_MODELS[report_type]
+        request = build_request(
+            "reports_text",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            text=text,
+            n=n,
+            options=options,
+            remove=remove,
+            filter=filter,
+        )
+        async for element in self._stream(request):
+            yield self._decode(model, element)
+
+    async def get_reports_route(
+        self,
+        report_type: str,
+        route: str,
+        distance: int,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        url_modifier: str = "path/",
+    ) -> ReportsRoute:
+        """Get weather reports along a flight path.
+
+        :param report_type: Weather report type (``metar``,``taf``,``airsigmet``,``notam``)
+        :type report_type: str
+        :param route: Flight route with ICAO, navaid, and coordinate, separated by a ``;``
+        :type route: str
+        :param distance: Distance in nautical miles from ``route`` centerline
+        :type distance: int
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :return: Returns a ReportsRoute containing route info and list of report in the chosen type.
+        :rtype: ReportsRoute
+        """
+        request = build_request(
+            "reports_route",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            route=route,
+            distance=distance,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def iter_reports_route(
+        self,
+        report_type: str,
+        route: str,
+        distance: int,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        url_modifier: str = "path/",
+    ) -> AsyncIterator[Metar | Taf | AirSigmet | Notam]:
+        """Like ``get_reports_route``, yielding each report as soon as it is parsed from the streamed response.
+
+        Only the ``results`` of the route are yielded, its ``meta`` and ``route`` are skipped.
+
+        :param report_type: Weather report type (``metar``,``taf``,``airsigmet``,``notam``)
+        :type report_type: str
+        :param route: Flight route with ICAO, navaid, and coordinate, separated by a ``;``
+        :type route: str
+        :param distance: Distance in nautical miles from ``route`` centerline
+        :type distance: int
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: An async generator of the reports along the route, in the chosen type
+        :rtype: AsyncIterator[Metar | Taf | AirSigmet | Notam]
+        """
+        if report_type not in ROUTE_REPORT_MODELS:
+            raise ValueError(f"Unknown report type : {report_type}")
+        model = ROUTE_REPORT_MODELS[report_type]
+        request = build_request(
+            "reports_route",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            route=route,
+            distance=distance,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        async for element in self._stream(request, key="results"):
+            yield self._decode(model, element)
+
+    async def get_taf(
+        self,
+        location: str,
+        options: str = None,
+        airport: bool = True,
+        reporting: bool = True,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        fields: Iterable = None,
+        url_modifier: str = "taf/",
+    ) -> Taf:
+        """Get the TAF for a specific station by ICAO & IATA station code or a coordinate pair.
+
+        :param location: ICAO & IATA station code or coordinate pair.
+        :type location: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param airport: Only include airports, defaults to True
+        :type airport: bool, optional
+        :param reporting: Only include reporting stations when performing a coordinate search, defaults to True
+        :type reporting: bool, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Taf.raw, Taf.forecast]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
+        :return: Returns a ``Taf`` object containing the requested TAF report.
+        :rtype: Taf | TafProjection
+        """
+        model, filter = project(Taf, fields, filter)
+        filter, call = self._profile("taf", model, filter)
+        request = build_request(
+            "taf",
+            url_modifier=url_modifier,
+            model=model,
+            location=location,
+            options=options,
+            airport=airport,
+            reporting=reporting,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def parse_taf(
+        self,
+        taf: str,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        fields: Iterable = None,
+        url_modifier: str = "parse/taf",
+    ) -> Taf:
+        """Parse a TAF report
+
+        :param taf: TAF report to parse
+        :type taf: str, optional
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param fields: Only keep these fields, e.g. ``[Taf.raw, Taf.forecast]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
+        :return: Returns a ``Taf`` object containing the parsed report
+        :rtype: Taf | TafProjection
+        """
+        model, filter = project(Taf, fields, filter)
+        request = build_request(
+            "parse_taf",
+            url_modifier=url_modifier,
+            data=taf,
+            model=model,
+            options=options,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_pirep(
+        self,
+        location: str,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        url_modifier: str = "pirep/",
+    ) -> Pirep:
+        """Get PIREPs within 200 miles of a specific station by ICAO & IATA station code or coordinate pair.
+
+        :param location: ICAO & IATA station code or coordinate pair.
+        :type location: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :return: Returns a ``Pirep`` object containing the requested Pirep
+        :rtype: Pirep
+        """
+        request = build_request(
+            "pirep",
+            url_modifier=url_modifier,
+            location=location,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def parse_pirep(
+        self,
+        pirep: str,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "parse/pirep",
+    ) -> Pirep:
+        """Parse a Pirep
+
+        :param pirep: Pirep to parse
+        :type pirep: str, optional
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :return: Returns a ``Pirep`` object containing the parsed Pirep.
+        :rtype: Pirep
+        """
+        request = build_request(
+            "parse_pirep",
+            url_modifier=url_modifier,
+            data=pirep,
+            options=options,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_airsigmet(
+        self,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        url_modifier: str = "airsigmet",
+    ) -> AirSigmet:
+        """Get all global AIRMET and SIGMET advisories.
+
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :return: Returns a ``AirSigmet`` object containing the requested Air Sigmet.
+        :rtype: AirSigmet
+        """
+        request = build_request(
+            "airsigmet",
+            url_modifier=url_modifier,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def parse_airsigmet(
+        self,
+        airsigmet: str,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "parse/airsigmet",
+    ) -> AirSigmet:
+        """Parse an Air Sigmet
+
+        :param airsigmet: Air Sigmet to parse.
+        :type airsigmet: str, optional
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :return: Returns a ``AirSigmet`` object containing the parsed Air Sigmet
+        :rtype: AirSigmet
+        """
+        request = build_request(
+            "parse_airsigmet",
+            url_modifier=url_modifier,
+            data=airsigmet,
+            options=options,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_notam(
+        self,
+        location: str,
+        distance: int = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = "cache",
+        url_modifier: str = "notam/",
+    ) -> Notam:
+        """Get NOTAMs that apply to a specific airport or within a specified distance of a coordinate.
+
+        :param location: ICAO & IATA station code or coordinate pair.
+        :type location: str
+        :param distance: Distance in nautical miles from ``route`` centerline, defaults to None
+        :type distance: int, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to "cache"
+        :type onfail: str, optional
+        :return: Returns a ``Notam`` object containing the requested Notam.
+        :rtype: Notam
+        """
+        request = build_request(
+            "notam",
+            url_modifier=url_modifier,
+            location=location,
+            distance=distance,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def parse_notam(
+        self,
+        notam: str,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "parse/notam",
+    ) -> Notam:
+        """Parse a Notice to Airmen (NOTAM)
+
+        :param notam: Notam to parse.
+        :type notam: str
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :return: Returns a ``Notam`` object containing the parsed Notam.
+        :rtype: Notam
+        """
+        request = build_request(
+            "parse_notam",
+            url_modifier=url_modifier,
+            data=notam,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_nbm(
+        self,
+        report: str,
+        location: str,
+        options: str = None,
+        airport: bool = True,
+        reporting: bool = True,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = "cache",
+        fields: Iterable = None,
+        url_modifier: str = "nbm/",
+    ) -> Nbm:
+        """Get the NBM NBS report for a specific station by ICAO & IATA station code or a lat,lon coordinate pair
+
+        :param report: NBM report type. Supported: (``nbh``, ``nbs``, ``nbe``)
+        :type report: str
+        :param location: ICAO & IATA station code or coordinate pair.
+        :type location: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param airport: Only include airports, defaults to True
+        :type airport: bool, optional
+        :param reporting: Only include reporting stations when performing a coordinate search, defaults to True
+        :type reporting: bool, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to "cache"
+        :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Nbm.forecast]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
+        :return: Returns a ``Nbm`` object containing the requested NBM report.
+        :rtype: Nbm | NbmProjection
+        """
+        model, filter = project(Nbm, fields, filter)
+        filter, call = self._profile("nbm", model, filter)
+        request = build_request(
+            "nbm",
+            url_modifier=url_modifier,
+            model=model,
+            report=report,
+            location=location,
+            options=options,
+            airport=airport,
+            reporting=reporting,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def parse_nbm(
+        self,
+        nbm: str,
+        report: str,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "parse/nbm",
+    ) -> Nbm:
+        """Parse an NBM/NBS report
+
+        :param nbm: NBM report to parse.
+        :type nbm: str
+        :param report: NBM report type. Supported: (``nbh``, ``nbs``, ``nbe``)
+        :type report: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :return: Returns a ``Nbm`` object containing the parsed Nbm report.
+        :rtype: Nbm
+        """
+        request = build_request(
+            "parse_nbm",
+            url_modifier=url_modifier,
+            data=nbm,
+            report=report,
+            options=options,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def get_gfs(
+        self,
+        report: str,
+        location: str,
+        options: str = None,
+        airport: bool = True,
+        reporting: bool = True,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = "cache",
+        fields: Iterable = None,
+        url_modifier: str = "gfs/",
+    ) -> Gfs:
+        """Get the GFS MAV report for a specific station by ICAO & IATA station code or a coordinate pair.
+
+        :param report: GFS report type. Supported: (``mav``, ``mex``)
+        :type report: str
+        :param location: ICAO & IATA station code or coordinate pair.
+        :type location: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param airport: Only include airports, defaults to True
+        :type airport: bool, optional
+        :param reporting: Only include reporting stations when performing a coordinate search, defaults to True
+        :type reporting: bool, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to "cache"
+        :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Gfs.forecast]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
+        :return: Returns a ``Gfs`` object containing the requested GFS report.
+        :rtype: Gfs | GfsProjection
+        """
+        model, filter = project(Gfs, fields, filter)
+        filter, call = self._profile("gfs", model, filter)
+        request = build_request(
+            "gfs",
+            url_modifier=url_modifier,
+            model=model,
+            report=report,
+            location=location,
+            options=options,
+            airport=airport,
+            reporting=reporting,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def parse_gfs(
+        self,
+        gfs: str,
+        report: str,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "parse/gfs",
+    ) -> Gfs:
+        """Parse a GFS MAV Report
+
+        :param gfs: GFS report to parse.
+        :type gfs: str
+        :param report: GFS report type. Supported: (``mav``, ``mex``)
+        :type report: str
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :return: Returns a ``Gfs`` object containing the parsed GFS report.
+        :rtype: Gfs
+        """
+        request = build_request(
+            "parse_gfs",
+            url_modifier=url_modifier,
+            data=gfs,
+            report=report,
+            options=options,
+            remove=remove,
+            filter=filter,
+        )
+        # We Make the request, evaluate the status code
+        # And then cast the json response to the Metar Object.
+        r = await self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    async def parse_many(
+        self,
+        report_type: str,
+        reports: Iterable[str] | AsyncIterable[str],
+        max_workers: int = 8,
+        **kwargs,
+    ) -> AsyncIterator[Metar | Taf | Pirep | AirSigmet | Notam | Nbm | Gfs | Exception]:
+        """Parse any number of raw reports, yielding the decoded models in input order.
+
+        Reports are sent through the pooled connections, at most ``max_workers`` at a time.
+        ``reports`` is consumed as results are yielded, at most ``2 * max_workers`` ahead of the last one
+        yielded, so memory stays flat whatever its size.
+        A report that could not be parsed yields the exception it failed with instead of a model.
+
+        :param report_type: Report type (``metar``, ``taf``, ``pirep``, ``airsigmet``, ``notam``, ``nbm``, ``gfs``)
+        :type report_type: str
+        :param reports: Raw reports to parse
+        :type reports: Iterable[str] | AsyncIterable[str]
+        :param max_workers: Maximum number of reports parsed at the same time, defaults to 8
+        :type max_workers: int, optional
+        :param kwargs: Passed on to the ``parse_`` method of ``report_type``, e.g. ``report`` for ``nbm`` and ``gfs``
+        :raises ValueError: Unknown ``report_type``
+        :return: An async generator of the parsed reports, or of their exception
+        :rtype: AsyncIterator[Metar | Taf | Pirep | AirSigmet | Notam | Nbm | Gfs | Exception]
+        """
+        if report_type not in PARSE_REPORT_TYPES:
+            raise ValueError(f"Unknown report type : {report_type}")
+        parse = getattr(self, f"parse_{report_type}")
+
+        # The window holds twice as many reports as are parsed at the same time, like ``AvwxApiClient.parse_many``.
+        slots = asyncio.Semaphore(max_workers)
+
+        async def run(report: str):
+            async with slots:
+                try:
+                    return await parse(report, **kwargs)
+                except Exception as e:
+                    return e
+
+        if not hasattr(reports, "__aiter__"):
+            reports = _aiter(reports)
+        # Results are yielded in order from a sliding window of pending reports,
+        # which keeps every slot busy while the oldest one is awaited.
+        window = deque()
+        try:
+            async for report in reports:
+                window.append(asyncio.ensure_future(run(report)))
+                if len(window) >= 2 * max_workers:
+                    yield await window.popleft()
+            while window:
+                yield await window.popleft()
+        finally:
+            # The caller stopped early: the reports still in flight are cancelled.
+            for task in window:
+                task.cancel()
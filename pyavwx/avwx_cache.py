@@ -0,0 +1,196 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from pyavwx.models.utils import parse_datetime
+
+# Seconds a response stays valid, by endpoint path prefix.
+# The longest matching prefix wins, see ``ResponseCache.ttl_for``.
+DEFAULT_TTLS = {
+    "station/": 86400,
+    "search/station": 86400,
+    "path/station": 86400,
+    "metar/": 300,
+    "taf/": 900,
+    "summary/": 300,
+    "multi/": 300,
+    "pirep/": 300,
+    "airsigmet": 300,
+    "notam/": 900,
+    "nbm/": 1800,
+    "gfs/": 1800,
+    "parse/": 86400,
+}
+
+# Time between two routine issuances of a report, by endpoint path prefix.
+REPORT_INTERVALS = {
+    "metar/": 3600,
+    "summary/": 3600,
+    "taf/": 21600,
+    "nbm/": 3600,
+    "gfs/": 21600,
+}
+
+
+def _parse_timestamp(value) -> float | None:
+    dt = parse_datetime(value)
+    return dt.timestamp() if isinstance(dt, datetime) else None
+
+
+def _report_timestamp(payload) -> float | None:
+    # Report issue time first, then the time the API itself cached the report.
+    if not isinstance(payload, dict):
+        return None
+    report_time = payload.get("time")
+    if isinstance(report_time, dict):
+        issued = _parse_timestamp(report_time.get("dt"))
+        if issued is not None:
+            return issued
+    meta = payload.get("meta")
+    if isinstance(meta, dict):
+        return _parse_timestamp(meta.get("cache_timestamp"))
+    return None
+
+
+def _longest_prefix(endpoint: str, table: dict):
+    best = None
+    for prefix in table:
+        if endpoint.startswith(prefix) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return table[best] if best is not None else None
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300,
+        ttls: dict = None,
+        use_report_time: bool = False,
+        min_ttl: float = 60,
+    ):
+        """Thread-safe in-memory LRU cache of decoded API responses.
+
+        Entries are keyed on the HTTP method, the built URL and the request body.
+        Each entry expires after the TTL of its endpoint, and the least recently used
+        entry is evicted once ``maxsize`` is reached.
+
+        :param maxsize: Maximum number of responses kept, defaults to 1024
+        :type maxsize: int, optional
+        :param ttl: Seconds a response stays valid when its endpoint has no TTL, defaults to 300
+        :type ttl: float, optional
+        :param ttls: Seconds a response stays valid by endpoint path prefix (``"metar/"``, ``"station/"``...), merged over ``DEFAULT_TTLS``, defaults to None
+        :type ttls: dict, optional
+        :param use_report_time: Also expire a report when its next routine issuance is due, based on its ``time`` or ``meta.cache_timestamp``, defaults to False
+        :type use_report_time: bool, optional
+        :param min_ttl: Minimum seconds a report is kept when ``use_report_time`` finds it already overdue, defaults to 60
+        :type min_ttl: float, optional
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.use_report_time = use_report_time
+        self.min_ttl = min_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(method: str, url: str, data: str = None) -> tuple:
+        return method, url, data
+
+    def ttl_for(self, endpoint: str) -> float:
+        """TTL of an endpoint, given as its path relative to the API base URL.
+
+        :param endpoint: Endpoint path, e.g. ``metar/KJFK?``
+        :type endpoint: str
+        :return: TTL in seconds
+        :rtype: float
+        """
+        ttl = _longest_prefix(endpoint, self.ttls)
+        return self.ttl if ttl is None else ttl
+
+    def expires_at(self, endpoint: str, payload, now: float = None) -> float:
+        now = time.time() if now is None else now
+        expires = now + self.ttl_for(endpoint)
+        if self.use_report_time:
+            interval = _longest_prefix(endpoint, REPORT_INTERVALS)
+            issued = _report_timestamp(payload)
+            if interval is not None and issued is not None:
+                next_report = issued + interval
+                expires = min(expires, max(next_report, now + self.min_ttl))
+        return expires
+
+    def get(self, key: tuple):
+        """Get a cached response, ``None`` if it is missing or expired.
+
+        :param key: Key built by ``make_key``
+        :type key: tuple
+        :return: The cached JSON payload
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, key: tuple):
+        """Get a cached response even if it has expired, ``None`` if it was never cached or got evicted.
+
+        Doesn't count as a hit or a miss.
+
+        :param key: Key built by ``make_key``
+        :type key: tuple
+        :return: The cached JSON payload
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[1]
+
+    def set(self, key: tuple, endpoint: str, payload):
+        """Cache a response.
+
+        :param key: Key built by ``make_key``
+        :type key: tuple
+        :param endpoint: Endpoint path relative to the API base URL, used to pick the TTL
+        :type endpoint: str
+        :param payload: JSON payload of the response
+        """
+        expires = self.expires_at(endpoint, payload)
+        with self._lock:
+            self._entries[key] = (expires, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every cached response and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters of the cache.
+
+        :return: ``hits``, ``misses``, ``evictions``, ``size`` and ``hit_ratio``
+        :rtype: dict
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
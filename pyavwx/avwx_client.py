@@ -1,6 +1,42 @@
-from pyavwx.avwx_authentication import AvwxApiAuth
-from pyavwx.avwx_requests_manager import makeRequest
-from pyavwx.const import BASE_URL
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Callable, Iterable, Iterator
+
+from pyavwx.avwx_authentication import AvwxApiAuth, format_auth_header
+from pyavwx.avwx_cache import ResponseCache
+from pyavwx.avwx_exceptions import AvwxCircuitOpen, AvwxRateLimited
+from pyavwx.avwx_profiler import AccessProfiler
+from pyavwx.avwx_protocol import (
+    MULTI_REPORT_MODELS,
+    ROUTE_REPORT_MODELS,
+    ApiRequest,
+    build_request,
+    parse_payload,
+    read_payload,
+)
+from pyavwx.avwx_rate_limiter import RateLimiter
+from pyavwx.avwx_requests_manager import (
+    makeRequest,
+    create_session,
+    get_json_decoder,
+    streamRequest,
+)
+from pyavwx.avwx_resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    is_transient,
+    request_timeout,
+)
+from pyavwx.avwx_single_flight import SingleFlight
+from pyavwx.avwx_station_cache import StationCache
+from pyavwx.avwx_station_index import StationIndex, parse_coords
+from pyavwx.avwx_station_search import StationSearch
+from pyavwx.avwx_stream import iter_json_array
+from pyavwx.avwx_transport import Transport
+from pyavwx.const import BASE_URL, MULTI_LOCATIONS_LIMIT
 from pyavwx.models import (
     Metar,
     Taf,
@@ -15,18 +51,255 @@ from pyavwx.models import (
     Gfs,
     ReportsRoute,
 )
-from pyavwx.models.utils import url_builder
+from pyavwx.models.projection import project
+from pyavwx.models.utils import decode
+
+PARSE_REPORT_TYPES = ("metar", "taf", "pirep", "airsigmet", "notam", "nbm", "gfs")
+
+
+def chunk_locations(
+    locations: Iterable[str], size: int = MULTI_LOCATIONS_LIMIT
+) -> list[list[str]]:
+    # Duplicates are dropped, so a station is never fetched twice in the same batch.
+    unique = list(dict.fromkeys(location.strip() for location in locations))
+    return [unique[i : i + size] for i in range(0, len(unique), size)]
 
 
 class AvwxApiClient:
-    def __init__(self, api_key):
+    def __init__(
+        self,
+        api_key,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        cache: ResponseCache = None,
+        station_cache: StationCache = None,
+        lazy: bool = False,
+        json_decoder: str | Callable = "auto",
+        station_index: StationIndex = None,
+        station_search: StationSearch = None,
+        coalesce: bool = True,
+        rate_limiter: RateLimiter = None,
+        timeout: float = 30,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        profiler: AccessProfiler = None,
+        transport: Transport = None,
+    ):
+        """Client for the avwx.rest API.
+
+        Every method of the client goes through the same pooled ``requests.Session``,
+        so TCP and TLS connections are reused between calls. The client can be shared between threads.
+
+        :param api_key: avwx.rest API key
+        :type api_key: str
+        :param pool_connections: Number of per-host connection pools to keep, defaults to 10
+        :type pool_connections: int, optional
+        :param pool_maxsize: Maximum number of connections kept per host, defaults to 10
+        :type pool_maxsize: int, optional
+        :param pool_block: Wait for a free connection instead of opening a throwaway one, defaults to False
+        :type pool_block: bool, optional
+        :param keep_alive: Keep connections open between requests, defaults to True
+        :type keep_alive: bool, optional
+        :param cache: Cache responses in memory, defaults to None
+        :type cache: ResponseCache, optional
+        :param station_cache: Persist station lookups on disk, defaults to None
+        :type station_cache: StationCache, optional
+        :param lazy: Return models building their nested dataclasses on first access, defaults to False
+        :type lazy: bool, optional
+        :param json_decoder: Parser of the response bytes: ``"json"``, ``"orjson"``, ``"msgspec"``, a callable,
+            or ``"auto"`` for the fastest installed one, defaults to "auto"
+        :type json_decoder: str | Callable, optional
+        :param station_index: Answer nearest-station queries locally when the index holds stations, defaults to None
+        :type station_index: StationIndex, optional
+        :param station_search: Answer station text searches locally when the index holds stations, defaults to None
+        :type station_search: StationSearch, optional
+        :param coalesce: Send a single request when identical ones are already in flight, every caller getting its result, defaults to True
+        :type coalesce: bool, optional
+        :param rate_limiter: Queue requests over the rate limits of the API key and retry those answered with a 429, defaults to None
+        :type rate_limiter: RateLimiter, optional
+        :param timeout: Seconds to wait for a response, shortened inside a ``deadline`` block, ``None`` to wait forever, defaults to 30
+        :type timeout: float, optional
+        :param retry: Retry GET requests failing with a timeout, a connection error or a 5xx status, defaults to None
+        :type retry: RetryPolicy, optional
+        :param circuit_breaker: Fail fast, or serve stale cached responses, while the API keeps failing, defaults to None
+        :type circuit_breaker: CircuitBreaker, optional
+        :param profiler: Learn the fields read on the returned METAR, TAF, summary, NBM and GFS reports and only request those, defaults to None
+        :type profiler: AccessProfiler, optional
+        :param transport: Send the requests with this transport instead of the pooled session, each with the API key
+            in its ``headers``. Closed with the client, defaults to None
+        :type transport: Transport, optional
+        """
         self.auth = AvwxApiAuth(api_key)
+        # Transports send the headers of each request, the API key goes with them
+        self._headers = format_auth_header(api_key)
+        self.session = create_session(
+            auth=self.auth,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+        self.cache = cache
+        self.station_cache = station_cache
+        self.lazy = lazy
+        self.decoder = get_json_decoder(json_decoder)
+        self.station_index = station_index
+        self.station_search = station_search
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.profiler = profiler
+        self.transport = transport
+        self.single_flight = SingleFlight() if coalesce else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Close every pooled connection of the client, and its transport."""
+        self.session.close()
+        if self.transport is not None:
+            self.transport.close()
+
+    def _decode(self, model: type, payload: dict):
+        return decode(model, payload, lazy=self.lazy)
+
+    def _profile(self, endpoint: str, model: type, filter: str = None) -> tuple:
+        # Only calls asking for whole reports are profiled, not those given a ``filter`` or ``fields``.
+        # Returns the ``filter`` to send and the ``ProfiledCall`` decoding the response, if any.
+        if self.profiler is None or filter:
+            return filter, None
+        call = self.profiler.start(endpoint, model)
+        return call.filter, call
+
+    def _exchange(self, request: ApiRequest, timeout: float) -> tuple:
+        # A single attempt, through the transport when one is plugged in
+        if self.transport is None:
+            return makeRequest(
+                url=request.url,
+                auth=self.auth,
+                data=request.data,
+                rjson=True,
+                method=request.method,
+                session=self.session,
+                decoder=self.decoder,
+                timeout=timeout,
+            )
+        response = self.transport.send(replace(request, headers=self._headers), timeout)
+        return response, read_payload(response, self.decoder)
+
+    def _send(self, request: ApiRequest) -> tuple:
+        throttled = retries = 0
+        breaker = self.circuit_breaker
+        while True:
+            timeout = request_timeout(self.timeout)
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                r = self._exchange(request, timeout)
+            except Exception as e:
+                if breaker is not None:
+                    # Errors of the request itself still mean the API answered.
+                    breaker.record(not is_transient(e))
+                if isinstance(e, AvwxRateLimited) and self.rate_limiter is not None:
+                    if throttled >= self.rate_limiter.max_retries:
+                        raise
+                    # Every caller waits for the API to accept requests again.
+                    self.rate_limiter.throttle(e.retry_after)
+                    throttled += 1
+                    continue
+                delay = self.retry.delay(request.method, retries, e) if self.retry else None
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                retries += 1
+                continue
+            except BaseException:
+                # Cancelled or interrupted: no outcome to record, a half-open trial is given back.
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                breaker.record(True)
+            return r
+
+    def _request(self, request: ApiRequest, station_lookup: bool = False) -> tuple:
+        url, data, method = request.url, request.data, request.method
+        # Station lookups are first served from the persistent station cache.
+        persist = station_lookup and self.station_cache is not None
+        if persist:
+            payload = self.station_cache.get(url)
+            if payload is not None:
+                return None, payload
+        if self.cache is not None:
+            key = self.cache.make_key(method, url, data)
+            payload = self.cache.get(key)
+            if payload is not None:
+                return None, payload
+
+        def fetch():
+            r = self._send(request)
+            if self.cache is not None:
+                self.cache.set(key, url.removeprefix(BASE_URL), r[1])
+            if self.station_cache is not None:
+                self.station_cache.observe(r[1])
+                if persist:
+                    self.station_cache.set(url, r[1])
+            return r
+
+        try:
+            if self.single_flight is None:
+                return fetch()
+            # Concurrent callers of the same request wait for the one in flight, up to their own deadline.
+            return self.single_flight.do((method, url, data), fetch, timeout=request_timeout())
+        except AvwxCircuitOpen:
+            if self.cache is None or not self.circuit_breaker.serve_stale:
+                raise
+            payload = self.cache.get_stale(key)
+            if payload is None:
+                raise
+            return None, payload
+
+    def _stream(self, request: ApiRequest, key: str = None) -> Iterator:
+        # Elements of a list response, parsed while the response streams in.
+        # Streams are served from the response cache, but neither cached, coalesced nor retried.
+        url = request.url
+        if self.cache is not None:
+            payload = self.cache.get(self.cache.make_key("GET", url, None))
+            if payload is not None:
+                yield from payload if key is None else payload.get(key) or ()
+                return
+        timeout = request_timeout(self.timeout)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self.transport is not None:
+            # Transports hand out whole bodies
+            payload = self._exchange(request, timeout)[1]
+            yield from payload if key is None else payload.get(key) or ()
+            return
+        chunks = streamRequest(
+            url=url,
+            auth=self.auth,
+            session=self.session,
+            decoder=self.decoder,
+            timeout=timeout,
+        )
+        yield from iter_json_array(chunks, key)
 
     def get_station(
         self,
         ident: str,
         remove: str = None,
         filter: str = None,
+        fields: Iterable = None,
         url_modifier: str = "station/",
     ) -> Station:
         """Get station information for an airfield or other location by ICAO ident.
@@ -37,21 +310,25 @@ class AvwxApiClient:
         :type remove: str, optional
         :param filter: Only include these keys in the response, defaults to None
         :type filter: str, optional
+        :param fields: Only keep these fields, e.g. ``[Station.name, Station.latitude]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
         :return: Info for requested ``ident``
-        :rtype: Station
+        :rtype: Station | StationProjection
         """
-        args = locals()
-        url = url_builder(
+        model, filter = project(Station, fields, filter)
+        request = build_request(
+            "station",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=args["ident"],
-            args=args,
+            model=model,
+            ident=ident,
+            remove=remove,
+            filter=filter,
         )
 
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return Station(**r[1])
+        r = self._request(request, station_lookup=True)
+        return parse_payload(request, r[1], self.lazy)
 
     def get_near_stations(
         self,
@@ -77,22 +354,68 @@ class AvwxApiClient:
         :return: Nearest Stations
         :rtype: list[NearStation]
         """
-        args = locals()
-        url = url_builder(
+        # The local index doesn't apply ``remove`` and ``filter``, stations come back whole.
+        if self.station_index:
+            lat, lon = parse_coords(coords)
+            return self.station_index.nearest(
+                lat, lon, n=10 if n is None else n, airport=airport
+            )
+        request = build_request(
+            "near_stations",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=args["coords"],
-            args=args,
+            coords=coords,
+            n=n,
+            airport=airport,
+            remove=remove,
+            filter=filter,
         )
 
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
+        r = self._request(request, station_lookup=True)
+        return parse_payload(request, r[1], self.lazy)
+
+    def iter_near_stations(
+        self,
+        coords: str,
+        n: int = None,
+        airport: bool = True,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "station/near/",
+    ) -> Iterator[NearStation]:
+        """Like ``get_near_stations``, yielding each station as soon as it is parsed from the streamed response.
 
-        station_list = []
-        for station in r[1]:
-            station_list.append(NearStation(**station))
-        return station_list
+        :param coords: Coordinate pair Example: 28.1,-81.
+        :type coords: str
+        :param n: Number of stations to return, defaults to 10
+        :type n: int, optional
+        :param airport: Only include airports, defaults to True
+        :type airport: bool, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include these keys in the response, defaults to None
+        :type filter: str, optional
+        :return: A generator of the nearest stations
+        :rtype: Iterator[NearStation]
+        """
+        if self.station_index:
+            lat, lon = parse_coords(coords)
+            yield from self.station_index.nearest(
+                lat, lon, n=10 if n is None else n, airport=airport
+            )
+            return
+        request = build_request(
+            "near_stations",
+            url_modifier=url_modifier,
+            coords=coords,
+            n=n,
+            airport=airport,
+            remove=remove,
+            filter=filter,
+        )
+        for element in self._stream(request):
+            yield self._decode(request.model, element)
 
     def get_stations_text(
         self,
@@ -115,21 +438,56 @@ class AvwxApiClient:
         :return: Stations that match the requested ``text``
         :rtype: list[Station]
         """
-        args = locals()
-        url = url_builder(
+        # The local search doesn't apply ``remove`` and ``filter``, stations come back whole.
+        if self.station_search:
+            return self.station_search.search(text, n=10 if n is None else n)
+        request = build_request(
+            "stations_text",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload="",
-            args=args,
+            text=text,
+            n=n,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
+        r = self._request(request, station_lookup=True)
+        return parse_payload(request, r[1], self.lazy)
 
-        station_list = []
-        for station in r[1]:
-            station_list.append(Station(**station))
-        return station_list
+    def iter_stations_text(
+        self,
+        text: str,
+        n: int = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "search/station",
+    ) -> Iterator[Station]:
+        """Like ``get_stations_text``, yielding each station as soon as it is parsed from the streamed response.
+
+        :param text: Search text
+        :type text: str
+        :param n: Max results to return, defaults to ``10``
+        :type n: int, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :return: A generator of the stations that match the requested ``text``
+        :rtype: Iterator[Station]
+        """
+        if self.station_search:
+            yield from self.station_search.search(text, n=10 if n is None else n)
+            return
+        request = build_request(
+            "stations_text",
+            url_modifier=url_modifier,
+            text=text,
+            n=n,
+            remove=remove,
+            filter=filter,
+        )
+        for element in self._stream(request):
+            yield self._decode(request.model, element)
 
     def get_stations_route(
         self,
@@ -152,18 +510,25 @@ class AvwxApiClient:
         :return: Stations around the given ``route``
         :rtype: StationRoute
         """
-        args = locals()
-        url = url_builder(
+        # Routes with navaids or stations missing from the local index are left to the API.
+        if self.station_index:
+            try:
+                return self.station_index.route(route, distance)
+            except ValueError:
+                pass
+        request = build_request(
+            "stations_route",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload="",
-            args=args,
+            route=route,
+            distance=distance,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
+        r = self._request(request)
 
-        return StationRoute(**r[1])
+        return parse_payload(request, r[1], self.lazy)
 
     def get_summary(
         self,
@@ -172,6 +537,7 @@ class AvwxApiClient:
         remove: str = None,
         filter: str = None,
         onfail: str = None,
+        fields: Iterable = None,
         url_modifier: str = "summary/",
     ) -> Summary:
         """Get the current and forecasted flight conditions for a specific station by ICAO & IATA station code or a coordinate pair.
@@ -186,20 +552,29 @@ class AvwxApiClient:
         :type filter: str, optional
         :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
         :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Summary.flight_rules]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
         :return: Summary for the requested ``ident``
-        :rtype: Summary
+        :rtype: Summary | SummaryProjection
         """
-        args = locals()
-        url = url_builder(
+        model, filter = project(Summary, fields, filter)
+        filter, call = self._profile("summary", model, filter)
+        request = build_request(
+            "summary",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=location,
-            args=args,
+            model=model,
+            location=location,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return Summary(**r[1])
+        r = self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
 
     def get_metar(
         self,
@@ -210,6 +585,7 @@ class AvwxApiClient:
         remove: str = None,
         filter: str = None,
         onfail: str = None,
+        fields: Iterable = None,
         url_modifier: str = "metar/",
     ) -> Metar:
         """Get a METAR report for an airfield or other location by ICAO, IATA ident or coordinates.
@@ -228,21 +604,32 @@ class AvwxApiClient:
         :type filter: str, optional
         :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
         :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Metar.flight_rules, Metar.wind_speed]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
         :return: Metar for the requested ``ident``
-        :rtype: Metar
+        :rtype: Metar | MetarProjection
         """
-        args = locals()
-        url = url_builder(
+        model, filter = project(Metar, fields, filter)
+        filter, call = self._profile("metar", model, filter)
+        request = build_request(
+            "metar",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=location,
-            args=args,
+            model=model,
+            location=location,
+            options=options,
+            airport=airport,
+            reporting=reporting,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
 
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return Metar(**r[1])
+        r = self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
 
     def parse_metar(
         self,
@@ -250,6 +637,7 @@ class AvwxApiClient:
         options: str = None,
         remove: str = None,
         filter: str = None,
+        fields: Iterable = None,
         url_modifier: str = "parse/metar",
     ) -> Metar:
         """Parse a METAR report
@@ -262,21 +650,25 @@ class AvwxApiClient:
         :type remove: str, optional
         :param filter: Only include the selected keys in the response, defaults to None
         :type filter: str, optional
+        :param fields: Only keep these fields, e.g. ``[Metar.flight_rules, Metar.wind_speed]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
         :return: Parsed Metar for the given ``metar``
-        :rtype: Metar
+        :rtype: Metar | MetarProjection
         """
-        args = locals()
-        url = url_builder(
+        model, filter = project(Metar, fields, filter)
+        request = build_request(
+            "parse_metar",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=metar,
-            include_main=False,
-            args=args,
+            data=metar,
+            model=model,
+            options=options,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True, data=metar, method="POST")
-        return Metar(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def get_multiple_reports(
         self,
@@ -286,8 +678,9 @@ class AvwxApiClient:
         remove: str = None,
         filter: str = None,
         onfail: str = None,
+        fields: Iterable = None,
         url_modifier: str = "multi/",
-    ) -> Metar | Taf | Summary:
+    ) -> list[Metar | Taf | Summary]:
         """Get for multiple stations a given report type
 
         :param report_type: Weather report type (``summary``,``metar``,``taf``)
@@ -302,26 +695,130 @@ class AvwxApiClient:
         :type filter: str, optional
         :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
         :type onfail: str, optional
-        :return: Summary for the requested ``ident``
-        :rtype: Metar | Taf | Summary
+        :param fields: Only keep these fields, e.g. ``[Metar.flight_rules, Metar.wind_speed]``, sent as ``filter``.
+            ``station`` is always kept to match reports to locations, defaults to None
+        :type fields: Iterable, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: One report per requested location, ``None`` when a location has no report
+        :rtype: list[Metar | Taf | Summary]
         """
-        args = locals()
-        url = url_builder(
-            url_modifier=f"{url_modifier}{report_type}/",
-            base_url=BASE_URL,
-            main_payload=locations,
-            args=args,
+        if report_type not in MULTI_REPORT_MODELS:
+            raise ValueError(f"Unknown report type : {report_type}")
+        model, filter = project(
+            MULTI_REPORT_MODELS[report_type], fields, filter, required=("station",)
+        )
+        request = build_request(
+            "multi",
+            url_modifier=url_modifier,
+            model=model,
+            report_type=report_type,
+            locations=locations,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        match report_type:
-            case "metar":
-                return Metar(**r[1])
-            case "taf":
-                return Taf(**r[1])
-            case "summary":
-                return Summary(**r[1])
+        r = self._request(request)
+        reports = parse_payload(request, r[1], self.lazy)
+        return [
+            None if isinstance(report, Exception) else report
+            for report in reports.values()
+        ]
+
+    def get_bulk_reports(
+        self,
+        report_type: str,
+        locations: Iterable[str],
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        max_workers: int = 8,
+        fields: Iterable = None,
+    ) -> dict[str, Metar | Taf | Summary | Exception]:
+        """Get a given report type for any number of stations.
+
+        ``locations`` is split in chunks of 10 stations, each chunk being one ``multi/`` call.
+        Chunks are fetched concurrently. A station that could not be fetched maps to the exception
+        explaining why instead of a report, so one bad station never fails the whole batch.
+
+        :param report_type: Weather report type (``summary``,``metar``,``taf``)
+        :type report_type: str
+        :param locations: ICAO & IATA station codes
+        :type locations: Iterable[str]
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :param max_workers: Maximum number of chunks fetched at the same time, defaults to 8
+        :type max_workers: int, optional
+        :param fields: Only keep these fields, e.g. ``[Metar.flight_rules, Metar.wind_speed]``, sent as ``filter``.
+            ``station`` is always kept to match reports to locations, defaults to None
+        :type fields: Iterable, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: Report, or the exception that kept it from being fetched (``AvwxReportError``, ``AvwxBadStatus``,
+            ``AvwxTimeout``, a connection or decoding error...), keyed by requested location
+        :rtype: dict[str, Metar | Taf | Summary | Exception]
+        """
+        if report_type not in MULTI_REPORT_MODELS:
+            raise ValueError(f"Unknown report type : {report_type}")
+        model, filter = project(
+            MULTI_REPORT_MODELS[report_type], fields, filter, required=("station",)
+        )
+        results = {}
+        chunks = chunk_locations(locations)
+        # Each worker runs in a copy of the caller's context, so a ``deadline`` applies to every chunk.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_result in executor.map(
+                lambda job: job[0].run(
+                    self._fetch_multi_chunk,
+                    report_type,
+                    job[1],
+                    options,
+                    remove,
+                    filter,
+                    onfail,
+                    model,
+                ),
+                [(contextvars.copy_context(), chunk) for chunk in chunks],
+            ):
+                results.update(chunk_result)
+        return results
+
+    def _fetch_multi_chunk(
+        self,
+        report_type: str,
+        chunk: list[str],
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        model: type = None,
+        url_modifier: str = "multi/",
+    ) -> dict:
+        request = build_request(
+            "multi",
+            url_modifier=url_modifier,
+            model=model,
+            report_type=report_type,
+            locations=",".join(chunk),
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        try:
+            r = self._request(request)
+            return parse_payload(request, r[1], self.lazy)
+        except Exception as e:
+            # Any failure, from the transport to the decoding, only fails the stations of this chunk.
+            return {location: e for location in chunk}
 
     def get_nearest_reports(
         self,
@@ -353,24 +850,26 @@ class AvwxApiClient:
         :type filter: str, optional
         :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
         :type onfail: str, optional
+        :raises ValueError: Unknown ``report_type``
         :return: Returns ``Metar`` or ``Taf`` depending on the chosen report type
         :rtype: Metar | Taf
         """
-        args = locals()
-        url = url_builder(
-            url_modifier=f"{report_type}/{url_modifier}",
-            base_url=BASE_URL,
-            main_payload=coords,
-            args=args,
+        request = build_request(
+            "near_reports",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            coords=coords,
+            n=n,
+            options=options,
+            airport=airport,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        match report_type:
-            case "metar":
-                return Metar(**r[1])
-            case "taf":
-                return Taf(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def get_reports_text(
         self,
@@ -396,29 +895,68 @@ class AvwxApiClient:
         :type remove: str, optional
         :param filter: Only include the selected keys in the response, defaults to None
         :type filter: str, optional
+        :raises ValueError: Unknown ``report_type``
         :return: Returns a list of ``Metar`` or ``Taf`` depending on the chosen report type
         :rtype: list[Metar] | list[Taf]
         """
-        args = locals()
-        url = url_builder(
-            url_modifier=f"{url_modifier}",
-            base_url=BASE_URL,
-            main_payload=report_type,
-            args=args,
+        request = build_request(
+            "reports_text",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            text=text,
+            n=n,
+            options=options,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-
-        report_list = []
-        match report_type:
-            case "metar":
-                for metar in r[1]:
-                    report_list.append(Metar(**metar))
-            case "taf":
-                for taf in r[1]:
-                    report_list.append(Taf(**taf))
-        return report_list
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    def iter_reports_text(
+        self,
+        report_type: str,
+        text: str,
+        n: int = None,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        url_modifier: str = "search/",
+    ) -> Iterator[Metar | Taf]:
+        """Like ``get_reports_text``, yielding each report as soon as it is parsed from the streamed response.
+
+        :param report_type: Weather report type (``metar``,``taf``)
+        :type report_type: str
+        :param text: Search text
+        :type text: str
+        :param n: Max results to return, defaults to ``10``
+        :type n: int, optional
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: A generator of ``Metar`` or ``Taf`` depending on the chosen report type
+        :rtype: Iterator[Metar | Taf]
+        """
+        if report_type not in ("metar", "taf"):
+            raise ValueError(f"Unknown report type : {report_type}")
+        model = ROUTE_REPORT_MODELS[report_type]
+        request = build_request(
+            "reports_text",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            text=text,
+            n=n,
+            options=options,
+            remove=remove,
+            filter=filter,
+        )
+        for element in self._stream(request):
+            yield self._decode(model, element)
 
     def get_reports_route(
         self,
@@ -450,17 +988,71 @@ class AvwxApiClient:
         :return: Returns a ReportsRoute containing route info and list of report in the chosen type.
         :rtype: ReportsRoute
         """
-        args = locals()
-        url = url_builder(
-            url_modifier=f"{url_modifier}",
-            base_url=BASE_URL,
-            main_payload=report_type,
-            args=args,
+        request = build_request(
+            "reports_route",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            route=route,
+            distance=distance,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return ReportsRoute(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    def iter_reports_route(
+        self,
+        report_type: str,
+        route: str,
+        distance: int,
+        options: str = None,
+        remove: str = None,
+        filter: str = None,
+        onfail: str = None,
+        url_modifier: str = "path/",
+    ) -> Iterator[Metar | Taf | AirSigmet | Notam]:
+        """Like ``get_reports_route``, yielding each report as soon as it is parsed from the streamed response.
+
+        Only the ``results`` of the route are yielded, its ``meta`` and ``route`` are skipped.
+
+        :param report_type: Weather report type (``metar``,``taf``,``airsigmet``,``notam``)
+        :type report_type: str
+        :param route: Flight route with ICAO, navaid, and coordinate, separated by a ``;``
+        :type route: str
+        :param distance: Distance in nautical miles from ``route`` centerline
+        :type distance: int
+        :param options: Additional options to include, defaults to None
+        :type options: str, optional
+        :param remove: Remove unused keys from the response, defaults to None
+        :type remove: str, optional
+        :param filter: Only include the selected keys in the response, defaults to None
+        :type filter: str, optional
+        :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
+        :type onfail: str, optional
+        :raises ValueError: Unknown ``report_type``
+        :return: A generator of the reports along the route, in the chosen type
+        :rtype: Iterator[Metar | Taf | AirSigmet | Notam]
+        """
+        if report_type not in ROUTE_REPORT_MODELS:
+            raise ValueError(f"Unknown report type : {report_type}")
+        model = ROUTE_REPORT_MODELS[report_type]
+        request = build_request(
+            "reports_route",
+            url_modifier=url_modifier,
+            report_type=report_type,
+            route=route,
+            distance=distance,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
+        )
+        for element in self._stream(request, key="results"):
+            yield self._decode(model, element)
 
     def get_taf(
         self,
@@ -471,6 +1063,7 @@ class AvwxApiClient:
         remove: str = None,
         filter: str = None,
         onfail: str = None,
+        fields: Iterable = None,
         url_modifier: str = "taf/",
     ) -> Taf:
         """Get the TAF for a specific station by ICAO & IATA station code or a coordinate pair.
@@ -489,20 +1082,31 @@ class AvwxApiClient:
         :type filter: str, optional
         :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to None
         :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Taf.raw, Taf.forecast]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
         :return: Returns a ``Taf`` object containing the requested TAF report.
-        :rtype: Taf
+        :rtype: Taf | TafProjection
         """
-        args = locals()
-        url = url_builder(
+        model, filter = project(Taf, fields, filter)
+        filter, call = self._profile("taf", model, filter)
+        request = build_request(
+            "taf",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=location,
-            args=args,
+            model=model,
+            location=location,
+            options=options,
+            airport=airport,
+            reporting=reporting,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return Taf(**r[1])
+        r = self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
 
     def parse_taf(
         self,
@@ -510,6 +1114,7 @@ class AvwxApiClient:
         options: str = None,
         remove: str = None,
         filter: str = None,
+        fields: Iterable = None,
         url_modifier: str = "parse/taf",
     ) -> Taf:
         """Parse a TAF report
@@ -522,21 +1127,25 @@ class AvwxApiClient:
         :type remove: str, optional
         :param filter: Only include the selected keys in the response, defaults to None
         :type filter: str, optional
+        :param fields: Only keep these fields, e.g. ``[Taf.raw, Taf.forecast]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
         :return: Returns a ``Taf`` object containing the parsed report
-        :rtype: Taf
+        :rtype: Taf | TafProjection
         """
-        args = locals()
-        url = url_builder(
+        model, filter = project(Taf, fields, filter)
+        request = build_request(
+            "parse_taf",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=taf,
-            include_main=False,
-            args=args,
+            data=taf,
+            model=model,
+            options=options,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True, data=taf, method="POST")
-        return Taf(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def get_pirep(
         self,
@@ -562,18 +1171,20 @@ class AvwxApiClient:
         :return: Returns a ``Pirep`` object containing the requested Pirep
         :rtype: Pirep
         """
-        args = locals()
-        url = url_builder(
+        request = build_request(
+            "pirep",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=location,
-            args=args,
+            location=location,
+            options=options,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
 
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return Pirep(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def parse_pirep(
         self,
@@ -596,18 +1207,18 @@ class AvwxApiClient:
         :return: Returns a ``Pirep`` object containing the parsed Pirep.
         :rtype: Pirep
         """
-        args = locals()
-        url = url_builder(
+        request = build_request(
+            "parse_pirep",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=pirep,
-            include_main=False,
-            args=args,
+            data=pirep,
+            options=options,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True, data=pirep, method="POST")
-        return Pirep(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def get_airsigmet(
         self,
@@ -627,18 +1238,18 @@ class AvwxApiClient:
         :return: Returns a ``AirSigmet`` object containing the requested Air Sigmet.
         :rtype: AirSigmet
         """
-        args = locals()
-        url = url_builder(
+        request = build_request(
+            "airsigmet",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload="",
-            args=args,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
 
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return AirSigmet(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def parse_airsigmet(
         self,
@@ -661,20 +1272,18 @@ class AvwxApiClient:
         :return: Returns a ``AirSigmet`` object containing the parsed Air Sigmet
         :rtype: AirSigmet
         """
-        args = locals()
-        url = url_builder(
+        request = build_request(
+            "parse_airsigmet",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=airsigmet,
-            include_main=False,
-            args=args,
+            data=airsigmet,
+            options=options,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(
-            url=url, auth=self.auth, rjson=True, data=airsigmet, method="POST"
-        )
-        return AirSigmet(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def get_notam(
         self,
@@ -700,18 +1309,20 @@ class AvwxApiClient:
         :return: Returns a ``Notam`` object containing the requested Notam.
         :rtype: Notam
         """
-        args = locals()
-        url = url_builder(
+        request = build_request(
+            "notam",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=location,
-            args=args,
+            location=location,
+            distance=distance,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
 
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return Notam(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def parse_notam(
         self,
@@ -731,18 +1342,17 @@ class AvwxApiClient:
         :return: Returns a ``Notam`` object containing the parsed Notam.
         :rtype: Notam
         """
-        args = locals()
-        url = url_builder(
+        request = build_request(
+            "parse_notam",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=notam,
-            include_main=False,
-            args=args,
+            data=notam,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True, data=notam, method="POST")
-        return Notam(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def get_nbm(
         self,
@@ -754,6 +1364,7 @@ class AvwxApiClient:
         remove: str = None,
         filter: str = None,
         onfail: str = "cache",
+        fields: Iterable = None,
         url_modifier: str = "nbm/",
     ) -> Nbm:
         """Get the NBM NBS report for a specific station by ICAO & IATA station code or a lat,lon coordinate pair
@@ -774,20 +1385,32 @@ class AvwxApiClient:
         :type filter: str, optional
         :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to "cache"
         :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Nbm.forecast]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
         :return: Returns a ``Nbm`` object containing the requested NBM report.
-        :rtype: Nbm
+        :rtype: Nbm | NbmProjection
         """
-        args = locals()
-        url = url_builder(
-            url_modifier=f"{url_modifier}{report}/",
-            base_url=BASE_URL,
-            main_payload=location,
-            args=args,
+        model, filter = project(Nbm, fields, filter)
+        filter, call = self._profile("nbm", model, filter)
+        request = build_request(
+            "nbm",
+            url_modifier=url_modifier,
+            model=model,
+            report=report,
+            location=location,
+            options=options,
+            airport=airport,
+            reporting=reporting,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return Nbm(**r[1])
+        r = self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
 
     def parse_nbm(
         self,
@@ -813,18 +1436,19 @@ class AvwxApiClient:
         :return: Returns a ``Nbm`` object containing the parsed Nbm report.
         :rtype: Nbm
         """
-        args = locals()
-        url = url_builder(
+        request = build_request(
+            "parse_nbm",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=report,
-            include_main=True,
-            args=args,
+            data=nbm,
+            report=report,
+            options=options,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True, data=nbm, method="POST")
-        return Nbm(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
 
     def get_gfs(
         self,
@@ -836,6 +1460,7 @@ class AvwxApiClient:
         remove: str = None,
         filter: str = None,
         onfail: str = "cache",
+        fields: Iterable = None,
         url_modifier: str = "gfs/",
     ) -> Gfs:
         """Get the GFS MAV report for a specific station by ICAO & IATA station code or a coordinate pair.
@@ -856,20 +1481,32 @@ class AvwxApiClient:
         :type filter: str, optional
         :param onfail: use out-of-date cache, or check nearest station when unable to fetch report, defaults to "cache"
         :type onfail: str, optional
+        :param fields: Only keep these fields, e.g. ``[Gfs.forecast]``, sent as ``filter``, defaults to None
+        :type fields: Iterable, optional
         :return: Returns a ``Gfs`` object containing the requested GFS report.
-        :rtype: Gfs
+        :rtype: Gfs | GfsProjection
         """
-        args = locals()
-        url = url_builder(
-            url_modifier=f"{url_modifier}{report}/",
-            base_url=BASE_URL,
-            main_payload=location,
-            args=args,
+        model, filter = project(Gfs, fields, filter)
+        filter, call = self._profile("gfs", model, filter)
+        request = build_request(
+            "gfs",
+            url_modifier=url_modifier,
+            model=model,
+            report=report,
+            location=location,
+            options=options,
+            airport=airport,
+            reporting=reporting,
+            remove=remove,
+            filter=filter,
+            onfail=onfail,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True)
-        return Gfs(**r[1])
+        r = self._request(request)
+        if call is not None:
+            return call.decode(r, self.lazy)
+        return parse_payload(request, r[1], self.lazy)
 
     def parse_gfs(
         self,
@@ -895,15 +1532,67 @@ class AvwxApiClient:
         :return: Returns a ``Gfs`` object containing the parsed GFS report.
         :rtype: Gfs
         """
-        args = locals()
-        url = url_builder(
+        request = build_request(
+            "parse_gfs",
             url_modifier=url_modifier,
-            base_url=BASE_URL,
-            main_payload=report,
-            include_main=True,
-            args=args,
+            data=gfs,
+            report=report,
+            options=options,
+            remove=remove,
+            filter=filter,
         )
         # We Make the request, evaluate the status code
         # And then cast the json response to the Metar Object.
-        r = makeRequest(url=url, auth=self.auth, rjson=True, data=gfs, method="POST")
-        return Gfs(**r[1])
+        r = self._request(request)
+        return parse_payload(request, r[1], self.lazy)
+
+    def parse_many(
+        self,
+        report_type: str,
+        reports: Iterable[str],
+        max_workers: int = 8,
+        **kwargs,
+    ) -> Iterator[Metar | Taf | Pirep | AirSigmet | Notam | Nbm | Gfs | Exception]:
+        """Parse any number of raw reports, yielding the decoded models in input order.
+
+        Reports are sent through the pooled connections, at most ``max_workers`` at a time.
+        ``reports`` is consumed as results are yielded, at most ``2 * max_workers`` ahead of the last one
+        yielded, so memory stays flat whatever its size.
+        A report that could not be parsed yields the exception it failed with instead of a model.
+
+        :param report_type: Report type (``metar``, ``taf``, ``pirep``, ``airsigmet``, ``notam``, ``nbm``, ``gfs``)
+        :type report_type: str
+        :param reports: Raw reports to parse
+        :type reports: Iterable[str]
+        :param max_workers: Maximum number of reports parsed at the same time, defaults to 8
+        :type max_workers: int, optional
+        :param kwargs: Passed on to the ``parse_`` method of ``report_type``, e.g. ``report`` for ``nbm`` and ``gfs``
+        :raises ValueError: Unknown ``report_type``
+        :return: A generator of the parsed reports, or of their exception
+        :rtype: Iterator[Metar | Taf | Pirep | AirSigmet | Notam | Nbm | Gfs | Exception]
+        """
+        if report_type not in PARSE_REPORT_TYPES:
+            raise ValueError(f"Unknown report type : {report_type}")
+        parse = getattr(self, f"parse_{report_type}")
+
+        def run(report: str):
+            try:
+                return parse(report, **kwargs)
+            except Exception as e:
+                return e
+
+        # Results are yielded in order from a sliding window of pending reports,
+        # which keeps every worker busy while the oldest one is awaited.
+        window = deque()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for report in reports:
+                # Each report runs in a copy of the caller's context, so a ``deadline`` applies to it.
+                window.append(executor.submit(contextvars.copy_context().run, run, report))
+                if len(window) >= 2 * max_workers:
+                    yield window.popleft().result()
+            while window:
+                yield window.popleft().result()
+        finally:
+            # The caller stopped early: the reports not sent yet are dropped.
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,168 @@
+import string
+from functools import lru_cache
+from urllib.parse import quote
+
+
+# The same stations, options and filters come back call after call, their encoding is memoized.
+@lru_cache(maxsize=4096)
+def _quote(value: str) -> str:
+    return quote(value, safe=",")
+
+
+def encode_bool(value) -> str:
+    # Sent even when False, ``airport=false`` isn't the same as leaving the API default
+    return "true" if value else "false"
+
+
+def encode_list(value) -> str:
+    # Comma separated lists such as ``options`` or ``filter``, spaces around the items are dropped
+    return _quote(str(value).replace(" ", ""))
+
+
+def encode_text(value) -> str:
+    return _quote(str(value))
+
+
+def encode_number(value) -> str:
+    return str(value)
+
+
+ENCODERS = {
+    bool: encode_bool,
+    list: encode_list,
+    str: encode_text,
+    int: encode_number,
+    float: encode_number,
+}
+
+
+class Endpoint:
+    __slots__ = ("url_modifier", "template", "path_params", "query", "method", "url")
+
+    def __init__(
+        self,
+        url_modifier: str,
+        template: str,
+        query: dict = None,
+        method: str = "GET",
+    ):
+        """An endpoint of the API, compiled once so building its URL is a single formatting step.
+
+        ``url`` is a function generated for the endpoint, like ``namedtuple`` does for its classes:
+        ``url(base_url, url_modifier=None, **values)``. Path values are URL-encoded, query values are
+        encoded after their type. ``None`` and empty values are left out of the query, ``False`` and ``0`` are sent.
+
+        :param url_modifier: Default route of the endpoint, e.g. ``metar/``, clients let it be overridden
+        :type url_modifier: str
+        :param template: Path of the endpoint, e.g. ``{url_modifier}{location}``
+        :type template: str
+        :param query: Query parameters and their type, ``list`` for comma separated lists, defaults to None
+        :type query: dict, optional
+        :param method: HTTP method of the endpoint, defaults to "GET"
+        :type method: str, optional
+        """
+        self.url_modifier = url_modifier
+        self.template = template
+        self.query = dict(query or {})
+        self.method = method
+        path, path_params = [], []
+        for literal, name, _, _ in string.Formatter().parse(template):
+            if literal:
+                path.append(repr(literal))
+            if name == "url_modifier":
+                path.append(f"({url_modifier!r} if url_modifier is None else url_modifier)")
+            elif name:
+                path_params.append(name)
+                path.append(f"_quote(str({name}))")
+        self.path_params = tuple(path_params)
+        self.url = self._compile(path)
+
+    def _compile(self, path: list[str]):
+        namespace = {"_quote": _quote}
+        params = list(self.path_params)
+        lines = []
+        for name, kind in self.query.items():
+            encoder = ENCODERS[kind]
+            namespace[encoder.__name__] = encoder
+            params.append(f"{name}=None")
+            # Only strings can be empty, a False or a 0 is a value
+            check = f"{name} is not None"
+            if kind not in (bool, int, float):
+                check += f' and {name} != ""'
+            lines.append(f"    if {check}:")
+            lines.append(f'        query.append("{name}=" + {encoder.__name__}({name}))')
+        source = "\n".join(
+            [
+                f"def url(base_url, url_modifier=None, *, {', '.join(params)}):",
+                "    query = []",
+                *lines,
+                f"    path = base_url + {' + '.join(path) or repr('')}",
+                '    return path + "?" + "&".join(query) if query else path',
+            ]
+        )
+        exec(source, namespace)
+        return namespace["url"]
+
+
+_REPORT = {"options": list, "remove": list, "filter": list}
+_LOCATED = {**_REPORT, "airport": bool, "reporting": bool}
+_FETCHED = {"onfail": list}
+
+# Every endpoint used by the clients, keyed by the name the clients look them up with.
+ENDPOINTS = {
+    "station": Endpoint(
+        "station/", "{url_modifier}{ident}", {"remove": list, "filter": list}
+    ),
+    "near_stations": Endpoint(
+        "station/near/",
+        "{url_modifier}{coords}",
+        {"n": int, "airport": bool, "remove": list, "filter": list},
+    ),
+    "stations_text": Endpoint(
+        "search/station",
+        "{url_modifier}",
+        {"text": str, "n": int, "remove": list, "filter": list},
+    ),
+    "stations_route": Endpoint(
+        "path/station",
+        "{url_modifier}",
+        {"route": list, "distance": int, "remove": list, "filter": list},
+    ),
+    "summary": Endpoint("summary/", "{url_modifier}{location}", {**_REPORT, **_FETCHED}),
+    "metar": Endpoint("metar/", "{url_modifier}{location}", {**_LOCATED, **_FETCHED}),
+    "taf": Endpoint("taf/", "{url_modifier}{location}", {**_LOCATED, **_FETCHED}),
+    "multi": Endpoint(
+        "multi/", "{url_modifier}{report_type}/{locations}", {**_REPORT, **_FETCHED}
+    ),
+    "near_reports": Endpoint(
+        "near/",
+        "{report_type}/{url_modifier}{coords}",
+        {"n": int, **_REPORT, "airport": bool, **_FETCHED},
+    ),
+    "reports_text": Endpoint(
+        "search/", "{url_modifier}{report_type}", {"text": str, "n": int, **_REPORT}
+    ),
+    "reports_route": Endpoint(
+        "path/",
+        "{url_modifier}{report_type}",
+        {"route": list, "distance": int, **_REPORT, **_FETCHED},
+    ),
+    "pirep": Endpoint("pirep/", "{url_modifier}{location}", {**_REPORT, **_FETCHED}),
+    "airsigmet": Endpoint("airsigmet", "{url_modifier}", {"remove": list, "filter": list, **_FETCHED}),
+    "notam": Endpoint(
+        "notam/",
+        "{url_modifier}{location}",
+        {"distance": int, "remove": list, "filter": list, **_FETCHED},
+    ),
+    "nbm": Endpoint("nbm/", "{url_modifier}{report}/{location}", {**_LOCATED, **_FETCHED}),
+    "gfs": Endpoint("gfs/", "{url_modifier}{report}/{location}", {**_LOCATED, **_FETCHED}),
+    "parse_metar": Endpoint("parse/metar", "{url_modifier}", _REPORT, "POST"),
+    "parse_taf": Endpoint("parse/taf", "{url_modifier}", _REPORT, "POST"),
+    "parse_pirep": Endpoint("parse/pirep", "{url_modifier}", _REPORT, "POST"),
+    "parse_airsigmet": Endpoint("parse/airsigmet", "{url_modifier}", _REPORT, "POST"),
+    "parse_notam": Endpoint(
+        "parse/notam", "{url_modifier}", {"remove": list, "filter": list}, "POST"
+    ),
+    "parse_nbm": Endpoint("parse/nbm", "{url_modifier}{report}", _REPORT, "POST"),
+    "parse_gfs": Endpoint("parse/gfs", "{url_modifier}{report}", _REPORT, "POST"),
+}
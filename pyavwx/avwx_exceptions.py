@@ -1,4 +1,7 @@
 import json
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
 
 import requests
 
@@ -6,13 +9,24 @@ from pyavwx.models.exceptions import StationError, AuthError, BadStatus
 
 
 class AvwxBadStatus(Exception):
-    def __init__(self, request: requests.Response):
-        self.status = request.status_code
-        if request.status_code == 400:
-            self.exception = StationError(**json.loads(request.text))
+    def __init__(
+        self,
+        request: requests.Response = None,
+        status_code: int = None,
+        body: bytes | str = None,
+        decoder: Callable[[bytes], Any] = json.loads,
+    ):
+        # Async transports don't hand out a requests.Response,
+        # they give the status code and the body instead.
+        if request is not None:
+            status_code = request.status_code
+            body = request.content
+        self.status = status_code
+        if status_code == 400:
+            self.exception = StationError(**decoder(body))
 
-        elif request.status_code == 401 or request.status_code == 403:
-            self.exception = AuthError(**(json.loads(request.text)))
+        elif status_code == 401 or status_code == 403:
+            self.exception = AuthError(**(decoder(body)))
             self.args = (self.status, self.exception, self.exception.sample)
 
         else:
@@ -20,3 +34,75 @@ class AvwxBadStatus(Exception):
 
     def __str__(self):
         return f"[Status_Code:{self.status}] {self.exception.error}"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait given by a ``Retry-After`` header, either seconds or an HTTP date.
+
+    :param value: Header value
+    :type value: str | None
+    :return: Seconds, ``None`` when missing or unparsable
+    :rtype: float | None
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class AvwxRateLimited(AvwxBadStatus):
+    def __init__(
+        self,
+        request: requests.Response = None,
+        status_code: int = 429,
+        body: bytes | str = None,
+        decoder: Callable[[bytes], Any] = json.loads,
+        retry_after: str | float = None,
+    ):
+        # 429 Too Many Requests, ``retry_after`` is in seconds when the API gave one
+        if request is not None:
+            status_code = request.status_code
+            retry_after = request.headers.get("Retry-After")
+        self.status = status_code
+        self.retry_after = (
+            retry_after if isinstance(retry_after, (int, float)) else parse_retry_after(retry_after)
+        )
+        self.exception = BadStatus(error="Too Many Requests", code=status_code)
+
+
+class AvwxTimeout(TimeoutError):
+    def __init__(self, error: str = "Request timed out", url: str = None):
+        self.error = error
+        self.url = url
+        self.args = (error, url) if url else (error,)
+
+    def __str__(self):
+        return f"[Url:{self.url}] {self.error}" if self.url else self.error
+
+
+class AvwxCircuitOpen(Exception):
+    def __init__(self, retry_in: float = None):
+        # Raised without calling the API, while the circuit breaker is open
+        self.retry_in = retry_in
+        self.args = (retry_in,)
+
+    def __str__(self):
+        if self.retry_in is None:
+            return "Circuit open, the API is not called"
+        return f"Circuit open, the API is not called for {self.retry_in:.1f}s"
+
+
+class AvwxReportError(Exception):
+    def __init__(self, station: str, error: str = None):
+        self.station = station
+        self.error = error or "No report returned"
+        self.args = (station, self.error)
+
+    def __str__(self):
+        return f"[Station:{self.station}] {self.error}"
@@ -0,0 +1,244 @@
+import sys
+import threading
+
+from pyavwx.models.utils import decode, field_names
+
+# Fields always requested once a filter is applied, so reports stay identifiable.
+SAFETY_FIELDS = ("raw", "station", "time")
+
+_TRACKED_CLASSES = {}
+
+
+def _tracked_class(cls):
+    # Subclass of a model recording the fields read on its instances into ``_profile_used``.
+    tracked_cls = _TRACKED_CLASSES.get(cls)
+    if tracked_cls is not None:
+        return tracked_cls
+    names = frozenset(field_names(cls))
+    get = object.__getattribute__
+
+    def __getattribute__(self, name):
+        if name in names:
+            try:
+                get(self, "_profile_used").add(name)
+            except AttributeError:
+                # Still being built
+                pass
+        return get(self, name)
+
+    def __reduce__(self):
+        # Pickles hold the plain model, the tracked subclass can't be imported back.
+        return decode, (cls, {name: get(self, name) for name in field_names(cls)})
+
+    def __eq__(self, other):
+        if not isinstance(other, cls):
+            return NotImplemented
+        return all(get(self, name) == getattr(other, name) for name in field_names(cls))
+
+    namespace = {
+        "__slots__": ("_profile_used",),
+        "__qualname__": cls.__qualname__,
+        "__getattribute__": __getattribute__,
+        "__reduce__": __reduce__,
+        "__eq__": __eq__,
+        "__hash__": None,
+    }
+    tracked_cls = type(cls.__name__, (cls,), namespace)
+    _TRACKED_CLASSES[cls] = tracked_cls
+    return tracked_cls
+
+
+def _body_size(response) -> int | None:
+    # Size of the response body, None for a response served from a cache.
+    # aiohttp responses only give the Content-Length header, when the API sends one.
+    if response is None:
+        return None
+    content = getattr(response, "content", None)
+    if isinstance(content, bytes):
+        return len(content)
+    return getattr(response, "content_length", None)
+
+
+def _call_site() -> str:
+    # First frame outside of pyavwx: the code calling the client
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_globals.get("__name__", "").startswith("pyavwx"):
+        frame = frame.f_back
+    if frame is None:
+        return None
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+class _Site:
+    __slots__ = (
+        "endpoint",
+        "call_site",
+        "model",
+        "used",
+        "calls",
+        "tracked",
+        "full_bytes",
+        "full_responses",
+        "filtered_bytes",
+        "filtered_responses",
+    )
+
+    def __init__(self, endpoint: str, call_site: str, model: type):
+        self.endpoint = endpoint
+        self.call_site = call_site
+        self.model = model
+        # Shared with every tracked report of the site, reads after the warm-up still widen the filter.
+        self.used = set()
+        self.calls = 0
+        self.tracked = 0
+        self.full_bytes = 0
+        self.full_responses = 0
+        self.filtered_bytes = 0
+        self.filtered_responses = 0
+
+    def filter(self, safety: tuple) -> str:
+        keep = self.used.union(safety)
+        return ",".join(name for name in field_names(self.model) if name in keep)
+
+    def bytes_saved(self) -> int:
+        if not self.full_responses or not self.filtered_responses:
+            return 0
+        average = self.full_bytes / self.full_responses
+        return max(round(average * self.filtered_responses - self.filtered_bytes), 0)
+
+
+class ProfiledCall:
+    __slots__ = ("site", "filter", "tracked", "_lock")
+
+    def __init__(self, site: _Site, filter: str, tracked: bool, lock: threading.Lock = None):
+        self.site = site
+        self.filter = filter
+        self.tracked = tracked
+        # Lock of the profiler, shared by the calls of every thread
+        self._lock = lock or threading.Lock()
+
+    def decode(self, response: tuple, lazy: bool = False):
+        """Record the size of the response and cast its payload into the model of the call.
+
+        :param response: ``(response, payload)`` as returned by the client requests
+        :type response: tuple
+        :param lazy: Build nested dataclasses on first access, ignored for tracked reports, defaults to False
+        :type lazy: bool, optional
+        :return: The report, recording its field reads when tracked
+        """
+        site = self.site
+        size = _body_size(response[0])
+        if size is not None:
+            with self._lock:
+                if self.filter is None:
+                    site.full_bytes += size
+                    site.full_responses += 1
+                else:
+                    site.filtered_bytes += size
+                    site.filtered_responses += 1
+        if not self.tracked:
+            return decode(site.model, response[1], lazy=lazy)
+        report = _tracked_class(site.model)(**response[1])
+        report._profile_used = site.used
+        return report
+
+
+class AccessProfiler:
+    def __init__(
+        self,
+        warmup: int = 50,
+        resample: int = 100,
+        safety: tuple = SAFETY_FIELDS,
+        per_call_site: bool = False,
+    ):
+        """Learn which fields of the returned reports are read, and only request those.
+
+        The first ``warmup`` reports of each endpoint are fetched whole and record the fields read on them.
+        Later requests send a ``filter`` with the fields read so far, plus the ``safety`` fields.
+        Fields left out of the filter are ``None`` on the returned reports: one request in ``resample``
+        is still fetched whole and tracked, so fields read later on make their way into the filter.
+        Calls given their own ``filter`` or ``fields`` are left alone.
+
+        :param warmup: Whole reports tracked per endpoint before the filter applies, defaults to 50
+        :type warmup: int, optional
+        :param resample: Track one report in ``resample`` after the warm-up, ``0`` never, defaults to 100
+        :type resample: int, optional
+        :param safety: Fields always requested, defaults to ("raw", "station", "time")
+        :type safety: tuple, optional
+        :param per_call_site: Profile each line of code calling the client apart instead of each endpoint, defaults to False
+        :type per_call_site: bool, optional
+        """
+        self.warmup = warmup
+        self.resample = resample
+        self.safety = tuple(safety)
+        self.per_call_site = per_call_site
+        self._sites = {}
+        self._lock = threading.Lock()
+
+    def start(self, endpoint: str, model: type) -> ProfiledCall:
+        """Plan a request of ``endpoint``, before its URL is built.
+
+        :param endpoint: Name of the endpoint, e.g. ``metar``
+        :type endpoint: str
+        :param model: Model the response is cast into
+        :type model: type
+        :return: The call, giving the ``filter`` to send and decoding the response
+        :rtype: ProfiledCall
+        """
+        key = (endpoint, _call_site() if self.per_call_site else None)
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                site = self._sites[key] = _Site(endpoint, key[1], model)
+            site.calls += 1
+            past_warmup = site.calls - self.warmup
+            tracked = past_warmup <= 0 or (
+                self.resample > 0 and past_warmup % self.resample == 0
+            )
+            if tracked:
+                site.tracked += 1
+        return ProfiledCall(site, None if tracked else site.filter(self.safety), tracked, self._lock)
+
+    def report(self) -> list[dict]:
+        """What was learned, per endpoint (and call site).
+
+        :return: ``endpoint``, ``call_site``, ``calls``, ``tracked`` calls, the ``filter`` sent, the ``unused`` fields,
+            the average ``full_bytes`` and ``filtered_bytes`` of a response and the ``bytes_saved`` by the filter
+        :rtype: list[dict]
+        """
+        report = []
+        with self._lock:
+            for site in self._sites.values():
+                report.append(
+                    {
+                        "endpoint": site.endpoint,
+                        "call_site": site.call_site,
+                        "calls": site.calls,
+                        "tracked": site.tracked,
+                        "filter": site.filter(self.safety) if site.calls > self.warmup else None,
+                        "unused": [
+                            name
+                            for name in field_names(site.model)
+                            if name not in site.used and name not in self.safety
+                        ],
+                        "full_bytes": (
+                            site.full_bytes // site.full_responses if site.full_responses else None
+                        ),
+                        "filtered_bytes": (
+                            site.filtered_bytes // site.filtered_responses
+                            if site.filtered_responses
+                            else None
+                        ),
+                        "bytes_saved": site.bytes_saved(),
+                    }
+                )
+        return report
+
+    @property
+    def bytes_saved(self) -> int:
+        """Response bytes saved by the filters so far, estimated from the responses fetched whole.
+
+        :rtype: int
+        """
+        with self._lock:
+            return sum(site.bytes_saved() for site in self._sites.values())
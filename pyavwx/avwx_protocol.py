@@ -0,0 +1,239 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from pyavwx import const
+from pyavwx.avwx_endpoints import ENDPOINTS
+from pyavwx.avwx_exceptions import AvwxBadStatus, AvwxRateLimited, AvwxReportError
+from pyavwx.models import (
+    AirSigmet,
+    Gfs,
+    Metar,
+    NearStation,
+    Nbm,
+    Notam,
+    Pirep,
+    ReportsRoute,
+    Station,
+    StationRoute,
+    Summary,
+    Taf,
+)
+from pyavwx.models.utils import decode
+
+# The protocol of the API without any I/O: a call becomes an ``ApiRequest``,
+# the status and body sent back by any transport become a model.
+
+MULTI_REPORT_MODELS = {"metar": Metar, "taf": Taf, "summary": Summary}
+ROUTE_REPORT_MODELS = {"metar": Metar, "taf": Taf, "airsigmet": AirSigmet, "notam": Notam}
+
+# Model of the response of each endpoint, None when it depends on ``report_type``
+RESPONSE_MODELS = {
+    "station": Station,
+    "near_stations": NearStation,
+    "stations_text": Station,
+    "stations_route": StationRoute,
+    "summary": Summary,
+    "metar": Metar,
+    "taf": Taf,
+    "multi": None,
+    "near_reports": None,
+    "reports_text": None,
+    "reports_route": ReportsRoute,
+    "pirep": Pirep,
+    "airsigmet": AirSigmet,
+    "notam": Notam,
+    "nbm": Nbm,
+    "gfs": Gfs,
+    "parse_metar": Metar,
+    "parse_taf": Taf,
+    "parse_pirep": Pirep,
+    "parse_airsigmet": AirSigmet,
+    "parse_notam": Notam,
+    "parse_nbm": Nbm,
+    "parse_gfs": Gfs,
+}
+
+
+@dataclass(slots=True)
+class ApiRequest:
+    method: str
+    url: str
+    data: str = None
+    # Endpoint and values the request was built from, used to decode its response
+    endpoint: str = None
+    model: type = None
+    values: dict = None
+    # Sent along by the transports, the clients set the API key here
+    headers: dict = None
+
+
+@dataclass(slots=True)
+class ApiResponse:
+    status: int
+    body: bytes
+    headers: dict = field(default_factory=dict)
+
+    @property
+    def content(self) -> bytes:
+        # Same name as on a requests.Response
+        return self.body
+
+
+def response_model(endpoint: str, report_type: str = None) -> type:
+    """Model of the response of an endpoint.
+
+    :param endpoint: Name of the endpoint in ``ENDPOINTS``
+    :type endpoint: str
+    :param report_type: Report type of the ``multi``, ``near_reports`` and ``reports_text`` endpoints, defaults to None
+    :type report_type: str, optional
+    :raises ValueError: Unknown endpoint or report type
+    :rtype: type
+    """
+    if endpoint not in RESPONSE_MODELS:
+        raise ValueError(f"Unknown endpoint : {endpoint}")
+    model = RESPONSE_MODELS[endpoint]
+    if model is not None:
+        return model
+    models = MULTI_REPORT_MODELS if endpoint == "multi" else ROUTE_REPORT_MODELS
+    if report_type not in models:
+        raise ValueError(f"Unknown report type : {report_type}")
+    return models[report_type]
+
+
+def build_request(
+    endpoint: str,
+    data: str = None,
+    url_modifier: str = None,
+    base_url: str = None,
+    model: type = None,
+    **values,
+) -> ApiRequest:
+    """Turn a call into the request to send, without sending it.
+
+    Requests can be built anywhere, sent together by any transport, and their responses
+    decoded with ``parse_response``.
+
+    :param endpoint: Name of the endpoint in ``ENDPOINTS``, e.g. ``metar``
+    :type endpoint: str
+    :param data: Body of the request, the report of ``parse_`` endpoints, defaults to None
+    :type data: str, optional
+    :param url_modifier: Route replacing the default one of the endpoint, defaults to None
+    :type url_modifier: str, optional
+    :param base_url: Root of the API, defaults to None for the avwx.rest API
+    :type base_url: str, optional
+    :param model: Model the response is cast into, e.g. a projection, defaults to None for the model of the endpoint
+    :type model: type, optional
+    :param values: Path and query values, named as the arguments of the client methods
+    :raises ValueError: Unknown endpoint or report type
+    :return: The request
+    :rtype: ApiRequest
+    """
+    if endpoint not in ENDPOINTS:
+        raise ValueError(f"Unknown endpoint : {endpoint}")
+    spec = ENDPOINTS[endpoint]
+    url = spec.url(const.BASE_URL if base_url is None else base_url, url_modifier, **values)
+    if model is None:
+        model = response_model(endpoint, values.get("report_type"))
+    return ApiRequest(spec.method, url, data, endpoint, model, values)
+
+
+def read_payload(response: ApiResponse, decoder: Callable[[bytes], Any] = json.loads) -> Any:
+    """Check the status of a response and parse its JSON body.
+
+    :param response: Status, body and headers sent back
+    :type response: ApiResponse
+    :param decoder: Parser of the body, defaults to json.loads
+    :type decoder: Callable[[bytes], Any], optional
+    :raises AvwxRateLimited: The API answered with a 429
+    :raises AvwxBadStatus: The API answered with another error
+    :return: The parsed body
+    """
+    if response.status == 429:
+        raise AvwxRateLimited(
+            status_code=response.status,
+            body=response.body,
+            decoder=decoder,
+            retry_after=response.headers.get("Retry-After"),
+        )
+    if response.status != 200:
+        raise AvwxBadStatus(status_code=response.status, body=response.body, decoder=decoder)
+    return decoder(response.body)
+
+
+def decode_multi_reports(
+    report_type: str,
+    locations: list[str],
+    payload: list | dict,
+    lazy: bool = False,
+    model: type = None,
+) -> dict[str, Metar | Taf | Summary | AvwxReportError]:
+    # The multi endpoint answers with one element per requested location, in order.
+    # Elements are matched by their ``station`` if the API skipped some of them.
+    # ``model`` overrides the model of ``report_type``, e.g. with a projection.
+    model = model or MULTI_REPORT_MODELS[report_type]
+    if isinstance(payload, dict):
+        elements = [payload.get(location) for location in locations]
+    elif len(payload) == len(locations):
+        elements = payload
+    else:
+        by_station = {
+            element.get("station"): element
+            for element in payload
+            if isinstance(element, dict)
+        }
+        elements = [by_station.get(location) for location in locations]
+
+    reports = {}
+    for location, element in zip(locations, elements):
+        if not isinstance(element, dict):
+            reports[location] = AvwxReportError(location)
+        elif "error" in element:
+            reports[location] = AvwxReportError(location, element["error"])
+        else:
+            reports[location] = decode(model, element, lazy=lazy)
+    return reports
+
+
+def parse_payload(request: ApiRequest, payload: Any, lazy: bool = False) -> Any:
+    """Cast the parsed body of a response into the model of its request.
+
+    :param request: The request the payload answers
+    :type request: ApiRequest
+    :param payload: Parsed body of the response
+    :param lazy: Build nested dataclasses on first access, defaults to False
+    :type lazy: bool, optional
+    :return: A model, a list of models for list endpoints, a dict of reports by location for ``multi``
+    """
+    if request.model is None:
+        return payload
+    if request.endpoint == "multi":
+        locations = [location.strip() for location in request.values["locations"].split(",")]
+        return decode_multi_reports(
+            request.values["report_type"], locations, payload, lazy=lazy, model=request.model
+        )
+    if isinstance(payload, list):
+        return [decode(request.model, element, lazy=lazy) for element in payload]
+    return decode(request.model, payload, lazy=lazy)
+
+
+def parse_response(
+    request: ApiRequest,
+    response: ApiResponse,
+    decoder: Callable[[bytes], Any] = json.loads,
+    lazy: bool = False,
+) -> Any:
+    """Turn the response of a request into its model.
+
+    :param request: The request sent
+    :type request: ApiRequest
+    :param response: Status, body and headers sent back
+    :type response: ApiResponse
+    :param decoder: Parser of the body, defaults to json.loads
+    :type decoder: Callable[[bytes], Any], optional
+    :param lazy: Build nested dataclasses on first access, defaults to False
+    :type lazy: bool, optional
+    :raises AvwxBadStatus: The API answered with an error
+    :return: See ``parse_payload``
+    """
+    return parse_payload(request, read_payload(response, decoder), lazy=lazy)
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+SECONDS_PER_DAY = 86400
+
+
+class _Bucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        # Takes a token, letting the balance go negative: the debt is the wait of the caller.
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class _Window:
+    __slots__ = ("limit", "period", "sent")
+
+    def __init__(self, limit: int, period: float):
+        self.limit = limit
+        self.period = period
+        # Times the requests were, or will be, sent at
+        self.sent = deque()
+
+    def reserve(self, at: float) -> float:
+        # Earliest time from ``at`` with less than ``limit`` requests over the last ``period``
+        sent = self.sent
+        while sent and sent[0] <= at - self.period:
+            sent.popleft()
+        if len(sent) >= self.limit:
+            at = max(at, sent[-self.limit] + self.period)
+        sent.append(at)
+        return at
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        per_second: float = None,
+        per_day: int = None,
+        burst: int = None,
+        max_retries: int = 5,
+        default_retry_after: float = 1,
+    ):
+        """Token bucket limiting the requests sent with an API key.
+
+        Callers over the limit are queued, each one waiting for its turn instead of failing.
+        A ``429 Too Many Requests`` pauses every caller for its ``Retry-After`` before the request is retried.
+        Share one limiter between the clients using the same API key.
+
+        :param per_second: Requests per second, defaults to None for no limit
+        :type per_second: float, optional
+        :param per_day: Requests over any 24 hours, defaults to None for no limit
+        :type per_day: int, optional
+        :param burst: Requests sent at once before ``per_second`` applies, defaults to None for ``per_second`` rounded up
+        :type burst: int, optional
+        :param max_retries: Times a request answered with a 429 is retried before the error is raised, defaults to 5
+        :type max_retries: int, optional
+        :param default_retry_after: Seconds to pause on a 429 without a ``Retry-After``, defaults to 1
+        :type default_retry_after: float, optional
+        """
+        now = time.monotonic()
+        self._buckets = []
+        if per_second is not None:
+            capacity = burst if burst is not None else max(1, -int(-per_second // 1))
+            self._buckets.append(_Bucket(per_second, capacity, now))
+        # A bucket would start full and refill on top of it, letting twice ``per_day`` through the first day.
+        self._day = _Window(per_day, SECONDS_PER_DAY) if per_day is not None else None
+        self.max_retries = max_retries
+        self.default_retry_after = default_retry_after
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take the next slot.
+
+        :return: Seconds to wait before sending the request
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self.blocked_until - now, 0.0)
+            for bucket in self._buckets:
+                wait = max(wait, bucket.reserve(now))
+            if self._day is not None:
+                wait = self._day.reserve(now + wait) - now
+            return wait
+
+    def acquire(self):
+        """Block until a request can be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait, without blocking the event loop, until a request can be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def throttle(self, retry_after: float = None):
+        """Pause every caller after the API answered with a 429.
+
+        :param retry_after: Seconds given by the ``Retry-After`` header, defaults to None for ``default_retry_after``
+        :type retry_after: float, optional
+        """
+        if retry_after is None:
+            retry_after = self.default_retry_after
+        with self._lock:
+            self.throttled += 1
+            self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
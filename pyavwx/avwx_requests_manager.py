@@ -1,9 +1,98 @@
+import asyncio
 import json
+from typing import Any, AsyncIterator, Callable, Iterator
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 
-from pyavwx.avwx_authentication import AvwxApiAuth
-from pyavwx.avwx_exceptions import AvwxBadStatus
+from pyavwx.avwx_authentication import AvwxApiAuth, format_auth_header
+from pyavwx.avwx_exceptions import AvwxBadStatus, AvwxRateLimited, AvwxTimeout
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def get_json_decoder(decoder: str | Callable = "auto") -> Callable[[bytes], Any]:
+    """Resolve the function used to parse the raw bytes of a response.
+
+    :param decoder: ``"json"``, ``"orjson"``, ``"msgspec"``, any callable taking bytes,
+        or ``"auto"`` to pick the fastest installed one, defaults to "auto"
+    :type decoder: str | Callable, optional
+    :return: A function parsing JSON bytes
+    :rtype: Callable[[bytes], Any]
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == "auto":
+        if orjson is not None:
+            return orjson.loads
+        if msgspec is not None:
+            return msgspec.json.decode
+        return json.loads
+    if decoder == "json":
+        return json.loads
+    if decoder == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        return orjson.loads
+    if decoder == "msgspec":
+        if msgspec is None:
+            raise ImportError("msgspec is not installed")
+        return msgspec.json.decode
+    raise ValueError(f"Unknown JSON decoder : {decoder!r}")
+
+
+def _timeout_message(timeout: float = None) -> str:
+    return "Request timed out" if timeout is None else f"No response within {timeout:.3g}s"
+
+
+def create_session(
+    auth: AvwxApiAuth = None,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """Create a ``requests.Session`` backed by a keep-alive connection pool.
+
+    :param auth: Authentication attached to every request of the session, defaults to None
+    :type auth: AvwxApiAuth, optional
+    :param pool_connections: Number of per-host pools to keep, defaults to 10
+    :type pool_connections: int, optional
+    :param pool_maxsize: Maximum number of connections kept per host, defaults to 10
+    :type pool_maxsize: int, optional
+    :param pool_block: Block when no connection is free instead of opening a throwaway one, defaults to False
+    :type pool_block: bool, optional
+    :param keep_alive: Keep connections open between requests, defaults to True
+    :type keep_alive: bool, optional
+    :return: A session ready to be shared between threads
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    session.auth = auth
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
 
 
 def makeRequest(
@@ -12,16 +101,157 @@ def makeRequest(
     data: str = None,
     rjson: bool = True,
     method: str = "GET",
+    session: requests.Session = None,
+    decoder: Callable[[bytes], Any] = json.loads,
+    timeout: float = None,
 ) -> tuple:
-    if method == "GET":
-        r = requests.get(url=url, auth=auth, data=data)
-    elif method == "POST":
-        r = requests.post(url=url, auth=auth, data=data)
+    # Without a session every call opens (and tears down) its own connection.
+    http = session if session is not None else requests
+    try:
+        if method == "GET":
+            r = http.get(url=url, auth=auth, data=data, timeout=timeout)
+        elif method == "POST":
+            r = http.post(url=url, auth=auth, data=data, timeout=timeout)
+        else:
+            raise AttributeError("Method incorrect : not 'POST' or 'GET'")
+    except requests.Timeout:
+        raise AvwxTimeout(_timeout_message(timeout), url) from None
+    if r.status_code == requests.codes.too_many_requests:
+        raise AvwxRateLimited(request=r, decoder=decoder)
+    if r.status_code != requests.codes.ok:
+        raise AvwxBadStatus(request=r, decoder=decoder)
+    if rjson:
+        # Parsing the bytes skips decoding the body to str and sniffing its charset.
+        return r, decoder(r.content)
     else:
+        return (r,)
+
+
+def streamRequest(
+    url: str,
+    auth: AvwxApiAuth,
+    session: requests.Session = None,
+    decoder: Callable[[bytes], Any] = json.loads,
+    timeout: float = None,
+    chunk_size: int = 65536,
+) -> Iterator[bytes]:
+    # GET whose body is handed out in chunks as it arrives instead of being buffered.
+    # ``timeout`` bounds the connection and each read, not the whole download.
+    http = session if session is not None else requests
+    try:
+        r = http.get(url=url, auth=auth, timeout=timeout, stream=True)
+    except requests.Timeout:
+        raise AvwxTimeout(_timeout_message(timeout), url) from None
+    with r:
+        if r.status_code == requests.codes.too_many_requests:
+            raise AvwxRateLimited(request=r, decoder=decoder)
+        if r.status_code != requests.codes.ok:
+            raise AvwxBadStatus(request=r, decoder=decoder)
+        try:
+            yield from r.iter_content(chunk_size)
+        except requests.exceptions.ConnectionError as e:
+            # requests reports a read timeout while streaming as a connection error
+            if not (e.args and isinstance(e.args[0], urllib3.exceptions.ReadTimeoutError)):
+                raise
+            raise AvwxTimeout(_timeout_message(timeout), url) from None
+
+
+def create_async_session(
+    auth: AvwxApiAuth = None,
+    pool_maxsize: int = 100,
+    pool_maxsize_per_host: int = 0,
+    keep_alive: bool = True,
+    keepalive_timeout: float = 15,
+) -> "aiohttp.ClientSession":
+    """Create an ``aiohttp.ClientSession`` backed by a keep-alive connection pool.
+
+    Must be called while an event loop is running.
+
+    :param auth: Authentication sent with every request of the session, defaults to None
+    :type auth: AvwxApiAuth, optional
+    :param pool_maxsize: Maximum number of simultaneous connections, defaults to 100
+    :type pool_maxsize: int, optional
+    :param pool_maxsize_per_host: Maximum number of simultaneous connections per host, 0 means no limit, defaults to 0
+    :type pool_maxsize_per_host: int, optional
+    :param keep_alive: Keep connections open between requests, defaults to True
+    :type keep_alive: bool, optional
+    :param keepalive_timeout: Seconds an idle connection is kept open, defaults to 15
+    :type keepalive_timeout: float, optional
+    :return: A session shared by every coroutine of the client
+    :rtype: aiohttp.ClientSession
+    """
+    if aiohttp is None:
+        raise ImportError(
+            "aiohttp is required for the async client, install it with 'pip install pyavwx-wrapper[async]'"
+        )
+    connector = aiohttp.TCPConnector(
+        limit=pool_maxsize,
+        limit_per_host=pool_maxsize_per_host,
+        force_close=not keep_alive,
+        keepalive_timeout=keepalive_timeout if keep_alive else None,
+    )
+    headers = format_auth_header(auth.api_key) if auth is not None else None
+    return aiohttp.ClientSession(connector=connector, headers=headers)
+
+
+async def makeAsyncRequest(
+    url: str,
+    session: "aiohttp.ClientSession",
+    data: str = None,
+    rjson: bool = True,
+    method: str = "GET",
+    decoder: Callable[[bytes], Any] = json.loads,
+    timeout: float = None,
+) -> tuple:
+    if method not in ("GET", "POST"):
         raise AttributeError("Method incorrect : not 'POST' or 'GET'")
-    if r.status_code != requests.codes.ok:
-        raise AvwxBadStatus(request=r)
+    # Without a timeout, the one of the session applies.
+    options = {} if timeout is None else {"timeout": aiohttp.ClientTimeout(total=timeout)}
+    try:
+        async with session.request(method, url, data=data, **options) as r:
+            body = await r.read()
+    except asyncio.TimeoutError:
+        raise AvwxTimeout(_timeout_message(timeout), url) from None
+    if r.status == requests.codes.too_many_requests:
+        raise AvwxRateLimited(
+            status_code=r.status,
+            body=body,
+            decoder=decoder,
+            retry_after=r.headers.get("Retry-After"),
+        )
+    if r.status != requests.codes.ok:
+        raise AvwxBadStatus(status_code=r.status, body=body, decoder=decoder)
     if rjson:
-        return r, json.loads(r.text)
+        return r, decoder(body)
     else:
         return (r,)
+
+
+async def streamAsyncRequest(
+    url: str,
+    session: "aiohttp.ClientSession",
+    decoder: Callable[[bytes], Any] = json.loads,
+    timeout: float = None,
+    chunk_size: int = 65536,
+) -> AsyncIterator[bytes]:
+    # GET whose body is handed out in chunks as it arrives instead of being buffered.
+    # ``timeout`` bounds the connection and each read, not the whole download.
+    options = {}
+    if timeout is not None:
+        options["timeout"] = aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout)
+    try:
+        async with session.get(url, **options) as r:
+            if r.status != requests.codes.ok:
+                body = await r.read()
+                if r.status == requests.codes.too_many_requests:
+                    raise AvwxRateLimited(
+                        status_code=r.status,
+                        body=body,
+                        decoder=decoder,
+                        retry_after=r.headers.get("Retry-After"),
+                    )
+                raise AvwxBadStatus(status_code=r.status, body=body, decoder=decoder)
+            async for chunk in r.content.iter_chunked(chunk_size):
+                yield chunk
+    except asyncio.TimeoutError:
+        raise AvwxTimeout(_timeout_message(timeout), url) from None
@@ -0,0 +1,229 @@
+import contextvars
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from pyavwx.avwx_exceptions import (
+    AvwxBadStatus,
+    AvwxCircuitOpen,
+    AvwxRateLimited,
+    AvwxTimeout,
+)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+# Statuses of an upstream failing for a while, worth retrying.
+TRANSIENT_STATUSES = frozenset((500, 502, 503, 504))
+
+_CONNECTION_ERRORS = (OSError,) + ((aiohttp.ClientConnectionError,) if aiohttp else ())
+
+# Monotonic time by which the requests of the current context have to be answered.
+_deadline = contextvars.ContextVar("pyavwx_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float):
+    """Bound every request made inside the block, retries included, to ``seconds`` from now.
+
+    Works with both clients, threads and asyncio tasks each see their own deadline.
+    A nested deadline can't extend the one around it.
+
+    :param seconds: Time budget of the block
+    :type seconds: float
+    """
+    at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(at if current is None else min(at, current))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline, ``None`` outside of ``deadline``.
+
+    :rtype: float | None
+    """
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def request_timeout(timeout: float = None) -> float | None:
+    """Timeout of the next request: the client timeout, shortened to the current deadline.
+
+    :param timeout: Client-wide timeout in seconds, defaults to None
+    :type timeout: float, optional
+    :raises AvwxTimeout: The deadline has already passed
+    :return: Timeout in seconds, ``None`` for no timeout
+    :rtype: float | None
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise AvwxTimeout("Deadline exceeded")
+    return left if timeout is None else min(timeout, left)
+
+
+def is_transient(error: Exception) -> bool:
+    """Whether a request failed because of the upstream or the network, rather than the request itself.
+
+    :param error: Raised by the request
+    :type error: Exception
+    :rtype: bool
+    """
+    if isinstance(error, AvwxRateLimited):
+        return False
+    if isinstance(error, AvwxBadStatus):
+        return error.status in TRANSIENT_STATUSES
+    return isinstance(error, (AvwxTimeout, *_CONNECTION_ERRORS))
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10,
+        methods: tuple = ("GET",),
+    ):
+        """Retry requests failing with a timeout, a connection error or a 5xx status.
+
+        Retry ``n`` waits a random time up to ``backoff * 2 ** n`` seconds ("full jitter"),
+        so clients failing together don't retry together. No retry waits past the current ``deadline``.
+
+        :param max_retries: Retries of a request before the error is raised, defaults to 3
+        :type max_retries: int, optional
+        :param backoff: Base of the exponential backoff in seconds, defaults to 0.5
+        :type backoff: float, optional
+        :param max_backoff: Longest wait between two attempts in seconds, defaults to 10
+        :type max_backoff: float, optional
+        :param methods: Idempotent HTTP methods that can be retried, defaults to ("GET",)
+        :type methods: tuple, optional
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.methods = methods
+
+    def delay(self, method: str, retry: int, error: Exception) -> float | None:
+        """Seconds to wait before retrying a failed request.
+
+        :param method: HTTP method of the request
+        :type method: str
+        :param retry: Number of retries already made
+        :type retry: int
+        :param error: Raised by the request
+        :type error: Exception
+        :return: The wait, ``None`` when the request mustn't be retried
+        :rtype: float | None
+        """
+        if method not in self.methods or retry >= self.max_retries or not is_transient(error):
+            return None
+        wait = random.uniform(0, min(self.max_backoff, self.backoff * 2**retry))
+        left = remaining()
+        if left is not None and wait >= left:
+            return None
+        return wait
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_ratio: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30,
+        serve_stale: bool = True,
+    ):
+        """Stop calling the API once too many of the last requests failed.
+
+        Only timeouts, connection errors and 5xx statuses count as failures.
+        While open, requests fail fast with ``AvwxCircuitOpen``, or get the expired response of the client
+        ``ResponseCache`` when ``serve_stale`` is set. After ``reset_timeout``, a single trial request
+        is let through: its success closes the circuit, its failure opens it again.
+
+        :param failure_ratio: Ratio of failures opening the circuit, defaults to 0.5
+        :type failure_ratio: float, optional
+        :param window: Number of last requests the ratio is computed on, defaults to 20
+        :type window: int, optional
+        :param min_calls: Requests needed in the window before the circuit can open, defaults to 10
+        :type min_calls: int, optional
+        :param reset_timeout: Seconds the circuit stays open before a trial request, defaults to 30
+        :type reset_timeout: float, optional
+        :param serve_stale: Serve expired cached responses while open, defaults to True
+        :type serve_stale: bool, optional
+        """
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.serve_stale = serve_stale
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._outcomes = deque(maxlen=window)
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Check a request can be sent.
+
+        :raises AvwxCircuitOpen: The circuit is open, or its trial request is in flight
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            retry_in = self.opened_at + self.reset_timeout - time.monotonic()
+            if self.state == self.OPEN and retry_in <= 0:
+                self.state = self.HALF_OPEN
+                self._trial = False
+            if self.state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return
+            raise AvwxCircuitOpen(max(retry_in, 0.0))
+
+    def record(self, success: bool):
+        """Record the outcome of a request let through by ``before_call``.
+
+        :param success: Whether the upstream answered, even with an error of the request itself
+        :type success: bool
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                if success:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._open()
+                return
+            self._outcomes.append(success)
+            failures = self._outcomes.count(False)
+            if (
+                len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_ratio
+            ):
+                self._open()
+
+    def release(self):
+        """Give back a request let through by ``before_call`` without an outcome, e.g. a cancelled one.
+
+        A half-open circuit lets its next request through as the trial.
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._trial = False
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self._trial = False
+        self._outcomes.clear()
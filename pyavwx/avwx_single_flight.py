@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable, Hashable
+
+from pyavwx.avwx_exceptions import AvwxTimeout
+
+
+class SingleFlight:
+    def __init__(self):
+        """Coalesce identical calls made at the same time from several threads.
+
+        The first caller of a key runs the call, every caller arriving while it is in flight
+        waits for it and gets the same result, or the same exception.
+        """
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable, timeout: float = None):
+        """Run ``fn``, unless a call with the same key is already in flight.
+
+        :param key: Identity of the call, e.g. ``(method, url, data)``
+        :type key: Hashable
+        :param fn: The call, without arguments
+        :type fn: Callable
+        :param timeout: Longest wait for the call in flight of another caller, defaults to None
+        :type timeout: float, optional
+        :raises AvwxTimeout: The call in flight didn't end within ``timeout``
+        :return: What ``fn`` returned
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            try:
+                return future.result(timeout)
+            except FutureTimeoutError:
+                # The call keeps going for the others
+                raise AvwxTimeout("Deadline exceeded") from None
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._calls[key]
+        future.set_result(result)
+        return result
+
+
+class AsyncSingleFlight:
+    def __init__(self):
+        """Coalesce identical calls made at the same time from several tasks.
+
+        The call runs in its own task: a caller being cancelled doesn't cancel it for the others.
+        """
+        self._calls = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Every waiter may have been cancelled, the exception is retrieved so it isn't logged.
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable], timeout: float = None):
+        """Await ``fn()``, unless a call with the same key is already in flight.
+
+        :param key: Identity of the call, e.g. ``(method, url, data)``
+        :type key: Hashable
+        :param fn: The coroutine function of the call, without arguments
+        :type fn: Callable[[], Awaitable]
+        :param timeout: Longest wait for the call, defaults to None
+        :type timeout: float, optional
+        :raises AvwxTimeout: The call didn't end within ``timeout``
+        :return: What ``fn()`` returned
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._done(key, done))
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            # Only the shield is cancelled, the call keeps going for the others
+            raise AvwxTimeout("Deadline exceeded") from None
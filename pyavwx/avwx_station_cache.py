@@ -0,0 +1,117 @@
+import json
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS info (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class StationCache:
+    def __init__(self, path: str = "pyavwx_stations.sqlite", lifetime: float = 604800):
+        """Persistent SQLite cache for the station endpoints.
+
+        Responses of ``get_station``, ``get_near_stations`` and ``get_stations_text`` are stored
+        on disk, so they survive restarts and can be shared by several processes.
+        The whole cache is dropped when the API reports a new ``Meta.stations_updated``.
+
+        :param path: Path of the SQLite database, ``":memory:"`` keeps it in memory, defaults to "pyavwx_stations.sqlite"
+        :type path: str, optional
+        :param lifetime: Seconds a cached response stays valid, defaults to 604800 (one week)
+        :type lifetime: float, optional
+        """
+        self.path = path
+        self.lifetime = lifetime
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            if path != ":memory:":
+                # WAL lets other processes read while one of them writes.
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+        self._stations_updated = self._get_info("stations_updated")
+
+    def _get_info(self, name: str) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM info WHERE name = ?", (name,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get(self, key: str):
+        """Get a cached response, ``None`` if it is missing or older than ``lifetime``.
+
+        :param key: URL of the request
+        :type key: str
+        :return: The cached JSON payload
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] + self.lifetime <= time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, payload):
+        """Cache a response.
+
+        :param key: URL of the request
+        :type key: str
+        :param payload: JSON payload of the response
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, fetched_at) VALUES (?, ?, ?)",
+                (key, json.dumps(payload), time.time()),
+            )
+
+    def observe(self, payload):
+        """Invalidate the cache if a response carries a new ``meta.stations_updated``.
+
+        :param payload: JSON payload of any API response
+        """
+        if not isinstance(payload, dict) or not isinstance(payload.get("meta"), dict):
+            return
+        stations_updated = payload["meta"].get("stations_updated")
+        if stations_updated is None or stations_updated == self._stations_updated:
+            return
+        with self._lock, self._connection:
+            if self._stations_updated is not None:
+                self._connection.execute("DELETE FROM responses")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO info (name, value) VALUES ('stations_updated', ?)",
+                (stations_updated,),
+            )
+        self._stations_updated = stations_updated
+
+    def purge(self) -> int:
+        """Delete the responses older than ``lifetime``.
+
+        :return: Number of deleted responses
+        :rtype: int
+        """
+        with self._lock, self._connection:
+            return self._connection.execute(
+                "DELETE FROM responses WHERE fetched_at <= ?",
+                (time.time() - self.lifetime,),
+            ).rowcount
+
+    def clear(self):
+        """Delete every cached response."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,380 @@
+import heapq
+import math
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+from pyavwx.models import NearStation, Station, StationRoute
+from pyavwx.models.station import Route
+from pyavwx.models.structs import Meta
+
+EARTH_RADIUS_NM = 3440.065
+NM_TO_MILES = 1.150779
+NM_TO_KM = 1.852
+
+AIRPORT_TYPES = frozenset(("large_airport", "medium_airport", "small_airport"))
+
+
+def to_cartesian(lat: float, lon: float) -> tuple[float, float, float]:
+    """Point of the unit sphere for a coordinate pair in degrees.
+
+    :param lat: Latitude
+    :type lat: float
+    :param lon: Longitude
+    :type lon: float
+    :return: ``(x, y, z)``
+    :rtype: tuple[float, float, float]
+    """
+    lat, lon = math.radians(lat), math.radians(lon)
+    cos_lat = math.cos(lat)
+    return cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat)
+
+
+def chord_to_angle(chord: float) -> float:
+    # The chord between two points of the unit sphere gives their great circle angle, in radians.
+    return 2 * math.asin(min(chord / 2, 1.0))
+
+
+def chord_to_nm(chord: float) -> float:
+    return chord_to_angle(chord) * EARTH_RADIUS_NM
+
+
+def nm_to_chord(nm: float) -> float:
+    return 2 * math.sin(min(nm / EARTH_RADIUS_NM, math.pi) / 2)
+
+
+def _dot(a, b) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a, b) -> tuple[float, float, float]:
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def _angle(a, b) -> float:
+    # Angle between two points of the unit sphere, atan2 stays accurate for close points.
+    return math.atan2(math.sqrt(sum(c * c for c in _cross(a, b))), _dot(a, b))
+
+
+def _slerp(a, b, angle: float, t: float) -> tuple[float, float, float]:
+    if angle < 1e-12:
+        return a
+    wa, wb = math.sin((1 - t) * angle) / math.sin(angle), math.sin(t * angle) / math.sin(angle)
+    return tuple(wa * ca + wb * cb for ca, cb in zip(a, b))
+
+
+def leg_distance(point, start, end) -> tuple[float, float]:
+    """Distance of a point to a great circle leg, all given as points of the unit sphere.
+
+    :return: ``(distance, along)``: distance to the leg in radians,
+        and how far along the leg the closest point is, in radians from ``start``
+    :rtype: tuple[float, float]
+    """
+    length = _angle(start, end)
+    normal = _cross(start, end)
+    norm = math.sqrt(_dot(normal, normal))
+    if norm > 1e-12:
+        normal = tuple(c / norm for c in normal)
+        cross_track = math.asin(max(-1.0, min(1.0, _dot(point, normal))))
+        # The projection of the point on the great circle, is it between start and end?
+        projected = tuple(p - _dot(point, normal) * c for p, c in zip(point, normal))
+        if _dot(_cross(start, projected), normal) >= 0 and _dot(_cross(projected, end), normal) >= 0:
+            return abs(cross_track), _angle(start, projected)
+    to_start, to_end = _angle(point, start), _angle(point, end)
+    return (to_start, 0.0) if to_start <= to_end else (to_end, length)
+
+
+def parse_coords(coords: str) -> tuple[float, float]:
+    """Parse a ``lat,lon`` coordinate pair as given to the API.
+
+    :param coords: Coordinate pair, e.g. ``28.1,-81.``
+    :type coords: str
+    :return: ``(lat, lon)``
+    :rtype: tuple[float, float]
+    """
+    lat, lon = coords.split(",")
+    return float(lat), float(lon)
+
+
+class StationIndex:
+    def __init__(self, stations: Iterable[Station] = ()):
+        """Local index of stations answering nearest-station queries without calling the API.
+
+        Stations are stored as points of the unit sphere in a KD-tree, so a query only visits
+        the few branches that can hold a closer station. Distances are great circle distances.
+        Stations without ``latitude``/``longitude`` are skipped.
+
+        :param stations: Stations to index, e.g. from ``get_stations_text`` or a ``StationCache``, defaults to ()
+        :type stations: Iterable[Station], optional
+        """
+        self.stations = []
+        self._points = []
+        self._idents = {}
+        self._tree = None
+        self.update(stations)
+
+    def __len__(self):
+        return len(self.stations)
+
+    def update(self, stations: Iterable[Station]):
+        """Add stations to the index, replacing those already indexed with the same ICAO.
+
+        :param stations: Stations to index
+        :type stations: Iterable[Station]
+        """
+        by_icao = {station.icao or id(station): station for station in self.stations}
+        for station in stations:
+            if station.latitude is None or station.longitude is None:
+                continue
+            by_icao[station.icao or id(station)] = station
+        self.stations = list(by_icao.values())
+        self._points = [
+            to_cartesian(station.latitude, station.longitude) for station in self.stations
+        ]
+        self._idents = {}
+        for station in self.stations:
+            for ident in (station.gps, station.iata, station.icao):
+                if ident:
+                    self._idents[ident.upper()] = station
+        self._tree = self._build(list(range(len(self.stations))), 0)
+
+    def _build(self, indexes: list[int], depth: int):
+        # Node: (station index, split axis, left subtree, right subtree)
+        if not indexes:
+            return None
+        axis = depth % 3
+        indexes.sort(key=lambda i: self._points[i][axis])
+        middle = len(indexes) // 2
+        return (
+            indexes[middle],
+            axis,
+            self._build(indexes[:middle], depth + 1),
+            self._build(indexes[middle + 1 :], depth + 1),
+        )
+
+    def get(self, ident: str) -> Station | None:
+        """Get an indexed station by ICAO, IATA or GPS code.
+
+        :param ident: Station code
+        :type ident: str
+        :return: The station, ``None`` if it isn't indexed
+        :rtype: Station | None
+        """
+        return self._idents.get(ident.upper())
+
+    @staticmethod
+    def _predicate(airport: bool, reporting: bool) -> Callable[[Station], bool] | None:
+        if not airport and not reporting:
+            return None
+        return lambda station: (not airport or station.type in AIRPORT_TYPES) and (
+            not reporting or bool(station.reporting)
+        )
+
+    def _near_station(self, index: int, chord: float) -> NearStation:
+        angle = chord_to_angle(chord)
+        nautical_miles = angle * EARTH_RADIUS_NM
+        return NearStation(
+            station=self.stations[index],
+            # In degrees, like the API
+            coordinate_distance=math.degrees(angle),
+            nautical_miles=nautical_miles,
+            miles=nautical_miles * NM_TO_MILES,
+            kilometers=nautical_miles * NM_TO_KM,
+        )
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        n: int = 10,
+        airport: bool = False,
+        reporting: bool = False,
+    ) -> list[NearStation]:
+        """Get the ``n`` stations closest to a coordinate pair, closest first.
+
+        :param lat: Latitude
+        :type lat: float
+        :param lon: Longitude
+        :type lon: float
+        :param n: Number of stations to return, defaults to 10
+        :type n: int, optional
+        :param airport: Only include airports, defaults to False
+        :type airport: bool, optional
+        :param reporting: Only include reporting stations, defaults to False
+        :type reporting: bool, optional
+        :return: Nearest stations with their distance
+        :rtype: list[NearStation]
+        """
+        target = to_cartesian(lat, lon)
+        accept = self._predicate(airport, reporting)
+        points, stations = self._points, self.stations
+        # Max-heap of the best candidates so far, as (-squared distance, station index)
+        best = []
+
+        def visit(node):
+            if node is None:
+                return
+            index, axis, left, right = node
+            point = points[index]
+            if accept is None or accept(stations[index]):
+                distance = (
+                    (point[0] - target[0]) ** 2
+                    + (point[1] - target[1]) ** 2
+                    + (point[2] - target[2]) ** 2
+                )
+                if len(best) < n:
+                    heapq.heappush(best, (-distance, index))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, index))
+            delta = target[axis] - point[axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            visit(near)
+            if len(best) < n or delta * delta < -best[0][0]:
+                visit(far)
+
+        if n > 0:
+            visit(self._tree)
+        return [
+            self._near_station(index, math.sqrt(-distance))
+            for distance, index in sorted(best, reverse=True)
+        ]
+
+    def _within_indexes(self, target, limit: float, accept=None) -> list[tuple[float, int]]:
+        # (squared chord, station index) of the stations with a squared chord up to ``limit``
+        points, stations = self._points, self.stations
+        found = []
+        pending = [self._tree]
+        while pending:
+            node = pending.pop()
+            if node is None:
+                continue
+            index, axis, left, right = node
+            point = points[index]
+            distance = (
+                (point[0] - target[0]) ** 2
+                + (point[1] - target[1]) ** 2
+                + (point[2] - target[2]) ** 2
+            )
+            if distance <= limit and (accept is None or accept(stations[index])):
+                found.append((distance, index))
+            delta = target[axis] - point[axis]
+            pending.append(left if delta < 0 else right)
+            if delta * delta <= limit:
+                pending.append(right if delta < 0 else left)
+        return found
+
+    def within(
+        self,
+        lat: float,
+        lon: float,
+        radius: float,
+        airport: bool = False,
+        reporting: bool = False,
+    ) -> list[NearStation]:
+        """Get every station within a radius of a coordinate pair, closest first.
+
+        :param lat: Latitude
+        :type lat: float
+        :param lon: Longitude
+        :type lon: float
+        :param radius: Radius in nautical miles
+        :type radius: float
+        :param airport: Only include airports, defaults to False
+        :type airport: bool, optional
+        :param reporting: Only include reporting stations, defaults to False
+        :type reporting: bool, optional
+        :return: Stations within ``radius`` with their distance
+        :rtype: list[NearStation]
+        """
+        target = to_cartesian(lat, lon)
+        limit = nm_to_chord(radius) ** 2
+        found = self._within_indexes(target, limit, self._predicate(airport, reporting))
+        return [
+            self._near_station(index, math.sqrt(distance))
+            for distance, index in sorted(found)
+        ]
+
+    def resolve_route(self, route: str) -> list[Route]:
+        """Resolve the waypoints of a route against the index.
+
+        :param route: Flight route with ICAO and coordinate, separated by a ``;``
+        :type route: str
+        :raises ValueError: A waypoint is neither a coordinate pair nor an indexed station, e.g. a navaid
+        :return: The waypoints
+        :rtype: list[Route]
+        """
+        waypoints = []
+        for waypoint in route.split(";"):
+            waypoint = waypoint.strip()
+            if not waypoint:
+                continue
+            if "," in waypoint:
+                lat, lon = parse_coords(waypoint)
+            else:
+                station = self.get(waypoint)
+                if station is None:
+                    raise ValueError(f"Unknown route waypoint : {waypoint}")
+                lat, lon = station.latitude, station.longitude
+            waypoints.append(Route(lat=lat, lon=lon, repr=waypoint))
+        if not waypoints:
+            raise ValueError("Empty route")
+        return waypoints
+
+    def route(
+        self,
+        route: str,
+        distance: float,
+        airport: bool = False,
+        reporting: bool = False,
+    ) -> StationRoute:
+        """Get the stations within ``distance`` of a flight route, in route order.
+
+        Each leg is covered by range queries around points sampled along it, then every candidate
+        is kept only if its cross-track distance to a leg is within ``distance``.
+
+        :param route: Flight route with ICAO and coordinate, separated by a ``;``
+        :type route: str
+        :param distance: Distance in nautical miles from ``route`` centerline
+        :type distance: float
+        :param airport: Only include airports, defaults to False
+        :type airport: bool, optional
+        :param reporting: Only include reporting stations, defaults to False
+        :type reporting: bool, optional
+        :raises ValueError: A waypoint can't be resolved locally, see ``resolve_route``
+        :return: Stations around the given ``route``
+        :rtype: StationRoute
+        """
+        waypoints = self.resolve_route(route)
+        points = [to_cartesian(waypoint.lat, waypoint.lon) for waypoint in waypoints]
+        legs = list(zip(points, points[1:])) or [(points[0], points[0])]
+        max_angle = distance / EARTH_RADIUS_NM
+        # Samples at most ``step`` apart: a station within ``distance`` of the leg
+        # is within ``distance + step / 2`` of one of them.
+        step = max(distance, 25) / EARTH_RADIUS_NM
+        limit = nm_to_chord(distance + step * EARTH_RADIUS_NM / 2) ** 2
+        accept = self._predicate(airport, reporting)
+
+        candidates = set()
+        for start, end in legs:
+            length = _angle(start, end)
+            samples = max(1, math.ceil(length / step))
+            for i in range(samples + 1):
+                target = _slerp(start, end, length, i / samples)
+                candidates.update(index for _, index in self._within_indexes(target, limit, accept))
+
+        ordered = []
+        for index in candidates:
+            point = self._points[index]
+            for leg, (start, end) in enumerate(legs):
+                gap, along = leg_distance(point, start, end)
+                if gap <= max_angle:
+                    ordered.append(((leg, along, gap), index))
+                    break
+        return StationRoute(
+            meta=Meta(timestamp=datetime.now(timezone.utc)),
+            route=waypoints,
+            results=[self.stations[index] for _, index in sorted(ordered)],
+        )
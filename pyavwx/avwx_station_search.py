@@ -0,0 +1,166 @@
+import heapq
+import re
+from typing import Iterable
+
+from pyavwx.models import Station
+
+_TOKEN = re.compile(r"[A-Z0-9]+")
+
+# Larger airports come first when two stations match equally well.
+TYPE_PRIORITY = {
+    "large_airport": 3,
+    "medium_airport": 2,
+    "small_airport": 1,
+}
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.upper()) if text else []
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids", "subtree")
+
+    def __init__(self):
+        self.children = {}
+        # Stations with a token ending on this node
+        self.ids = set()
+        # Stations with a token starting with this node's prefix, computed on first use
+        self.subtree = None
+
+
+class StationSearch:
+    def __init__(self, stations: Iterable[Station] = ()):
+        """Local text search over stations, answering ``get_stations_text`` without calling the API.
+
+        Every token of ``icao``, ``iata``, ``gps``, ``name``, ``city``, ``state`` and ``country`` goes in an
+        inverted index and in a prefix trie, so partial words match as they are typed.
+
+        :param stations: Stations to index, e.g. from ``get_stations_text`` or a ``StationCache``, defaults to ()
+        :type stations: Iterable[Station], optional
+        """
+        self.stations = []
+        self._root = _TrieNode()
+        # Per station: its codes, the words of its name and location, its tie-break key
+        self._codes = []
+        self._words = []
+        self._ties = []
+        self._ids = {}
+        self.update(stations)
+
+    def __len__(self):
+        return len(self.stations)
+
+    def update(self, stations: Iterable[Station]):
+        """Add stations to the search index, replacing those already indexed with the same ICAO.
+
+        :param stations: Stations to index
+        :type stations: Iterable[Station]
+        """
+        for station in stations:
+            station_id = self._ids.get(station.icao) if station.icao else None
+            if station_id is None:
+                station_id = len(self.stations)
+                self.stations.append(station)
+                self._codes.append(None)
+                self._words.append(None)
+                self._ties.append(None)
+                if station.icao:
+                    self._ids[station.icao] = station_id
+            else:
+                # The replaced station leaves the postings of its tokens, it keeps its id
+                for token in self._codes[station_id] | self._words[station_id]:
+                    self._remove(token, station_id)
+                self.stations[station_id] = station
+            codes = {
+                code.upper() for code in (station.icao, station.iata, station.gps) if code
+            }
+            words = set()
+            for text in (station.name, station.city, station.state, station.country):
+                words.update(tokenize(text))
+            self._codes[station_id] = codes
+            self._words[station_id] = words
+            self._ties[station_id] = (
+                TYPE_PRIORITY.get(station.type, 0),
+                bool(station.reporting),
+                # Lower ICAO first on ties, the heap keeps the largest key
+                tuple(-ord(char) for char in station.icao or ""),
+            )
+            for token in codes | words:
+                self._insert(token, station_id)
+
+    def _insert(self, token: str, station_id: int):
+        node = self._root
+        node.subtree = None
+        for char in token:
+            node = node.children.setdefault(char, _TrieNode())
+            node.subtree = None
+        node.ids.add(station_id)
+
+    def _remove(self, token: str, station_id: int):
+        node = self._root
+        node.subtree = None
+        for char in token:
+            node = node.children[char]
+            node.subtree = None
+        node.ids.discard(station_id)
+
+    def _prefixed(self, prefix: str) -> set[int]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return self._subtree(node)
+
+    def _subtree(self, node: _TrieNode) -> set[int]:
+        if node.subtree is None:
+            subtree = set(node.ids)
+            for child in node.children.values():
+                subtree |= self._subtree(child)
+            node.subtree = subtree
+        return node.subtree
+
+    def _score(self, station_id: int, text: str, tokens: list[str]) -> tuple:
+        codes = self._codes[station_id]
+        words = self._words[station_id]
+        score = 0
+        if text in codes:
+            score += 1000
+        for token in tokens:
+            if token in codes:
+                score += 50
+            elif token in words:
+                score += 20
+            else:
+                score += 10
+        return score, self._ties[station_id]
+
+    def search(self, text: str, n: int = 10) -> list[Station]:
+        """Get the stations best matching a text, best first.
+
+        Every word of ``text`` has to start a word or a code of the station.
+        Exact codes rank first, then whole words, then partial ones.
+        On ties, larger airports and reporting stations come first.
+
+        :param text: Search text
+        :type text: str
+        :param n: Max results to return, defaults to 10
+        :type n: int, optional
+        :return: Stations that match the requested ``text``
+        :rtype: list[Station]
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return []
+        candidates = None
+        # Smallest posting sets first keeps the intersection cheap.
+        for posting in sorted((self._prefixed(token) for token in tokens), key=len):
+            candidates = posting if candidates is None else candidates & posting
+            if not candidates:
+                return []
+        text = "".join(tokens)
+        best = heapq.nlargest(
+            n, candidates, key=lambda station_id: self._score(station_id, text, tokens)
+        )
+        return [self.stations[station_id] for station_id in best]
@@ -0,0 +1,186 @@
+import codecs
+import json
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+# Characters that can follow a value. A number, ``true``... only ends with one of them.
+_DELIMITERS = ",:]}" + _WHITESPACE
+_decoder = json.JSONDecoder()
+
+
+class _ArrayParser:
+    # Incremental parser of the elements of a JSON array, either the whole document
+    # or the value of ``key`` in a top-level object.
+    # Text is fed as it arrives, only the element being read is kept in the buffer.
+
+    def __init__(self, key: str = None):
+        self.key = key
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.state = "start"
+        # Whether the next element is the first of its container, and the key being read
+        self.first = True
+        self.current = None
+        self._text = codecs.getincrementaldecoder("utf-8")()
+
+    def feed(self, chunk: bytes | str):
+        text = chunk if isinstance(chunk, str) else self._text.decode(chunk)
+        # Drop what was already parsed, so the buffer never holds more than one element.
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+
+    def close(self):
+        self.buffer = self.buffer[self.pos :] + self._text.decode(b"", final=True)
+        self.pos = 0
+        self.eof = True
+
+    def _skip_whitespace(self) -> str | None:
+        # Next significant character, None when more text is needed
+        while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+            self.pos += 1
+        return self.buffer[self.pos] if self.pos < len(self.buffer) else None
+
+    def _value(self):
+        # (True, value) for a complete value, (False, None) when more text is needed.
+        # Strings, objects and arrays end with their closing character. Other values may be cut
+        # (``10.`` of ``10.5``), they are only trusted once a delimiter follows, or at the end of the stream.
+        self._skip_whitespace()
+        try:
+            value, end = _decoder.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError:
+            if self.eof:
+                raise
+            return False, None
+        if (
+            not self.eof
+            and self.buffer[end - 1] not in '"]}'
+            and (end == len(self.buffer) or self.buffer[end] not in _DELIMITERS)
+        ):
+            return False, None
+        self.pos = end
+        return True, value
+
+    def _expect(self, chars: str) -> str | None:
+        char = self._skip_whitespace()
+        if char is None:
+            if self.eof:
+                raise ValueError("Unexpected end of the JSON stream")
+            return None
+        if char not in chars:
+            raise ValueError(f"Unexpected {char!r} in the JSON stream, expected one of {chars!r}")
+        self.pos += 1
+        return char
+
+    def elements(self) -> Iterator:
+        # Elements parsed from the text fed so far
+        while True:
+            if self.state == "start":
+                if self._expect("[" if self.key is None else "{") is None:
+                    return
+                self.state = "elements" if self.key is None else "key"
+                self.first = True
+            elif self.state == "key":
+                if self.first and self._skip_whitespace() == "}":
+                    self.state = "done"
+                    continue
+                complete, key = self._value()
+                if not complete:
+                    return
+                if not isinstance(key, str):
+                    raise ValueError("Object keys of the JSON stream must be strings")
+                self.current = key
+                self.state = "colon"
+            elif self.state == "colon":
+                if self._expect(":") is None:
+                    return
+                if self.current == self.key:
+                    self.state = "open"
+                else:
+                    self.state = "skip"
+            elif self.state == "skip":
+                # Value of another key, e.g. ``meta`` or ``route``
+                complete, _ = self._value()
+                if not complete:
+                    return
+                self.state = "next_key"
+            elif self.state == "next_key":
+                char = self._expect(",}")
+                if char is None:
+                    return
+                self.first = False
+                self.state = "key" if char == "," else "done"
+            elif self.state == "open":
+                char = self._skip_whitespace()
+                if char is None and not self.eof:
+                    return
+                if char == "n":
+                    # ``null`` instead of a list: no elements
+                    complete, _ = self._value()
+                    if not complete:
+                        return
+                    self.state = "next_key"
+                    continue
+                self._expect("[")
+                self.state = "elements"
+                self.first = True
+            elif self.state == "elements":
+                if self.first and self._skip_whitespace() == "]":
+                    self.pos += 1
+                    self.state = "next_key" if self.key is not None else "done"
+                    continue
+                complete, element = self._value()
+                if not complete:
+                    return
+                self.first = False
+                self.state = "separator"
+                yield element
+            elif self.state == "separator":
+                char = self._expect(",]")
+                if char is None:
+                    return
+                if char == ",":
+                    self.state = "elements"
+                else:
+                    self.state = "next_key" if self.key is not None else "done"
+            else:
+                return
+
+
+def iter_json_array(chunks: Iterable[bytes | str], key: str = None) -> Iterator:
+    """Parse the elements of a JSON array while its text streams in.
+
+    :param chunks: The JSON document, in chunks of any size
+    :type chunks: Iterable[bytes | str]
+    :param key: Stream the array under this key of a top-level object instead of a top-level array, defaults to None
+    :type key: str, optional
+    :raises ValueError: The document isn't the expected JSON
+    :return: A generator of the parsed elements
+    :rtype: Iterator
+    """
+    parser = _ArrayParser(key)
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.elements()
+    parser.close()
+    yield from parser.elements()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes | str], key: str = None) -> AsyncIterator:
+    """Async version of ``iter_json_array``, for chunks streamed by aiohttp.
+
+    :param chunks: The JSON document, in chunks of any size
+    :type chunks: AsyncIterable[bytes | str]
+    :param key: Stream the array under this key of a top-level object instead of a top-level array, defaults to None
+    :type key: str, optional
+    :return: An async generator of the parsed elements
+    :rtype: AsyncIterator
+    """
+    parser = _ArrayParser(key)
+    async for chunk in chunks:
+        parser.feed(chunk)
+        for element in parser.elements():
+            yield element
+    parser.close()
+    for element in parser.elements():
+        yield element
@@ -0,0 +1,153 @@
+import asyncio
+import inspect
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+import requests
+
+from pyavwx.avwx_authentication import AvwxApiAuth
+from pyavwx.avwx_exceptions import AvwxTimeout
+from pyavwx.avwx_protocol import ApiRequest, ApiResponse
+from pyavwx.avwx_requests_manager import (
+    _timeout_message,
+    create_async_session,
+    create_session,
+)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+class Transport(ABC):
+    """Sends an ``ApiRequest`` and hands back the ``ApiResponse``, for ``AvwxApiClient``.
+
+    The ``headers`` of the request, e.g. the API key set by the client, have to be sent along.
+    The status is left for the client to check. A request without an answer in time raises ``AvwxTimeout``.
+    """
+
+    @abstractmethod
+    def send(self, request: ApiRequest, timeout: float = None) -> ApiResponse:
+        ...
+
+    def close(self):
+        pass
+
+
+class AsyncTransport(ABC):
+    """``Transport`` for ``AsyncAvwxApiClient``, ``send`` and ``close`` are coroutines."""
+
+    @abstractmethod
+    async def send(self, request: ApiRequest, timeout: float = None) -> ApiResponse:
+        ...
+
+    async def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    def __init__(self, api_key: str = None, session: requests.Session = None, **session_options):
+        """Transport sending requests with a pooled ``requests.Session``.
+
+        :param api_key: avwx.rest API key, defaults to None when the client or ``session`` authenticates
+        :type api_key: str, optional
+        :param session: Session to send the requests with, defaults to None for a new one
+        :type session: requests.Session, optional
+        :param session_options: Passed on to ``create_session``, e.g. ``pool_maxsize``
+        """
+        auth = AvwxApiAuth(api_key) if api_key else None
+        self.session = session if session is not None else create_session(auth=auth, **session_options)
+
+    def send(self, request: ApiRequest, timeout: float = None) -> ApiResponse:
+        try:
+            r = self.session.request(
+                request.method,
+                request.url,
+                data=request.data,
+                headers=request.headers,
+                timeout=timeout,
+            )
+        except requests.Timeout:
+            raise AvwxTimeout(_timeout_message(timeout), request.url) from None
+        return ApiResponse(r.status_code, r.content, r.headers)
+
+    def close(self):
+        self.session.close()
+
+
+class AiohttpTransport(AsyncTransport):
+    def __init__(self, api_key: str = None, session: "aiohttp.ClientSession" = None, **session_options):
+        """Transport sending requests with a pooled ``aiohttp.ClientSession``.
+
+        :param api_key: avwx.rest API key, defaults to None when the client or ``session`` authenticates
+        :type api_key: str, optional
+        :param session: Session to send the requests with, defaults to None for one created on the first request
+        :type session: aiohttp.ClientSession, optional
+        :param session_options: Passed on to ``create_async_session``, e.g. ``pool_maxsize``
+        """
+        self.auth = AvwxApiAuth(api_key) if api_key else None
+        self.session = session
+        self._session_options = session_options
+
+    async def send(self, request: ApiRequest, timeout: float = None) -> ApiResponse:
+        # The session has to be created inside the running event loop.
+        if self.session is None:
+            self.session = create_async_session(auth=self.auth, **self._session_options)
+        options = {} if timeout is None else {"timeout": aiohttp.ClientTimeout(total=timeout)}
+        try:
+            async with self.session.request(
+                request.method, request.url, data=request.data, headers=request.headers, **options
+            ) as r:
+                body = await r.read()
+        except asyncio.TimeoutError:
+            raise AvwxTimeout(_timeout_message(timeout), request.url) from None
+        return ApiResponse(r.status, body, r.headers)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+def _as_response(result: Any) -> ApiResponse:
+    # Handlers give a response, or the JSON payload of a 200
+    if isinstance(result, ApiResponse):
+        return result
+    return ApiResponse(200, json.dumps(result).encode())
+
+
+class FakeTransport(Transport):
+    def __init__(self, handler: Callable[[ApiRequest], Any]):
+        """In-process transport, answering each request with ``handler`` instead of the API.
+
+        Every request sent is kept in ``requests``, so tests can check what was sent.
+
+        :param handler: Called with each request, returns an ``ApiResponse`` or the payload of a 200 response
+        :type handler: Callable[[ApiRequest], Any]
+        """
+        self.handler = handler
+        self.requests = []
+
+    def send(self, request: ApiRequest, timeout: float = None) -> ApiResponse:
+        self.requests.append(request)
+        return _as_response(self.handler(request))
+
+
+class AsyncFakeTransport(AsyncTransport):
+    def __init__(self, handler: Callable[[ApiRequest], Any]):
+        """``FakeTransport`` for ``AsyncAvwxApiClient``, ``handler`` can be a coroutine function.
+
+        :param handler: Called with each request, returns an ``ApiResponse`` or the payload of a 200 response
+        :type handler: Callable[[ApiRequest], Any]
+        """
+        self.handler = handler
+        self.requests = []
+
+    async def send(self, request: ApiRequest, timeout: float = None) -> ApiResponse:
+        self.requests.append(request)
+        result = self.handler(request)
+        if inspect.isawaitable(result):
+            result = await result
+        return _as_response(result)
@@ -0,0 +1,286 @@
+import asyncio
+import heapq
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+
+from pyavwx.avwx_cache import REPORT_INTERVALS
+
+
+@dataclass(slots=True)
+class _StationState:
+    raw: str = None
+    # Epoch of the last report, and of the routine report the issuance cycle is anchored on
+    issued: float = None
+    anchor: float = None
+    # Epoch the next routine report should be available, and of the next poll
+    routine_due: float = 0.0
+    due: float = 0.0
+    misses: int = 0
+    # Wait before the next poll following an off-cycle report, None outside of one
+    speci_step: float = None
+    # Epoch of the last off-cycle report, None after a routine one
+    off_cycle: float = None
+    # Told apart from the heap entries of a removed station added back
+    generation: int = 0
+
+
+def _issued(report) -> float | None:
+    dt = getattr(getattr(report, "time", None), "dt", None)
+    return dt.timestamp() if isinstance(dt, datetime) else None
+
+
+class StationWatcher:
+    def __init__(
+        self,
+        client,
+        stations: Iterable[str],
+        report_type: str = "metar",
+        interval: float = None,
+        delay: float = 120,
+        retry: float = 60,
+        max_retry: float = 900,
+        speci_interval: float = 600,
+        tolerance: float = 600,
+        max_interval: float = None,
+        **kwargs,
+    ):
+        """Poll stations for new reports, fetching each one only when a new report is likely.
+
+        Routine reports follow a cycle (hourly METARs, 6-hourly TAFs), anchored on the ``time``
+        of the last on-cycle report of each station. The first report seen may be off-cycle: two off-cycle
+        reports a whole number of cycles apart show the actual cycle, which is anchored on instead. A station is polled ``delay`` after its next
+        routine report is due, then with an exponential backoff from ``retry`` to ``max_retry``
+        while the report is late. After an off-cycle report (SPECI, amended TAF), more are likely:
+        the station is polled again after ``speci_interval``, doubling until the next routine report.
+
+        Due stations are fetched together with ``get_bulk_reports``, only reports with a new ``raw`` are returned.
+
+        :param client: Client fetching the reports
+        :type client: AvwxApiClient
+        :param stations: ICAO codes of the watched stations
+        :type stations: Iterable[str]
+        :param report_type: ``metar``, ``taf`` or ``summary``, defaults to "metar"
+        :type report_type: str, optional
+        :param interval: Seconds between two routine reports, defaults to None for the usual cycle of ``report_type``
+        :type interval: float, optional
+        :param delay: Seconds between the issue time of a report and its availability from the API, defaults to 120
+        :type delay: float, optional
+        :param retry: Seconds before polling a late report again, doubled on each miss, defaults to 60
+        :type retry: float, optional
+        :param max_retry: Longest wait between two polls of a late report, defaults to 900
+        :type max_retry: float, optional
+        :param speci_interval: Seconds before polling again after an off-cycle report, defaults to 600
+        :type speci_interval: float, optional
+        :param tolerance: Seconds a report can be away from its cycle and still count as routine, defaults to 600
+        :type tolerance: float, optional
+        :param max_interval: Longest time between two polls of a station, to catch off-cycle reports sooner, defaults to None
+        :type max_interval: float, optional
+        :param kwargs: Passed on to ``get_bulk_reports``, e.g. ``options`` or ``max_workers``.
+            A ``filter`` or ``fields`` has to keep ``raw`` and ``time``
+        """
+        self.client = client
+        self.report_type = report_type
+        self.interval = interval or REPORT_INTERVALS.get(f"{report_type}/", 3600)
+        self.delay = delay
+        self.retry = retry
+        self.max_retry = max_retry
+        self.speci_interval = speci_interval
+        self.tolerance = tolerance
+        self.max_interval = max_interval
+        self.options = kwargs
+        self.reports = {}
+        self.errors = {}
+        self.fetched = 0
+        self.changed = 0
+        self._states = {}
+        self._heap = []
+        self._generation = 0
+        self.add(stations)
+
+    def __len__(self):
+        return len(self._states)
+
+    def add(self, stations: Iterable[str]):
+        """Watch more stations, they are polled on the next ``poll``.
+
+        :param stations: ICAO codes
+        :type stations: Iterable[str]
+        """
+        for station in stations:
+            station = station.strip()
+            if station not in self._states:
+                self._generation += 1
+                self._states[station] = _StationState(generation=self._generation)
+                heapq.heappush(self._heap, (0.0, station, self._generation))
+
+    def remove(self, stations: Iterable[str]):
+        """Stop watching stations.
+
+        :param stations: ICAO codes
+        :type stations: Iterable[str]
+        """
+        for station in stations:
+            self._states.pop(station.strip(), None)
+            self.reports.pop(station.strip(), None)
+            self.errors.pop(station.strip(), None)
+
+    def next_due(self) -> float | None:
+        """Epoch of the next poll, ``None`` without stations.
+
+        :rtype: float | None
+        """
+        while self._heap:
+            due, station, generation = self._heap[0]
+            state = self._states.get(station)
+            if state is not None and state.due == due and state.generation == generation:
+                return due
+            # Entry of a rescheduled or removed station
+            heapq.heappop(self._heap)
+        return None
+
+    def stats(self) -> dict:
+        """Counters of the watcher.
+
+        :return: ``stations``, ``fetched`` station polls, ``changed`` reports and ``change_ratio``
+        :rtype: dict
+        """
+        return {
+            "stations": len(self._states),
+            "fetched": self.fetched,
+            "changed": self.changed,
+            "change_ratio": self.changed / self.fetched if self.fetched else 0.0,
+        }
+
+    def _pop_due(self, now: float) -> list[str]:
+        due = []
+        while True:
+            next_due = self.next_due()
+            if next_due is None or next_due > now:
+                return due
+            due.append(heapq.heappop(self._heap)[1])
+
+    def _routine_after(self, state: _StationState, issued: float) -> float:
+        # Next routine issuance after ``issued``, on the cycle of the station
+        cycles = math.floor((issued - state.anchor) / self.interval) + 1
+        return state.anchor + cycles * self.interval
+
+    def _on_cycle(self, elapsed: float, whole: bool = False) -> bool:
+        # Whether ``elapsed`` seconds are a number of cycles, within the tolerance, at least one when ``whole``
+        if whole and elapsed < self.interval - self.tolerance:
+            return False
+        offset = elapsed % self.interval
+        return min(offset, self.interval - offset) <= self.tolerance
+
+    def _observe(self, state: _StationState, report, now: float) -> bool:
+        changed = report.raw != state.raw
+        issued = _issued(report)
+        if changed:
+            state.raw = report.raw
+            state.misses = 0
+            state.speci_step = None
+            if issued is None:
+                # No issue time, the report is only polled once per cycle
+                state.routine_due = now + self.interval
+                return True
+            if state.anchor is None or self._on_cycle(issued - state.anchor):
+                state.anchor = issued
+                state.off_cycle = None
+            elif state.off_cycle is not None and self._on_cycle(issued - state.off_cycle, whole=True):
+                # Off the cycle of the anchor but on the one of the previous off-cycle report:
+                # the anchor was itself off-cycle, e.g. the first report seen was a SPECI.
+                state.anchor = issued
+                state.off_cycle = None
+            else:
+                state.off_cycle = issued
+                state.speci_step = self.speci_interval
+            state.issued = issued
+            state.routine_due = self._routine_after(state, issued) + self.delay
+        return changed
+
+    def _reschedule(self, state: _StationState, now: float):
+        if state.speci_step is not None and now + state.speci_step < state.routine_due:
+            state.due = now + state.speci_step
+            state.speci_step *= 2
+        elif now < state.routine_due:
+            state.speci_step = None
+            state.due = state.routine_due
+        else:
+            # The routine report is late
+            state.due = now + min(self.retry * 2**state.misses, self.max_retry)
+            state.misses += 1
+        if self.max_interval is not None:
+            state.due = min(state.due, now + self.max_interval)
+
+    def _update(self, stations: list[str], results: dict, now: float) -> list:
+        changed = []
+        for station in stations:
+            state = self._states.get(station)
+            if state is None:
+                continue
+            report = results.get(station)
+            if isinstance(report, Exception) or report is None:
+                self.errors[station] = report
+            else:
+                self.errors.pop(station, None)
+                if self._observe(state, report, now):
+                    self.reports[station] = report
+                    changed.append(report)
+            self._reschedule(state, now)
+            heapq.heappush(self._heap, (state.due, station, state.generation))
+        self.fetched += len(stations)
+        self.changed += len(changed)
+        return changed
+
+    def poll(self, now: float = None) -> list:
+        """Fetch the stations that are due, once.
+
+        Stations that could not be fetched keep their exception in ``errors`` and are retried later.
+
+        :param now: Current epoch, defaults to None for ``time.time()``
+        :type now: float, optional
+        :return: The reports that changed since the last poll of their station
+        :rtype: list[Metar | Taf | Summary]
+        """
+        now = time.time() if now is None else now
+        stations = self._pop_due(now)
+        if not stations:
+            return []
+        results = self.client.get_bulk_reports(self.report_type, stations, **self.options)
+        return self._update(stations, results, now)
+
+    def watch(self, max_sleep: float = 60):
+        """Poll forever, yielding every new report.
+
+        :param max_sleep: Longest sleep between two polls, so added stations are picked up, defaults to 60
+        :type max_sleep: float, optional
+        :return: A generator of the new reports
+        :rtype: Iterator[Metar | Taf | Summary]
+        """
+        while True:
+            yield from self.poll()
+            next_due = self.next_due()
+            wait = max_sleep if next_due is None else next_due - time.time()
+            time.sleep(min(max(wait, 0), max_sleep))
+
+
+class AsyncStationWatcher(StationWatcher):
+    """``StationWatcher`` for an ``AsyncAvwxApiClient``, ``poll`` is a coroutine and ``watch`` an async generator."""
+
+    async def poll(self, now: float = None) -> list:
+        now = time.time() if now is None else now
+        stations = self._pop_due(now)
+        if not stations:
+            return []
+        results = await self.client.get_bulk_reports(self.report_type, stations, **self.options)
+        return self._update(stations, results, now)
+
+    async def watch(self, max_sleep: float = 60):
+        while True:
+            for report in await self.poll():
+                yield report
+            next_due = self.next_due()
+            wait = max_sleep if next_due is None else next_due - time.time()
+            await asyncio.sleep(min(max(wait, 0), max_sleep))
@@ -1,2 +1,3 @@
 BASE_URL = "https://avwx.rest/api/"
 GITHUB_URL = "https://github.com/Bastien1533/pyavwx-wrapper/"
+MULTI_LOCATIONS_LIMIT = 10
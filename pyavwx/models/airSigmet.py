@@ -1,10 +1,10 @@
-import json
 from dataclasses import dataclass
 
 from pyavwx.models.structs import Units, Meta, Time, Remarks, Station, TypeClass, Coord
+from pyavwx.models.serializer import serialize, dumps
 
 
-@dataclass
+@dataclass(slots=True)
 class Bulletin:
     repr: str = None
     type: TypeClass = None
@@ -12,14 +12,14 @@ class Bulletin:
     number: int = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Ceiling:
     repr: str = None
     value: int = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     type: TypeClass = None
     start_time: any = None
@@ -34,7 +34,7 @@ class Observation:
     other: list[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Report:
     raw: str = None
     sanitized: str = None
@@ -55,13 +55,13 @@ class Report:
     units: Units = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AirSigmet:
     meta: Meta = None
     reports: list[Report] = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
@@ -0,0 +1,257 @@
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Sequence
+
+from pyavwx.models import metar, nbm_gfs, taf
+from pyavwx.models.utils import parse_datetime
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover - optional dependency
+    pandas = None
+
+# Columns exported when none are given, by model.
+DEFAULT_COLUMNS = {
+    metar.Metar: (
+        "station",
+        "time.dt",
+        "flight_rules",
+        "wind_direction.value",
+        "wind_speed.value",
+        "wind_gust.value",
+        "visibility.value",
+        "altimeter.value",
+        "temperature.value",
+        "dewpoint.value",
+    ),
+    taf.Forecast: (
+        "type",
+        "start_time.dt",
+        "end_time.dt",
+        "flight_rules",
+        "wind_direction.value",
+        "wind_speed.value",
+        "wind_gust.value",
+        "visibility.value",
+    ),
+    nbm_gfs.Forecast: (
+        "time.dt",
+        "temperature.value",
+        "dewpoint.value",
+        "wind_direction.value",
+        "wind_speed.value",
+        "wind_gust.value",
+        "sky_cover.value",
+        "visibility.value",
+        "precip_chance_6.value",
+    ),
+}
+
+_PATHS = {}
+
+
+def _compile_path(cls, path: str) -> tuple:
+    # (field name, is datetime) for every step of a dotted path, resolved once per model and path.
+    key = (cls, path)
+    steps = _PATHS.get(key)
+    if steps is None:
+        steps = []
+        for name in path.split("."):
+            field_type = None
+            if cls is not None and is_dataclass(cls):
+                field_type = {field.name: field.type for field in fields(cls)}.get(name)
+            steps.append((name, field_type is datetime))
+            cls = field_type if is_dataclass(field_type) else None
+        steps = _PATHS[key] = tuple(steps)
+    return steps
+
+
+def _get(item, steps: tuple):
+    # Lazy models are read from the payload they keep, so no nested object gets built.
+    value = getattr(item, "_lazy_payload", item)
+    for name, is_datetime in steps:
+        if value is None:
+            return None
+        if type(value) is dict:
+            value = value.get(name)
+            if is_datetime:
+                value = parse_datetime(value)
+        else:
+            value = getattr(value, name, None)
+    return value
+
+
+def _model(report) -> type:
+    cls = type(report)
+    # Lazy models are subclasses of the model they stand for.
+    return cls.__mro__[1] if hasattr(report, "_lazy_payload") else cls
+
+
+def _element_class(cls, field_name: str):
+    for field in fields(cls):
+        if field.name == field_name:
+            type_args = getattr(field.type, "__args__", None)
+            return type_args[0] if type_args else None
+    return None
+
+
+def to_columns(
+    reports: Iterable,
+    columns: Sequence[str] = None,
+    explode: str = None,
+    parent_columns: Sequence[str] = (),
+    model: type = None,
+) -> dict[str, list]:
+    """Turn a batch of reports into one list per column.
+
+    Columns are dotted paths to a leaf value, e.g. ``wind_speed.value`` or ``time.dt``.
+    A missing value anywhere along the path gives ``None``.
+    Lazy models (see ``AvwxApiClient(lazy=True)``) are read straight from their JSON payload.
+
+    :param reports: Decoded reports, all of the same model
+    :type reports: Iterable
+    :param columns: Paths to export, defaults to the ``DEFAULT_COLUMNS`` of the exported model
+    :type columns: Sequence[str], optional
+    :param explode: List field whose elements become the rows, e.g. ``forecast`` for ``Taf`` and ``Nbm``, defaults to None
+    :type explode: str, optional
+    :param parent_columns: With ``explode``, paths on the report repeated on each of its rows, defaults to ()
+    :type parent_columns: Sequence[str], optional
+    :param model: Model of the reports, for the default columns of a batch that may be empty, defaults to None
+    :type model: type, optional
+    :return: Values by column, empty lists for an empty batch (no column at all when neither
+        ``columns`` nor ``model`` is given)
+    :rtype: dict[str, list]
+    """
+    reports = list(reports)
+    if model is None and reports:
+        model = _model(reports[0])
+    row_model = _element_class(model, explode) if explode and model else model
+    if columns is None:
+        if row_model is None:
+            # Nothing to guess the columns from
+            return {column: [] for column in parent_columns}
+        columns = DEFAULT_COLUMNS.get(row_model)
+        if columns is None:
+            raise ValueError(
+                f"No default columns for {getattr(row_model, '__name__', row_model)}, give columns"
+            )
+
+    paths = [(column, _compile_path(row_model, column)) for column in columns]
+    parents = [(column, _compile_path(model, column)) for column in parent_columns]
+    result = {column: [] for column in (*parent_columns, *columns)}
+    if explode is None:
+        for report in reports:
+            for column, steps in paths:
+                result[column].append(_get(report, steps))
+        return result
+
+    explode_steps = _compile_path(model, explode)
+    for report in reports:
+        parent_values = [(column, _get(report, steps)) for column, steps in parents]
+        for row in _get(report, explode_steps) or ():
+            for column, value in parent_values:
+                result[column].append(value)
+            for column, steps in paths:
+                result[column].append(_get(row, steps))
+    return result
+
+
+def _numpy_column(values: list):
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, datetime) for value in present):
+        # datetime64 has no timezone, aware values are converted to naive UTC.
+        return numpy.array(
+            [
+                value.astimezone(timezone.utc).replace(tzinfo=None)
+                if value is not None and value.tzinfo is not None
+                else value
+                for value in values
+            ],
+            dtype="datetime64[us]",
+        )
+    if len(present) == len(values) and all(isinstance(value, bool) for value in values):
+        return numpy.array(values, dtype=bool)
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+        # None becomes NaN, so int columns with missing values are floats.
+        return numpy.array(
+            [numpy.nan if value is None else value for value in values], dtype=float
+        )
+    if all(isinstance(value, str) for value in present):
+        return numpy.array(
+            ["" if value is None else value for value in values], dtype=str
+        )
+    return numpy.array(values, dtype=object)
+
+
+def to_numpy(reports: Iterable, columns: Sequence[str] = None, **kwargs):
+    """Turn a batch of reports into a NumPy structured array, one field per column.
+
+    Numbers become ``float64`` (``NaN`` when missing), datetimes ``datetime64[us]`` in UTC (``NaT`` when missing),
+    strings fixed-width unicode (empty when missing). Other columns are kept as objects.
+
+    :param reports: Decoded reports, all of the same model
+    :type reports: Iterable
+    :param columns: Paths to export, see ``to_columns``, defaults to None
+    :type columns: Sequence[str], optional
+    :return: A structured array with one record per row
+    :rtype: numpy.ndarray
+    """
+    if numpy is None:
+        raise ImportError(
+            "numpy is required, install it with 'pip install pyavwx-wrapper[columnar]'"
+        )
+    data = {
+        column: _numpy_column(values)
+        for column, values in to_columns(reports, columns, **kwargs).items()
+    }
+    size = len(next(iter(data.values()))) if data else 0
+    array = numpy.empty(
+        size, dtype=[(column, values.dtype) for column, values in data.items()]
+    )
+    for column, values in data.items():
+        array[column] = values
+    return array
+
+
+def to_arrow(reports: Iterable, columns: Sequence[str] = None, **kwargs):
+    """Turn a batch of reports into a ``pyarrow.Table``, one column per path.
+
+    :param reports: Decoded reports, all of the same model
+    :type reports: Iterable
+    :param columns: Paths to export, see ``to_columns``, defaults to None
+    :type columns: Sequence[str], optional
+    :return: The table
+    :rtype: pyarrow.Table
+    """
+    if pyarrow is None:
+        raise ImportError(
+            "pyarrow is required, install it with 'pip install pyavwx-wrapper[columnar]'"
+        )
+    return pyarrow.table(to_columns(reports, columns, **kwargs))
+
+
+def to_pandas(reports: Iterable, columns: Sequence[str] = None, **kwargs):
+    """Turn a batch of reports into a ``pandas.DataFrame``, one column per path.
+
+    :param reports: Decoded reports, all of the same model
+    :type reports: Iterable
+    :param columns: Paths to export, see ``to_columns``, defaults to None
+    :type columns: Sequence[str], optional
+    :return: The data frame
+    :rtype: pandas.DataFrame
+    """
+    if pandas is None:
+        raise ImportError(
+            "pandas is required, install it with 'pip install pyavwx-wrapper[columnar]'"
+        )
+    return pandas.DataFrame(to_columns(reports, columns, **kwargs))
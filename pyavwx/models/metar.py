@@ -1,4 +1,3 @@
-import json
 from typing import Any
 
 from pyavwx.models.structs import (
@@ -16,6 +15,7 @@ from pyavwx.models.structs import (
     Translate,
     Station,
 )
+from pyavwx.models.serializer import serialize, dumps
 from pyavwx.models.utils import nested_dataclass
 
 
@@ -50,8 +50,8 @@ class Metar:
     translate: Translate = None
     info: Station = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
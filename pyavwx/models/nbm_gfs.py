@@ -1,4 +1,3 @@
-import json
 from dataclasses import dataclass
 
 from pyavwx.models.structs import (
@@ -11,24 +10,25 @@ from pyavwx.models.structs import (
     Time,
     Visibility,
 )
+from pyavwx.models.serializer import serialize, dumps
 from pyavwx.models.utils import nested_dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class DataRepr:
     repr: int = None
     value: int = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PrecipAmount6:
     repr: int = None
     value: float = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PrecipType:
     repr: str
     value: str
@@ -93,11 +93,11 @@ class Nbm:
     units: Units = None
     info: Station = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
 
 
 @nested_dataclass
@@ -111,8 +111,8 @@ class Gfs:
     units: Units = None
     info: Station = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
@@ -1,19 +1,19 @@
-import json
 from dataclasses import dataclass
 from datetime import datetime
 
 from pyavwx.models.structs import Meta, Time, TypeClass, Coord
+from pyavwx.models.serializer import serialize, dumps
 from pyavwx.models.utils import nested_dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Lower:
     repr: str = None
     value: int = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Upper:
     repr: int = None
     value: int = None
@@ -35,7 +35,7 @@ class Qualifiers:
     radius: Lower = None
 
 
-@dataclass
+@nested_dataclass
 class StartTime:
     repr: int = None
     dt: datetime = None
@@ -65,8 +65,8 @@ class Notam:
     meta: Meta = None
     data: list[Datum] = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
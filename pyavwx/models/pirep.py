@@ -1,7 +1,7 @@
-import json
 from datetime import datetime
 
 from pyavwx.models.structs import Distance, Altitude, Units, Meta, Station, Cloud
+from pyavwx.models.serializer import serialize, dumps
 from pyavwx.models.utils import nested_dataclass
 
 
@@ -51,11 +51,11 @@ class Datum:
     remarks: str = None
     info: Station = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
 
 
 @nested_dataclass
@@ -65,8 +65,8 @@ class Pirep:
     units: Units = None
     timestamp: datetime = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
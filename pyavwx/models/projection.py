@@ -0,0 +1,88 @@
+from dataclasses import fields as dataclass_fields
+from typing import Iterable
+
+from pyavwx.models.utils import field_names, nested_dataclass
+
+_PROJECTIONS = {}
+
+
+def field_name(cls, field) -> str:
+    """Name of a field of a model, given as the field itself (``Metar.flight_rules``) or as its name.
+
+    :param cls: The model
+    :param field: The field, or its name
+    :raises ValueError: ``cls`` has no such field
+    :return: The field name
+    :rtype: str
+    """
+    # Slotted dataclasses expose their fields as member descriptors, named after the field.
+    name = field if isinstance(field, str) else getattr(field, "__name__", None)
+    if name not in field_names(cls):
+        raise ValueError(f"{cls.__name__} has no field {field!r}")
+    return name
+
+
+def _rebuild(cls, names: tuple, values: tuple):
+    return projection(cls, names)(*values)
+
+
+def projection(cls, names: Iterable[str]) -> type:
+    """Lean model holding only some fields of ``cls``, built once per model and set of fields.
+
+    Fields keep their type, nested dataclasses and datetimes are decoded as in ``cls``.
+
+    :param cls: The projected model, e.g. ``Metar``
+    :param names: Names of the kept fields
+    :type names: Iterable[str]
+    :return: The projected model, named ``<Model>Projection``
+    :rtype: type
+    """
+    names = tuple(dict.fromkeys(names))
+    key = (cls, names)
+    projected = _PROJECTIONS.get(key)
+    if projected is not None:
+        return projected
+    types = {field.name: field.type for field in dataclass_fields(cls)}
+    namespace = {
+        "__annotations__": {name: types[name] for name in names},
+        "__module__": cls.__module__,
+        "__projected_from__": cls,
+        "__projected_names__": frozenset(names),
+        **{name: None for name in names},
+    }
+    for method in ("to_dict", "to_json"):
+        if method in cls.__dict__:
+            namespace[method] = cls.__dict__[method]
+
+    def __reduce__(self):
+        # The class is built at runtime and can't be imported back.
+        return _rebuild, (cls, names, tuple(getattr(self, name) for name in names))
+
+    namespace["__reduce__"] = __reduce__
+    projected = nested_dataclass(type(f"{cls.__name__}Projection", (), namespace))
+    _PROJECTIONS[key] = projected
+    return projected
+
+
+def project(cls, fields: Iterable = None, filter: str = None, required: Iterable[str] = ()) -> tuple:
+    """Resolve the ``fields`` argument of a client method.
+
+    :param cls: Model returned by the method
+    :param fields: Fields to keep, e.g. ``[Metar.flight_rules, Metar.wind_speed]``, defaults to None for every field
+    :type fields: Iterable, optional
+    :param filter: ``filter`` argument of the method, merged with ``fields``, defaults to None
+    :type filter: str, optional
+    :param required: Fields always kept in a projection, e.g. ``station`` to match multi-station reports, defaults to ()
+    :type required: Iterable[str], optional
+    :raises ValueError: A field of ``fields`` or ``filter`` isn't a field of ``cls``
+    :return: ``(model, filter)``: the model to decode into and the ``filter`` to send
+    :rtype: tuple
+    """
+    if not fields:
+        return cls, filter
+    names = [field_name(cls, field) for field in fields]
+    names += [name for name in required if name in field_names(cls)]
+    if filter:
+        names += [field_name(cls, name) for name in filter.replace(" ", "").split(",") if name]
+    names = tuple(dict.fromkeys(names))
+    return projection(cls, names), ",".join(names)
@@ -0,0 +1,113 @@
+import json
+from dataclasses import is_dataclass
+from datetime import date, datetime, time
+from operator import attrgetter
+
+from pyavwx.models.utils import field_names
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+_TIMES = (datetime, date, time)
+_GETTERS = {}
+
+
+def _getter(cls) -> tuple:
+    # (field names, function returning every field value as a tuple), built once per class.
+    # Both are None when cls isn't a dataclass.
+    getter = _GETTERS.get(cls)
+    if getter is None:
+        names = field_names(cls) if is_dataclass(cls) else None
+        if names is None:
+            getter = (None, None)
+        elif len(names) < 2:
+            # attrgetter needs a name and returns a bare value, not a tuple, for a single one
+            getter = (names, lambda obj: tuple(getattr(obj, name) for name in names))
+        else:
+            getter = (names, attrgetter(*names))
+        _GETTERS[cls] = getter
+    return getter
+
+
+def _serialize(value, skip_none: bool):
+    cls = type(value)
+    if cls in _SCALARS:
+        return value
+    if cls is list or cls is tuple:
+        return [_serialize(item, skip_none) for item in value]
+    if cls is dict:
+        return {
+            key: _serialize(item, skip_none)
+            for key, item in value.items()
+            if not (skip_none and item is None)
+        }
+    names, getter = _getter(cls)
+    if names is not None:
+        return {
+            name: _serialize(item, skip_none)
+            for name, item in zip(names, getter(value))
+            if not (skip_none and item is None)
+        }
+    if isinstance(value, _TIMES):
+        return value.isoformat()
+    return value
+
+
+# The JSON encoders walk containers in C and only call these hooks for models and datetimes,
+# which are turned into a dict one level deep.
+def _default(value):
+    names, getter = _getter(type(value))
+    if names is not None:
+        return dict(zip(names, getter(value)))
+    if isinstance(value, _TIMES):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _default_skip_none(value):
+    names, getter = _getter(type(value))
+    if names is not None:
+        return {
+            name: item
+            for name, item in zip(names, getter(value))
+            if item is not None
+        }
+    return _default(value)
+
+
+def serialize(obj, skip_none: bool = False) -> dict:
+    """Deep copy of a model as plain dicts and lists, ready to be dumped as JSON.
+
+    Nested models become dicts and ``datetime`` values become ISO 8601 strings.
+
+    :param obj: A model instance
+    :param skip_none: Leave out the fields set to ``None``, defaults to False
+    :type skip_none: bool, optional
+    :return: The model as a dict
+    :rtype: dict
+    """
+    return _serialize(obj, skip_none)
+
+
+def dumps(obj, skip_none: bool = False, backend: str = "auto") -> str:
+    """Serialize a model to a JSON string.
+
+    :param obj: A model instance
+    :param skip_none: Leave out the fields set to ``None``, defaults to False
+    :type skip_none: bool, optional
+    :param backend: ``"json"``, ``"orjson"`` or ``"auto"`` to use orjson when it is installed, defaults to "auto"
+    :type backend: str, optional
+    :return: The model as JSON
+    :rtype: str
+    """
+    default = _default_skip_none if skip_none else _default
+    if backend == "orjson" or (backend == "auto" and orjson is not None):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        # orjson encodes plain dataclasses natively, unless None fields have to be skipped.
+        option = orjson.OPT_PASSTHROUGH_DATACLASS if skip_none else 0
+        return orjson.dumps(obj, default=default, option=option).decode()
+    return json.dumps(obj, default=default)
@@ -1,4 +1,3 @@
-import json
 from dataclasses import dataclass
 
 from pyavwx.models.airSigmet import AirSigmet
@@ -6,6 +5,7 @@ from pyavwx.models.metar import Metar
 from pyavwx.models.notams import Notam
 from pyavwx.models.structs import Meta, Station
 from pyavwx.models.taf import Taf
+from pyavwx.models.serializer import serialize, dumps
 from pyavwx.models.utils import nested_dataclass
 
 
@@ -17,14 +17,14 @@ class NearStation:
     miles: float = None
     kilometers: float = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
 
 
-@dataclass
+@dataclass(slots=True)
 class Route:
     lat: float = None
     lon: float = None
@@ -37,11 +37,11 @@ class StationRoute:
     route: list[Route] = None
     results: list[Station] = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
 
 
 @nested_dataclass
@@ -50,8 +50,8 @@ class ReportsRoute:
     route: list[Route] = None
     results: Metar | Taf | AirSigmet | Notam = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
@@ -1,24 +1,24 @@
-import json
 from dataclasses import dataclass
 from datetime import datetime
 
+from pyavwx.models.serializer import serialize, dumps
 from pyavwx.models.utils import nested_dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Coord:
     lat: float = None
     lon: float = None
     repr: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeClass:
     repr: str = None
     value: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Ceiling:
     altitude: int = None
     modifier: dict = None
@@ -26,48 +26,48 @@ class Ceiling:
     type: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Code:
     repr: str = None
     value: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Precip36_Hours:
     repr: int = None
     value: float = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PressureTendency:
     repr: int = None
     tendency: str = None
     change: float = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Altimeter:
     repr: str = None
     value: float = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Altitude:
     repr: int = None
     value: int = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DecimalRepr:
     repr: str = None
     value: float = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Cloud:
     repr: str = None
     type: str = None
@@ -78,28 +78,28 @@ class Cloud:
     direction: any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Dewpoint:
     repr: str = None
     value: int = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Distance:
     repr: str = None
     value: int = None
     spoken: str = None
 
 
-@dataclass
+@nested_dataclass
 class Meta:
     timestamp: datetime = None
     stations_updated: datetime = None
     cache_timestamp: datetime = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WxCode:
     repr: str = None
     value: str = None
@@ -123,7 +123,7 @@ class RemarksInfo:
     temperature_decimal: DecimalRepr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Wind:
     repr: int = None
     value: int = None
@@ -145,7 +145,7 @@ class Time:
     dt: datetime = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Units:
     accumulation: str = None
     altimeter: str = None
@@ -155,7 +155,7 @@ class Units:
     wind_speed: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Visibility:
     repr: str = None
     value: float = None
@@ -165,12 +165,12 @@ class Visibility:
     normalized: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Remarks:
     slp091: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Translate:
     altimeter: str = None
     clouds: str = None
@@ -182,12 +182,12 @@ class Translate:
     wind: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Local:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Runway:
     length_ft: int = None
     width_ft: int = None
@@ -224,8 +224,8 @@ class Station:
     miles: float = None
     kilometers: float = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
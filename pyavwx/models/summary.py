@@ -1,8 +1,8 @@
-import json
 from datetime import datetime
 
 from pyavwx.models.metar import Translate
 from pyavwx.models.structs import Meta, Station, Visibility, Ceiling
+from pyavwx.models.serializer import serialize, dumps
 from pyavwx.models.utils import nested_dataclass
 
 
@@ -38,8 +38,8 @@ class Summary:
     translate: Translate = None
     info: Station = None
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
@@ -1,4 +1,3 @@
-import json
 from dataclasses import dataclass
 from typing import List, Any, Optional
 
@@ -12,17 +11,18 @@ from pyavwx.models.structs import (
     Station,
     Altimeter
 )
+from pyavwx.models.serializer import serialize, dumps
 from pyavwx.models.utils import nested_dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Probability:
     repr: str = None
     value: int = None
     spoken: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WxCode:
     repr: str = None
     value: str = None
@@ -79,8 +79,8 @@ class Taf:
     is_amended: bool = False
     is_correction: bool = False
 
-    def to_dict(self):
-        return self.__dict__
+    def to_dict(self, skip_none: bool = False) -> dict:
+        return serialize(self, skip_none)
 
-    def to_json(self):
-        return json.dumps(self.__dict__, default=lambda k: k.__dict__)
+    def to_json(self, skip_none: bool = False) -> str:
+        return dumps(self, skip_none)
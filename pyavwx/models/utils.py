@@ -1,45 +1,136 @@
-from dataclasses import dataclass, is_dataclass
-import typing
+from dataclasses import MISSING, dataclass, fields, is_dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+
 from pyavwx.const import GITHUB_URL
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str):
+    try:
+        # fromisoformat only understands a trailing "Z" since Python 3.11
+        dt = datetime.fromisoformat(value[:-1] + "+00:00" if value[-1:] == "Z" else value)
+    except ValueError:
+        return value
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+def parse_datetime(value):
+    """Cast an ISO 8601 string from the API into a timezone-aware ``datetime``.
+
+    Results are memoized, the same timestamps come back over and over across reports
+    (every forecast hour of a NBM/GFS report, ``meta.timestamp`` of a batch...).
+    Naive values are considered UTC. Anything that isn't a parsable string is returned as is.
+
+    :param value: Value of a ``datetime`` field
+    :return: The parsed ``datetime``, or ``value`` when it can't be parsed
+    """
+    if type(value) is str and value:
+        return _parse_iso(value)
+    return value
+
+
+def _model_converter(model: type):
+    names = frozenset(field.name for field in fields(model))
+
+    def convert(value):
+        if not isinstance(value, dict):
+            return value
+        # Keys the model doesn't know about are dropped, the dict is only rebuilt when needed.
+        if value.keys() <= names:
+            return model(**value)
+        return model(**{key: item for key, item in value.items() if key in names})
+
+    return convert
+
+
+def _list_converter(model: type):
+    convert_item = _model_converter(model)
+
+    def convert(value):
+        if type(value) is not list:
+            return value
+        return [convert_item(item) for item in value]
+
+    return convert
+
+
+def decode_plan(cls) -> tuple:
+    """Build the decode plan of a dataclass: the converter of every field holding nested dataclasses.
+
+    Fields typed as a dataclass get their dict cast into that dataclass, fields typed as
+    a list of dataclass (``list[Cloud]``, ``List[Forecast]``) or as a union of dataclass
+    get each dict of their list cast into the first dataclass.
+    Fields typed as ``datetime`` get their ISO string parsed with ``parse_datetime``.
+    Other fields are left untouched and don't appear in the plan.
+
+    :param cls: The dataclass
+    :return: ``(field_name, converter)`` pairs
+    :rtype: tuple
+    """
+    plan = []
+    for field in fields(cls):
+        field_type = field.type
+        if is_dataclass(field_type):
+            plan.append((field.name, _model_converter(field_type)))
+            continue
+        if field_type is datetime:
+            plan.append((field.name, parse_datetime))
+            continue
+        # ⇩⇩⇩⇩⇩⇩⇩ https://koor.fr/Python/API/python/types/GenericAlias/Index.wp ⇩⇩⇩⇩⇩⇩⇩
+        type_args = getattr(field_type, "__args__", None)
+        if type_args and is_dataclass(type_args[0]):
+            plan.append((field.name, _list_converter(type_args[0])))
+    return tuple(plan)
+
+
+_FIELD_NAMES = {}
+
+
+def field_names(cls) -> tuple:
+    """Names of the fields of a dataclass, computed once per class.
+
+    :param cls: The dataclass
+    :return: Field names in declaration order
+    :rtype: tuple
+    """
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(field.name for field in fields(cls))
+    return names
+
+
 # This function wrapper enable dataclass to have other dataclass as types
 # it casts the dict coresponding to the nested dataclass in the types dataclass
 # if the Metar class has an info field typed to station, it will cast the dict coresponding to station.
 # The same goes for lists of dataclass.
+# The annotations are only inspected once, when the class is decorated, see decode_plan.
+# Classes are slotted unless slots=False is given, to keep large sets of reports light in memory.
 def nested_dataclass(*args, **kwargs):
+    kwargs.setdefault("slots", True)
+
     def wrapper(cls):
         cls = dataclass(cls, **kwargs)
         original_init = cls.__init__
+        plan = decode_plan(cls)
+        names = frozenset(field_names(cls))
+        cls.__decode_plan__ = plan
 
         def __init__(self, *args, **kwargs):
-            for name, value in kwargs.items():
-                field_type = cls.__annotations__.get(name, None)
-                # if the value we want to cast in is a dict
-                if is_dataclass(field_type) and isinstance(value, dict):
-                    new_obj = field_type(
-                        **{
-                            key: value
-                            for key, value in value.items()
-                            if key in field_type.__annotations__
-                        }
-                    )
-                    kwargs[name] = new_obj
-
-                # if the value we want to cast in is a list of dict
-                if type(value) == list and len(value) != 0 and field_type is not None:
-                    # ⇩⇩⇩⇩⇩⇩⇩ https://koor.fr/Python/API/python/types/GenericAlias/Index.wp ⇩⇩⇩⇩⇩⇩⇩
-
-                    list_type = field_type.__args__[0]
-                    if list_type != typing.Any:
-                        new_obj = list([list_type(**d) for d in value])
-                        kwargs[name] = new_obj
+            for name, convert in plan:
+                value = kwargs.get(name)
+                if value is not None:
+                    kwargs[name] = convert(value)
             try:
                 original_init(self, *args, **kwargs)
             except TypeError as e:
                 print(
                     f"Warning: {e}, This might be due to an undocumented aspect of the Api, Please report it at {GITHUB_URL}/issues"
                 )
+                # Slotted fields left unset would raise on access, so the unknown keys are dropped instead.
+                original_init(
+                    self, *args, **{key: value for key, value in kwargs.items() if key in names}
+                )
 
         cls.__init__ = __init__
         return cls
@@ -48,6 +139,7 @@ def nested_dataclass(*args, **kwargs):
 
 
 # A reusable url builder tailored for this wrapper
+# The clients build their URLs with the compiled endpoints of avwx_endpoints, it is kept for compatibility.
 def url_builder(
     url_modifier: str,
     base_url: str,
@@ -74,3 +166,135 @@ def url_builder(
                     value = "false"
             url = url + f'{arg}={str(value).replace(" ", "")}&'
     return url
+
+
+class _LazyField:
+    # Data descriptor shadowing the slot of a nested field on the lazy subclass.
+    # The nested dataclass is built from the kept payload on first access, then stored in the slot.
+    __slots__ = ("name", "slot", "convert", "default")
+
+    def __init__(self, name, slot, convert, default):
+        self.name = name
+        self.slot = slot
+        self.convert = convert
+        self.default = default
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, owner)
+        except AttributeError:
+            value = obj._lazy_payload.get(self.name)
+            value = self.default if value is None else self.convert(value)
+            self.slot.__set__(obj, value)
+            return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+def _lazy_converter(model: type, is_list: bool):
+    def convert_item(value):
+        if not isinstance(value, dict):
+            return value
+        return decode(model, value, lazy=True)
+
+    if not is_list:
+        return convert_item
+
+    def convert(value):
+        if type(value) is not list:
+            return value
+        return [convert_item(item) for item in value]
+
+    return convert
+
+
+_LAZY_CLASSES = {}
+_FIELD_SETS = {}
+
+
+def _lazy_class(cls):
+    lazy_cls = _LAZY_CLASSES.get(cls)
+    if lazy_cls is not None:
+        return lazy_cls
+    defaults = {
+        field.name: None if field.default is MISSING else field.default
+        for field in fields(cls)
+    }
+    namespace = {"__slots__": ("_lazy_payload",), "__qualname__": cls.__qualname__}
+    for field in fields(cls):
+        type_args = getattr(field.type, "__args__", None)
+        if is_dataclass(field.type):
+            convert = _lazy_converter(field.type, is_list=False)
+        elif field.type is datetime:
+            convert = parse_datetime
+        elif type_args and is_dataclass(type_args[0]):
+            convert = _lazy_converter(type_args[0], is_list=True)
+        else:
+            continue
+        namespace[field.name] = _LazyField(
+            field.name, cls.__dict__[field.name], convert, defaults[field.name]
+        )
+
+    def __reduce__(self):
+        # The lazy subclass can't be imported back, pickles rebuild it from the payload.
+        return decode, (cls, self._lazy_payload, True)
+
+    def __eq__(self, other):
+        # Lazy and eager instances of the same model compare by value.
+        if not isinstance(other, cls):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in defaults)
+
+    namespace["__reduce__"] = __reduce__
+    namespace["__eq__"] = __eq__
+    namespace["__hash__"] = None
+    lazy_cls = type(cls.__name__, (cls,), namespace)
+    lazy_cls.__lazy_fields__ = frozenset(
+        name for name, value in namespace.items() if isinstance(value, _LazyField)
+    )
+    lazy_cls.__field_defaults__ = defaults
+    _LAZY_CLASSES[cls] = lazy_cls
+    return lazy_cls
+
+
+def decode(cls, payload: dict, lazy: bool = False):
+    """Cast a JSON payload into a model.
+
+    In lazy mode, the payload is kept on the returned model and only the plain fields are set.
+    Nested dataclasses (``remarks_info``, ``runways``...) are built on first access, lazily as well,
+    and then cached on the model. The returned object is an instance of a subclass of ``cls``.
+    Models with a ``__post_init__`` and plain dataclasses are always built eagerly.
+    Keys unknown to a plain dataclass are dropped in both modes.
+
+    :param cls: The model to build
+    :param payload: JSON payload of the model
+    :type payload: dict
+    :param lazy: Build nested dataclasses on first access, defaults to False
+    :type lazy: bool, optional
+    :return: An instance of ``cls``
+    """
+    names = cls.__dict__.get("__projected_names__")
+    if names is not None and not payload.keys() <= names:
+        # Projections ignore the keys of the fields they leave out, e.g. ``meta``.
+        payload = {key: value for key, value in payload.items() if key in names}
+    if not hasattr(cls, "__decode_plan__"):
+        # Plain dataclasses drop the keys they don't know about, as their eager converter does.
+        known = _FIELD_SETS.get(cls)
+        if known is None:
+            known = _FIELD_SETS[cls] = frozenset(field_names(cls))
+        if not payload.keys() <= known:
+            payload = {key: value for key, value in payload.items() if key in known}
+        return cls(**payload)
+    if not lazy or hasattr(cls, "__post_init__"):
+        return cls(**payload)
+    lazy_cls = _lazy_class(cls)
+    obj = object.__new__(lazy_cls)
+    obj._lazy_payload = payload
+    lazy_fields = lazy_cls.__lazy_fields__
+    for name, default in lazy_cls.__field_defaults__.items():
+        if name not in lazy_fields:
+            setattr(obj, name, payload.get(name, default))
+    return obj
@@ -1,8 +1,17 @@
+import asyncio
+import json
+import pickle
+import threading
+import time
+
 import avwx
 import pytest
+import requests
 from dataclasses import asdict
+from datetime import datetime, timezone
 
 import pyavwx
+from pyavwx.models import columnar
 
 
 def cast_metar(icao):
@@ -41,3 +50,894 @@ def test_taf():
 
 def test_station():
     assert type(cast_station("LFPG")) == pyavwx.models.Station
+
+
+def test_response_cache_lru():
+    cache = pyavwx.ResponseCache(maxsize=2)
+    for station in ("LFPG", "EGLL", "KJFK"):
+        cache.set(cache.make_key("GET", station), "metar/", {"station": station})
+    assert cache.get(cache.make_key("GET", "LFPG")) is None
+    assert cache.get(cache.make_key("GET", "KJFK")) == {"station": "KJFK"}
+    assert cache.stats()["evictions"] == 1
+
+
+def multi_handler(request):
+    # Fake multi/ endpoint answering with one report per requested station
+    locations = request.url.split("/multi/metar/")[1].split("?")[0].split(",")
+    if "BAD1" in locations:
+        raise requests.ConnectionError("Connection reset")
+    return [{"station": location, "raw": f"{location} 121000Z"} for location in locations]
+
+
+def test_multiple_reports():
+    transport = pyavwx.FakeTransport(multi_handler)
+    client = pyavwx.AvwxApiClient("key", transport=transport)
+    reports = client.get_multiple_reports("metar", "LFPG,LFPO")
+    assert [report.station for report in reports] == ["LFPG", "LFPO"]
+    with pytest.raises(ValueError):
+        client.get_multiple_reports("notam", "LFPG")
+    with pytest.raises(ValueError):
+        client.get_bulk_reports("notam", ["LFPG"])
+    assert len(transport.requests) == 1
+
+
+def test_bulk_reports_chunk_failure():
+    transport = pyavwx.FakeTransport(multi_handler)
+    client = pyavwx.AvwxApiClient("key", transport=transport)
+    locations = [f"K{i:03d}" for i in range(15)] + ["BAD1"]
+    reports = client.get_bulk_reports("metar", locations)
+    assert len(transport.requests) == 2
+    assert reports["K000"].station == "K000"
+    assert isinstance(reports["K012"], requests.ConnectionError)
+    assert isinstance(reports["BAD1"], requests.ConnectionError)
+
+
+def test_async_bulk_reports_chunk_failure():
+    async def run():
+        transport = pyavwx.AsyncFakeTransport(multi_handler)
+        async with pyavwx.AsyncAvwxApiClient("key", transport=transport) as client:
+            locations = ["K000", "K001", "BAD1"] + [f"K{i:03d}" for i in range(2, 20)]
+            return await client.get_bulk_reports("metar", locations)
+
+    reports = asyncio.run(run())
+    assert isinstance(reports["BAD1"], requests.ConnectionError)
+    assert reports["K019"].station == "K019"
+
+
+METAR_PAYLOAD = {
+    "meta": {"timestamp": "2023-11-12T10:18:37Z", "stations_updated": "2023-10-28"},
+    "altimeter": {"repr": "Q1004", "value": 1004, "spoken": "one zero zero four"},
+    "clouds": [{"repr": "BKN003", "type": "BKN", "altitude": 3}],
+    "flight_rules": "LIFR",
+    "wind_speed": {"repr": "11", "value": 11, "spoken": "one one"},
+    "raw": "LFPG 121000Z 14011KT",
+    "station": "LFPG",
+    "time": {"repr": "121000Z", "dt": "2023-11-12T10:00:00Z"},
+}
+STATION_PAYLOAD = {"icao": "LFPG", "iata": "CDG", "name": "Charles de Gaulle", "latitude": 49.0, "longitude": 2.5}
+
+
+def test_pooled_session(monkeypatch):
+    session = pyavwx.avwx_requests_manager.create_session(pool_connections=2, pool_maxsize=4, pool_block=True)
+    adapter = session.get_adapter(pyavwx.const.BASE_URL)
+    assert adapter is session.get_adapter("http://avwx.rest/")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 4
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter._pool_connections == 2
+    assert session.headers["Connection"] == "keep-alive"
+    assert pyavwx.avwx_requests_manager.create_session(keep_alive=False).headers["Connection"] == "close"
+
+    sessions = []
+
+    def request(self, method, url, **kwargs):
+        sessions.append(self)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(METAR_PAYLOAD).encode()
+        return response
+
+    closed = []
+    monkeypatch.setattr(requests.Session, "request", request)
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+    with pyavwx.AvwxApiClient("key", pool_maxsize=20, coalesce=False) as client:
+        client.get_metar("LFPG")
+        client.get_taf("LFPG")
+        client.parse_metar("LFPG 121000Z")
+        assert client.session.get_adapter(pyavwx.const.BASE_URL).poolmanager.connection_pool_kw["maxsize"] == 20
+    # Every call went through the one pooled session, closed with the client
+    assert len(sessions) == 3 and all(used is client.session for used in sessions)
+    assert closed == [client.session]
+
+
+def test_station_cache():
+    transport = pyavwx.FakeTransport(lambda request: dict(STATION_PAYLOAD, meta={"stations_updated": "2023-10-28"}))
+    station_cache = pyavwx.StationCache(":memory:")
+    client = pyavwx.AvwxApiClient("key", transport=transport, station_cache=station_cache)
+    assert client.get_station("LFPG").name == "Charles de Gaulle"
+    assert client.get_station("LFPG").name == "Charles de Gaulle"
+    assert len(transport.requests) == 1
+    # A new station database on the API drops every cached station
+    station_cache.observe({"meta": {"stations_updated": "2023-11-30"}})
+    client.get_station("LFPG")
+    assert len(transport.requests) == 2
+
+
+def test_decode_plan():
+    metar = pyavwx.models.metar.Metar(**METAR_PAYLOAD)
+    plan = dict(pyavwx.models.metar.Metar.__decode_plan__)
+    # Only the fields holding nested dataclasses get a converter
+    assert "altimeter" in plan and "clouds" in plan and "raw" not in plan
+    assert metar.altimeter.value == 1004
+    assert metar.clouds[0].altitude == 3
+    assert metar.raw == "LFPG 121000Z 14011KT"
+
+
+def test_slotted_models():
+    metar = pyavwx.models.metar.Metar(**METAR_PAYLOAD)
+    assert not hasattr(metar, "__dict__")
+    # Keys unknown to a model are dropped instead of failing the whole report
+    payload = dict(METAR_PAYLOAD, unknown="x", altimeter={"repr": "Q1004", "value": 1004, "unknown": "x"})
+    metar = pyavwx.models.metar.Metar(**payload)
+    assert metar.altimeter.value == 1004
+    assert not hasattr(metar, "unknown") and not hasattr(metar.altimeter, "unknown")
+
+
+def test_lazy_decode():
+    Metar = pyavwx.models.metar.Metar
+    lazy = pyavwx.models.utils.decode(Metar, METAR_PAYLOAD, lazy=True)
+    eager = pyavwx.models.utils.decode(Metar, METAR_PAYLOAD)
+    assert isinstance(lazy, Metar)
+    assert lazy.altimeter is lazy.altimeter
+    assert lazy == eager
+    assert pickle.loads(pickle.dumps(lazy)) == eager
+
+    transport = pyavwx.FakeTransport(lambda request: METAR_PAYLOAD)
+    client = pyavwx.AvwxApiClient("key", transport=transport, lazy=True)
+    assert client.get_metar("LFPG").clouds[0].altitude == 3
+
+
+def test_decode_unknown_nested_keys():
+    Metar = pyavwx.models.metar.Metar
+    decode = pyavwx.models.utils.decode
+    # Fields the API adds later on are dropped at every level, lazy or not
+    payload = dict(
+        METAR_PAYLOAD,
+        wind_speed={"repr": "10", "value": 10, "spoken": "one zero", "extra": 1},
+        wx_codes=[{"repr": "RA", "value": "Rain", "extra": 1}],
+        remarks_info={"codes": [{"repr": "AO2", "value": "Automated", "extra": 1}]},
+    )
+    lazy = decode(Metar, payload, lazy=True)
+    eager = decode(Metar, payload)
+    assert lazy.wind_speed.value == eager.wind_speed.value == 10
+    assert lazy.wx_codes[0].repr == "RA"
+    assert lazy.remarks_info.codes[0].value == "Automated"
+    assert lazy == eager
+
+
+def test_json_decoder():
+    decoded = []
+
+    def decoder(body):
+        decoded.append(body)
+        return json.loads(body)
+
+    transport = pyavwx.FakeTransport(lambda request: METAR_PAYLOAD)
+    client = pyavwx.AvwxApiClient("key", transport=transport, json_decoder=decoder)
+    assert client.get_metar("LFPG").station == "LFPG"
+    assert len(decoded) == 1
+    assert pyavwx.avwx_requests_manager.get_json_decoder("json") is json.loads
+    with pytest.raises(ValueError):
+        pyavwx.avwx_requests_manager.get_json_decoder("yaml")
+
+
+def test_serializer():
+    metar = pyavwx.models.metar.Metar(**METAR_PAYLOAD)
+    as_dict = metar.to_dict()
+    assert as_dict["time"]["dt"] == "2023-11-12T10:00:00+00:00"
+    assert as_dict["clouds"][0]["altitude"] == 3
+    assert "remarks" in as_dict and "remarks" not in metar.to_dict(skip_none=True)
+    assert json.loads(metar.to_json()) == as_dict
+
+
+def test_parse_datetime():
+    parse_datetime = pyavwx.models.utils.parse_datetime
+    assert parse_datetime("2023-11-12T10:00:00Z") == datetime(2023, 11, 12, 10, tzinfo=timezone.utc)
+    # Naive values are UTC
+    assert parse_datetime("2023-11-12T10:00:00").tzinfo == timezone.utc
+    assert parse_datetime("2023-11-12T10:00:00+02:00").utcoffset().total_seconds() == 7200
+    assert parse_datetime("not a date") == "not a date"
+    assert parse_datetime(None) is None
+    metar = pyavwx.models.metar.Metar(**METAR_PAYLOAD)
+    assert metar.meta.timestamp == datetime(2023, 11, 12, 10, 18, 37, tzinfo=timezone.utc)
+
+
+def test_to_columns():
+    metar = pyavwx.models.metar.Metar(**METAR_PAYLOAD)
+    lazy = pyavwx.models.utils.decode(pyavwx.models.metar.Metar, METAR_PAYLOAD, lazy=True)
+    columns = columnar.to_columns([metar, lazy], ["station", "time.dt", "visibility.value"])
+    assert columns["station"] == ["LFPG", "LFPG"]
+    assert columns["time.dt"][1] == datetime(2023, 11, 12, 10, tzinfo=timezone.utc)
+    assert columns["visibility.value"] == [None, None]
+    # Empty batches give empty columns
+    assert columnar.to_columns([]) == {}
+    empty = columnar.to_columns([], model=pyavwx.models.metar.Metar)
+    assert list(empty) == list(columnar.DEFAULT_COLUMNS[pyavwx.models.metar.Metar])
+    assert not any(empty.values())
+
+
+INDEXED_STATIONS = [
+    pyavwx.models.Station(icao="LFPG", iata="CDG", latitude=49.0097, longitude=2.5479, type="large_airport", reporting=True),
+    pyavwx.models.Station(icao="LFPO", iata="ORY", latitude=48.7233, longitude=2.3794, type="large_airport", reporting=True),
+    pyavwx.models.Station(icao="LFPB", latitude=48.9694, longitude=2.4414, type="medium_airport", reporting=False),
+    pyavwx.models.Station(icao="EGLL", iata="LHR", latitude=51.4706, longitude=-0.4619, type="large_airport", reporting=True),
+    pyavwx.models.Station(icao="KJFK", iata="JFK", latitude=40.6398, longitude=-73.7789, type="large_airport", reporting=True),
+]
+
+
+def test_station_index_nearest():
+    index = pyavwx.StationIndex(INDEXED_STATIONS)
+    near = index.nearest(48.8566, 2.3522, n=3)
+    assert [result.station.icao for result in near] == ["LFPB", "LFPO", "LFPG"]
+    assert [result.station.icao for result in index.nearest(48.8566, 2.3522, n=2, reporting=True)] == ["LFPO", "LFPG"]
+    # Distances are great circle distances, coordinate_distance is their angle in degrees
+    assert near[2].nautical_miles == pytest.approx(12.0, abs=0.2)
+    assert near[2].coordinate_distance == pytest.approx(near[2].nautical_miles / 60, rel=1e-2)
+    assert [result.station.icao for result in index.within(48.8566, 2.3522, 50)] == ["LFPB", "LFPO", "LFPG"]
+    assert index.get("cdg").icao == "LFPG"
+
+    transport = pyavwx.FakeTransport(lambda request: [])
+    client = pyavwx.AvwxApiClient("key", transport=transport, station_index=index)
+    assert client.get_near_stations("48.8566,2.3522", n=1)[0].station.icao == "LFPB"
+    assert transport.requests == []
+
+
+def test_station_search():
+    search = pyavwx.StationSearch(
+        [
+            pyavwx.models.Station(icao="LFPG", iata="CDG", name="Charles de Gaulle", city="Paris", type="large_airport"),
+            pyavwx.models.Station(icao="LFPO", iata="ORY", name="Orly", city="Paris", type="large_airport"),
+            pyavwx.models.Station(icao="LFPB", name="Le Bourget", city="Paris", type="medium_airport"),
+        ]
+    )
+    assert [station.icao for station in search.search("paris")] == ["LFPG", "LFPO", "LFPB"]
+    assert [station.icao for station in search.search("char gau")] == ["LFPG"]
+    assert search.search("ory")[0].icao == "LFPO"
+    assert search.search("lyon") == []
+    # A station indexed again replaces the previous one
+    search.update([pyavwx.models.Station(icao="LFPO", iata="ORY", name="Orly", city="Villeneuve", type="large_airport")])
+    assert len(search) == 3
+    assert [station.icao for station in search.search("orly")] == ["LFPO"]
+    assert search.search("villeneuve")[0].city == "Villeneuve"
+    assert [station.icao for station in search.search("paris")] == ["LFPG", "LFPB"]
+
+
+def test_station_index_route():
+    index = pyavwx.StationIndex(INDEXED_STATIONS)
+    # Stations within the corridor come in route order, London is 190NM away from Paris
+    route = index.route("LFPO;EGLL", 20)
+    assert [station.icao for station in route.results] == ["LFPO", "LFPG", "LFPB", "EGLL"]
+    assert [waypoint.repr for waypoint in route.route] == ["LFPO", "EGLL"]
+    assert [station.icao for station in index.route("49.0097,2.5479;51.4706,-0.4619", 1).results] == ["LFPG", "EGLL"]
+    with pytest.raises(ValueError):
+        index.resolve_route("LFPG;PON")
+
+    # Routes the index can't resolve, e.g. with a navaid, are left to the API
+    transport = pyavwx.FakeTransport(lambda request: {"route": [], "results": []})
+    client = pyavwx.AvwxApiClient("key", transport=transport, station_index=index)
+    assert len(client.get_stations_route("LFPG;EGLL", 20).results) == 4
+    assert transport.requests == []
+    client.get_stations_route("LFPG;PON", 20)
+    assert len(transport.requests) == 1
+
+
+def test_single_flight():
+    release = threading.Event()
+
+    def handler(request):
+        release.wait(5)
+        return METAR_PAYLOAD
+
+    transport = pyavwx.FakeTransport(handler)
+    client = pyavwx.AvwxApiClient("key", transport=transport)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get_metar("LFPG"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 4 and all(metar.station == "LFPG" for metar in results)
+    assert len(transport.requests) == 1
+    assert len(client.single_flight) == 0
+
+
+def test_async_single_flight():
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        if "KJFK" in request.url:
+            raise requests.ConnectionError("down")
+        return METAR_PAYLOAD
+
+    async def run():
+        transport = pyavwx.AsyncFakeTransport(handler)
+        async with pyavwx.AsyncAvwxApiClient("key", transport=transport) as client:
+            metars = await asyncio.gather(*(client.get_metar("LFPG") for _ in range(5)))
+            assert all(metar.station == "LFPG" for metar in metars)
+            assert len(transport.requests) == 1
+            # Every waiter gets the exception of the call
+            errors = await asyncio.gather(*(client.get_metar("KJFK") for _ in range(3)), return_exceptions=True)
+            assert all(isinstance(error, requests.ConnectionError) for error in errors)
+            assert len(transport.requests) == 2
+
+    asyncio.run(run())
+
+
+def test_single_flight_deadline():
+    release = threading.Event()
+
+    def handler(request):
+        release.wait(5)
+        return METAR_PAYLOAD
+
+    transport = pyavwx.FakeTransport(handler)
+    client = pyavwx.AvwxApiClient("key", transport=transport)
+    leader = []
+    thread = threading.Thread(target=lambda: leader.append(client.get_metar("LFPG")))
+    thread.start()
+    time.sleep(0.1)
+    # A coalesced caller gives up at its own deadline, the call in flight goes on
+    start = time.monotonic()
+    with pytest.raises(pyavwx.avwx_exceptions.AvwxTimeout), pyavwx.deadline(0.1):
+        client.get_metar("LFPG")
+    assert time.monotonic() - start < 1
+    release.set()
+    thread.join()
+    assert leader[0].station == "LFPG" and len(transport.requests) == 1
+
+
+def test_async_single_flight_deadline():
+    async def handler(request):
+        await asyncio.sleep(0.3)
+        return METAR_PAYLOAD
+
+    async def waiter(client):
+        with pyavwx.deadline(0.05):
+            return await client.get_metar("LFPG")
+
+    async def run():
+        transport = pyavwx.AsyncFakeTransport(handler)
+        async with pyavwx.AsyncAvwxApiClient("key", transport=transport) as client:
+            leader, late = await asyncio.gather(client.get_metar("LFPG"), waiter(client), return_exceptions=True)
+            assert leader.station == "LFPG"
+            assert isinstance(late, pyavwx.avwx_exceptions.AvwxTimeout)
+            assert len(transport.requests) == 1
+
+    asyncio.run(run())
+
+
+def test_rate_limiter():
+    limiter = pyavwx.RateLimiter(per_second=10, burst=2)
+    assert limiter.reserve() == 0 and limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+    # The daily quota isn't topped up on the first day
+    limiter = pyavwx.RateLimiter(per_day=3)
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    assert limiter.reserve() == pytest.approx(86400, abs=1)
+
+
+def test_rate_limited_retry():
+    responses = [
+        pyavwx.ApiResponse(429, b'{"error": "Too Many Requests"}', {"Retry-After": "0.01"}),
+        pyavwx.ApiResponse(200, json.dumps(METAR_PAYLOAD).encode()),
+    ]
+    transport = pyavwx.FakeTransport(lambda request: responses.pop(0))
+    limiter = pyavwx.RateLimiter(max_retries=1)
+    client = pyavwx.AvwxApiClient("key", transport=transport, rate_limiter=limiter)
+    assert client.get_metar("LFPG").station == "LFPG"
+    assert len(transport.requests) == 2 and limiter.throttled == 1
+
+    transport = pyavwx.FakeTransport(lambda request: pyavwx.ApiResponse(429, b"{}", {"Retry-After": "0"}))
+    client = pyavwx.AvwxApiClient("key", transport=transport, rate_limiter=limiter)
+    with pytest.raises(pyavwx.avwx_exceptions.AvwxRateLimited) as error:
+        client.get_metar("LFPG")
+    assert error.value.retry_after == 0
+    assert len(transport.requests) == 2
+
+
+def test_retry_policy():
+    responses = [pyavwx.ApiResponse(503, b'{"error": "down"}'), requests.ConnectionError("reset")]
+
+    def handler(request):
+        if responses:
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        return METAR_PAYLOAD
+
+    transport = pyavwx.FakeTransport(handler)
+    client = pyavwx.AvwxApiClient("key", transport=transport, retry=pyavwx.RetryPolicy(backoff=0.001))
+    assert client.get_metar("LFPG").station == "LFPG"
+    assert len(transport.requests) == 3
+    # Errors of the request itself and non idempotent methods aren't retried
+    policy = pyavwx.RetryPolicy()
+    error = pyavwx.avwx_exceptions.AvwxBadStatus(status_code=404, body=b'{"error": "bad"}')
+    assert policy.delay("GET", 0, error) is None
+    assert policy.delay("POST", 0, requests.ConnectionError()) is None
+    assert policy.delay("GET", 3, requests.ConnectionError()) is None
+
+
+def test_deadline():
+    with pyavwx.deadline(5):
+        assert pyavwx.avwx_resilience.request_timeout(30) <= 5
+        with pyavwx.deadline(60):
+            # A nested deadline can't extend the one around it
+            assert pyavwx.avwx_resilience.remaining() <= 5
+    assert pyavwx.avwx_resilience.remaining() is None
+
+    transport = pyavwx.FakeTransport(lambda request: METAR_PAYLOAD)
+    client = pyavwx.AvwxApiClient("key", transport=transport)
+    with pyavwx.deadline(0):
+        with pytest.raises(pyavwx.avwx_exceptions.AvwxTimeout):
+            client.get_metar("LFPG")
+    assert transport.requests == []
+
+
+def failing_handler(request):
+    raise requests.ConnectionError("down")
+
+
+def test_circuit_breaker():
+    breaker = pyavwx.CircuitBreaker(window=2, min_calls=2, reset_timeout=0.05, serve_stale=False)
+    transport = pyavwx.FakeTransport(failing_handler)
+    client = pyavwx.AvwxApiClient("key", transport=transport, circuit_breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            client.get_metar("LFPG")
+    assert breaker.state == breaker.OPEN
+    with pytest.raises(pyavwx.avwx_exceptions.AvwxCircuitOpen):
+        client.get_metar("LFPG")
+    assert len(transport.requests) == 2
+    assert str(pyavwx.avwx_exceptions.AvwxCircuitOpen()) == "Circuit open, the API is not called"
+
+    # After reset_timeout, the trial request closes the circuit
+    time.sleep(0.06)
+    transport.handler = lambda request: METAR_PAYLOAD
+    assert client.get_metar("LFPG").station == "LFPG"
+    assert breaker.state == breaker.CLOSED
+
+
+def test_circuit_breaker_interrupted_trial():
+    breaker = pyavwx.CircuitBreaker(window=1, min_calls=1, reset_timeout=0.01)
+    breaker.record(False)
+    time.sleep(0.02)
+
+    def interrupted(request):
+        raise KeyboardInterrupt
+
+    transport = pyavwx.FakeTransport(interrupted)
+    client = pyavwx.AvwxApiClient("key", transport=transport, circuit_breaker=breaker)
+    with pytest.raises(KeyboardInterrupt):
+        client.get_metar("LFPG")
+    # The trial is given back instead of rejecting every later call
+    assert breaker.state == breaker.HALF_OPEN
+    transport.handler = lambda request: METAR_PAYLOAD
+    assert client.get_metar("LFPG").station == "LFPG"
+    assert breaker.state == breaker.CLOSED
+
+
+def test_async_circuit_breaker_cancelled_trial():
+    breaker = pyavwx.CircuitBreaker(window=1, min_calls=1, reset_timeout=0.01)
+    breaker.record(False)
+
+    async def run():
+        await asyncio.sleep(0.02)
+        hang = asyncio.Event()
+
+        async def handler(request):
+            if not hang.is_set():
+                hang.set()
+                await asyncio.sleep(60)
+            return METAR_PAYLOAD
+
+        transport = pyavwx.AsyncFakeTransport(handler)
+        async with pyavwx.AsyncAvwxApiClient(
+            "key", transport=transport, circuit_breaker=breaker, coalesce=False
+        ) as client:
+            trial = asyncio.ensure_future(client.get_metar("LFPG"))
+            await hang.wait()
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+            assert breaker.state == breaker.HALF_OPEN
+            assert (await client.get_metar("LFPG")).station == "LFPG"
+            assert breaker.state == breaker.CLOSED
+
+    asyncio.run(run())
+
+
+def watched_client(issued: dict):
+    # Client answering every station with a report issued at ``issued[station]``
+    def handler(request):
+        locations = request.url.split("/multi/metar/")[1].split("?")[0].split(",")
+        return [
+            {
+                "station": location,
+                "raw": f"{location} {issued[location]}",
+                "time": {"dt": datetime.fromtimestamp(issued[location], timezone.utc).isoformat()},
+            }
+            for location in locations
+        ]
+
+    transport = pyavwx.FakeTransport(handler)
+    return pyavwx.AvwxApiClient("key", transport=transport), transport
+
+
+HOUR = datetime(2023, 11, 12, 10, tzinfo=timezone.utc).timestamp()
+
+
+def test_watcher_schedule():
+    issued = {"LFPG": HOUR + 53 * 60}
+    client, transport = watched_client(issued)
+    watcher = pyavwx.StationWatcher(client, ["LFPG"])
+    assert len(watcher.poll(now=HOUR + 56 * 60)) == 1
+    # Polled again once the next routine report is out, not before
+    assert watcher.next_due() == issued["LFPG"] + 3600 + 120
+    assert watcher.poll(now=HOUR + 60 * 60) == []
+    assert len(transport.requests) == 1
+    # A late report is polled again with a backoff
+    assert watcher.poll(now=watcher.next_due()) == []
+    assert watcher.next_due() == issued["LFPG"] + 3600 + 120 + 60
+    issued["LFPG"] += 3600
+    assert len(watcher.poll(now=watcher.next_due())) == 1
+    assert watcher.next_due() == issued["LFPG"] + 3600 + 120
+    assert watcher.stats()["changed"] == 2
+
+
+def test_watcher_speci_anchor():
+    # The first report seen is a SPECI at 10:20, the routine ones come at :53
+    issued = {"LFPG": HOUR + 20 * 60}
+    client, transport = watched_client(issued)
+    watcher = pyavwx.StationWatcher(client, ["LFPG"])
+    watcher.poll(now=HOUR + 21 * 60)
+    assert watcher.next_due() == HOUR + 3600 + 22 * 60
+    issued["LFPG"] = HOUR + 53 * 60
+    assert len(watcher.poll(now=watcher.next_due())) == 1
+    # Off the cycle of the SPECI, whose next routine report is now late
+    assert watcher.next_due() == HOUR + 3600 + 23 * 60
+    issued["LFPG"] = HOUR + 3600 + 53 * 60
+    while not watcher.poll(now=watcher.next_due()):
+        pass
+    # One cycle after the previous off-cycle report, the :53 cycle is anchored on
+    assert watcher.next_due() == issued["LFPG"] + 3600 + 120
+
+
+def test_watcher_remove_add_back():
+    issued = {"LFPG": HOUR + 53 * 60, "LFPO": HOUR + 53 * 60}
+    client, transport = watched_client(issued)
+    watcher = pyavwx.StationWatcher(client, ["LFPG", "LFPO"])
+    watcher.remove(["LFPG"])
+    watcher.add(["LFPG"])
+    # The station added back is polled once, not once per time it was added
+    assert len(watcher.poll(now=HOUR + 56 * 60)) == 2
+    assert transport.requests[0].values["locations"].split(",").count("LFPG") == 1
+    assert watcher.stats()["fetched"] == 2
+
+
+def parse_handler(request):
+    if request.data == "BAD":
+        return pyavwx.ApiResponse(500, b'{"error": "cannot parse"}')
+    return {"raw": request.data, "station": request.data.split()[0]}
+
+
+def test_parse_many():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            active.append(request)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(request)
+        return parse_handler(request)
+
+    read = []
+
+    def reports():
+        for i in range(20):
+            read.append(i)
+            yield "BAD" if i == 5 else f"K{i:03} 121000Z"
+
+    client = pyavwx.AvwxApiClient("key", transport=pyavwx.FakeTransport(handler))
+    results = client.parse_many("metar", reports(), max_workers=2)
+    first = next(results)
+    # At most 2 * max_workers reports are read ahead
+    assert first.station == "K000" and len(read) == 4
+    results = [first, *results]
+    assert [getattr(result, "station", None) for result in results][4:7] == ["K004", None, "K006"]
+    assert isinstance(results[5], pyavwx.avwx_exceptions.AvwxBadStatus)
+    assert max(peak) <= 2
+
+
+def test_async_parse_many():
+    active = []
+    peak = []
+
+    async def handler(request):
+        active.append(request)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.remove(request)
+        return parse_handler(request)
+
+    read = []
+
+    def reports():
+        for i in range(20):
+            read.append(i)
+            yield "BAD" if i == 5 else f"K{i:03} 121000Z"
+
+    async def run():
+        async with pyavwx.AsyncAvwxApiClient("key", transport=pyavwx.AsyncFakeTransport(handler)) as client:
+            results = []
+            async for result in client.parse_many("metar", reports(), max_workers=2):
+                if not results:
+                    # Same window as the sync client
+                    assert len(read) == 4
+                results.append(result)
+        assert [getattr(result, "station", None) for result in results][4:7] == ["K004", None, "K006"]
+        assert isinstance(results[5], pyavwx.avwx_exceptions.AvwxBadStatus)
+        assert max(peak) <= 2
+
+    asyncio.run(run())
+
+
+def split(document: str, size: int) -> list[bytes]:
+    data = document.encode()
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_iter_json_array(size):
+    iter_json_array = pyavwx.avwx_stream.iter_json_array
+    assert list(iter_json_array(split("[10.5, -3, 1e5, 7]", size))) == [10.5, -3, 1e5, 7]
+    elements = [{"station": "LSZH", "name": "Zürich ✈"}, None, True, "Orléans", [1.25, {"a": []}]]
+    assert list(iter_json_array(split(json.dumps(elements, ensure_ascii=False), size))) == elements
+    document = '{"distance":25.5,"route":[1, 2],"results":[{"icao":"LFPG","elevation_ft":392}, -0.5, "Besançon"],"meta":null}'
+    assert list(iter_json_array(split(document, size), key="results")) == [
+        {"icao": "LFPG", "elevation_ft": 392},
+        -0.5,
+        "Besançon",
+    ]
+    assert list(iter_json_array(split('{"results": null, "meta": 1}', size), key="results")) == []
+    with pytest.raises(ValueError):
+        list(iter_json_array(split("[1, 2", size)))
+
+
+def test_aiter_json_array():
+    async def chunks():
+        for chunk in split('{"distance":25.5,"results":[10.5, -3, "Zürich"]}', 1):
+            yield chunk
+
+    async def run():
+        return [element async for element in pyavwx.avwx_stream.aiter_json_array(chunks(), key="results")]
+
+    assert asyncio.run(run()) == [10.5, -3, "Zürich"]
+
+
+def test_field_projection():
+    Metar = pyavwx.models.metar.Metar
+    transport = pyavwx.FakeTransport(lambda request: METAR_PAYLOAD)
+    client = pyavwx.AvwxApiClient("key", transport=transport)
+    metar = client.get_metar("LFPG", fields=[Metar.flight_rules, "altimeter"])
+    assert "filter=flight_rules,altimeter" in transport.requests[0].url
+    assert type(metar).__name__ == "MetarProjection"
+    assert metar.flight_rules == "LIFR" and metar.altimeter.value == 1004
+    assert not hasattr(metar, "raw")
+    assert pickle.loads(pickle.dumps(metar)) == metar
+    # Projections are built once per set of fields
+    assert type(client.get_metar("LFPG", fields=[Metar.flight_rules, "altimeter"])) is type(metar)
+    with pytest.raises(ValueError):
+        client.get_metar("LFPG", fields=["unknown"])
+    # Names of the filter merged with the fields are checked as well, a typo isn't dropped
+    metar = client.get_metar("LFPG", fields=[Metar.flight_rules], filter="raw, station")
+    assert "filter=flight_rules,raw,station" in transport.requests[-1].url and metar.raw == METAR_PAYLOAD["raw"]
+    with pytest.raises(ValueError):
+        client.get_metar("LFPG", fields=[Metar.flight_rules], filter="flight_rule")
+
+
+def test_access_profiler():
+    transport = pyavwx.FakeTransport(lambda request: METAR_PAYLOAD)
+    profiler = pyavwx.AccessProfiler(warmup=2, resample=3)
+    client = pyavwx.AvwxApiClient("key", transport=transport, profiler=profiler)
+    for _ in range(2):
+        tracked = client.get_metar("LFPG")
+        assert tracked.flight_rules == "LIFR"
+    assert all("filter=" not in request.url for request in transport.requests)
+    # Past the warm-up, only the fields read and the safety ones are requested
+    client.get_metar("LFPG")
+    assert "filter=flight_rules,raw,station,time" in transport.requests[-1].url
+    client.get_metar("LFPG")
+    client.get_metar("LFPG")
+    # One request in ``resample`` is fetched whole and tracked
+    assert "filter=" not in transport.requests[-1].url
+    report = profiler.report()[0]
+    assert report["endpoint"] == "metar" and report["calls"] == 5 and report["tracked"] == 3
+    assert "altimeter" in report["unused"] and "flight_rules" not in report["unused"]
+    assert profiler.bytes_saved >= 0
+    # Tracked reports pickle as the plain model
+    assert type(pickle.loads(pickle.dumps(tracked))) is pyavwx.models.metar.Metar
+    assert pickle.loads(pickle.dumps(tracked)) == tracked
+
+
+def test_access_profiler_threads():
+    profiler = pyavwx.AccessProfiler(warmup=0, resample=0)
+    response = pyavwx.ApiResponse(200, b"x" * 10)
+
+    def work():
+        for _ in range(500):
+            profiler.start("metar", pyavwx.models.metar.Metar).decode((response, {"station": "LFPG"}))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # No update of the counters is lost between threads
+    (site,) = profiler.report()
+    assert site["calls"] == 4000 and profiler._sites[("metar", None)].filtered_responses == 4000
+    assert site["filtered_bytes"] == 10
+
+
+def test_endpoint_urls():
+    from pyavwx.avwx_endpoints import ENDPOINTS
+
+    base = "https://avwx.rest/api/"
+    assert ENDPOINTS["metar"].url(base, location="KJFK") == base + "metar/KJFK"
+    url = ENDPOINTS["metar"].url(base, location="KJFK", options="info, translate", airport=False, reporting=True)
+    assert url == base + "metar/KJFK?options=info,translate&airport=false&reporting=true"
+    # Path and text values are URL-encoded, None and empty values are left out, 0 is sent
+    url = ENDPOINTS["stations_text"].url(base, text="Zürich Kloten&n=1", n=0, filter="")
+    assert url == base + "search/station?text=Z%C3%BCrich%20Kloten%26n%3D1&n=0"
+    assert ENDPOINTS["station"].url(base, ident="A/B C") == base + "station/A%2FB%20C"
+    assert ENDPOINTS["near_reports"].url(base, "near/", report_type="metar", coords="12.3,-4.5") == base + "metar/near/12.3,-4.5"
+    assert ENDPOINTS["parse_metar"].url(base, "custom/") == base + "custom/"
+    assert ENDPOINTS["parse_metar"].method == "POST"
+
+
+def test_transports():
+    with pytest.raises(TypeError):
+        pyavwx.avwx_transport.Transport()
+    closed = []
+
+    class RecordingTransport(pyavwx.FakeTransport):
+        def close(self):
+            closed.append(self)
+
+    transport = RecordingTransport(lambda request: METAR_PAYLOAD)
+    with pyavwx.AvwxApiClient("key", transport=transport) as client:
+        client.get_metar("LFPG")
+    # The API key of the client goes with the requests of a transport it was given
+    assert transport.requests[0].headers == {"Authorization": "key"}
+    assert closed == [transport]
+
+    sent = []
+
+    def request(method, url, **kwargs):
+        sent.append(kwargs)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(METAR_PAYLOAD).encode()
+        return response
+
+    session = requests.Session()
+    session.request = request
+    client = pyavwx.AvwxApiClient("key", transport=pyavwx.RequestsTransport(session=session))
+    assert client.get_metar("LFPG").station == "LFPG"
+    assert sent[0]["headers"] == {"Authorization": "key"}
+
+
+def test_async_aiohttp_session(monkeypatch):
+    aiohttp_web = pytest.importorskip("aiohttp.web")
+    seen = []
+
+    async def metar(request):
+        seen.append(request.headers.get("Authorization"))
+        return aiohttp_web.json_response(METAR_PAYLOAD)
+
+    async def station(request):
+        seen.append(request.headers.get("Authorization"))
+        return aiohttp_web.json_response(dict(STATION_PAYLOAD, meta={"stations_updated": "2023-10-28"}))
+
+    async def search(request):
+        # Sent in small chunks, so the array is parsed as it streams in
+        response = aiohttp_web.StreamResponse()
+        await response.prepare(request)
+        body = json.dumps([STATION_PAYLOAD, dict(STATION_PAYLOAD, icao="LFPO")]).encode()
+        for i in range(0, len(body), 16):
+            await response.write(body[i : i + 16])
+        await response.write_eof()
+        return response
+
+    async def bad(request):
+        return aiohttp_web.json_response({"error": "Station does not exist"}, status=404)
+
+    async def run():
+        app = aiohttp_web.Application()
+        app.router.add_get("/metar/LFPG", metar)
+        app.router.add_get("/metar/XXXX", bad)
+        app.router.add_get("/station/LFPG", station)
+        app.router.add_get("/search/station", search)
+        runner = aiohttp_web.AppRunner(app)
+        await runner.setup()
+        site = aiohttp_web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        monkeypatch.setattr(pyavwx.const, "BASE_URL", f"http://127.0.0.1:{port}/")
+        try:
+            client = pyavwx.AsyncAvwxApiClient("key", station_cache=pyavwx.StationCache(":memory:"))
+            # The session is only created inside the event loop, on the first request
+            assert client.session is None
+            assert (await client.get_metar("LFPG")).station == "LFPG"
+            session = client.session
+            assert (await client.get_metar("LFPG")).station == "LFPG"
+            assert client.session is session
+            with pytest.raises(pyavwx.avwx_exceptions.AvwxBadStatus):
+                await client.get_metar("XXXX")
+            # Station lookups are served from the station cache the second time
+            assert (await client.get_station("LFPG")).name == "Charles de Gaulle"
+            assert (await client.get_station("LFPG")).name == "Charles de Gaulle"
+            assert [station.icao async for station in client.iter_stations_text("paris")] == ["LFPG", "LFPO"]
+            assert seen == ["key", "key", "key"]
+            await client.close()
+            assert session.closed and client.session is None
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+
+def test_async_transports():
+    closed = []
+
+    class RecordingTransport(pyavwx.AsyncFakeTransport):
+        async def close(self):
+            closed.append(self)
+
+    async def run():
+        transport = RecordingTransport(lambda request: METAR_PAYLOAD)
+        async with pyavwx.AsyncAvwxApiClient("key", transport=transport) as client:
+            await client.get_metar("LFPG")
+        assert transport.requests[0].headers == {"Authorization": "key"}
+        assert closed == [transport]
+
+    asyncio.run(run())
+
+
+def test_sans_io_protocol():
+    request = pyavwx.build_request("metar", location="LFPG", filter="flight_rules,station")
+    assert request.method == "GET" and request.url.endswith("/metar/LFPG?filter=flight_rules,station")
+    metar = pyavwx.parse_response(request, pyavwx.ApiResponse(200, json.dumps(METAR_PAYLOAD).encode()))
+    assert metar.station == "LFPG"
+    request = pyavwx.build_request("multi", report_type="metar", locations="LFPG, XXXX")
+    reports = pyavwx.parse_response(request, pyavwx.ApiResponse(200, json.dumps([METAR_PAYLOAD, {"error": "not found"}]).encode()))
+    assert reports["LFPG"].station == "LFPG"
+    assert isinstance(reports["XXXX"], pyavwx.avwx_exceptions.AvwxReportError)
+    with pytest.raises(pyavwx.avwx_exceptions.AvwxBadStatus):
+        pyavwx.parse_response(request, pyavwx.ApiResponse(503, b'{"error": "down"}'))
+    with pytest.raises(ValueError):
+        pyavwx.build_request("near_reports", report_type="bogus", coords="1,2")
+
+    # The clients build their requests with the same layer
+    transport = pyavwx.FakeTransport(lambda request: [METAR_PAYLOAD] if request.endpoint == "reports_text" else METAR_PAYLOAD)
+    client = pyavwx.AvwxApiClient("key", transport=transport)
+    assert client.parse_metar("LFPG 121000Z").station == "LFPG"
+    assert transport.requests[-1].endpoint == "parse_metar" and transport.requests[-1].data == "LFPG 121000Z"
+    assert transport.requests[-1].method == "POST"
+    assert client.get_reports_text("metar", "paris")[0].station == "LFPG"
+    assert transport.requests[-1].model is pyavwx.models.metar.Metar